@@ -0,0 +1,157 @@
+// Chat renderer for the main window's web view.
+//
+// Math is typeset with the bundled KaTeX, and every rendered fragment is
+// cached by its source so formulas repeated while a reply streams in (or
+// across replies) are not typeset again.  Only the newest MAX_LIVE messages
+// stay in the DOM; older ones are detached and re-attached in batches when
+// the user scrolls to the top, so long sessions stay responsive.
+(function () {
+    var MAX_LIVE = 60;
+    var RESTORE_BATCH = 20;
+    var CACHE_LIMIT = 500;
+    var MATH = /\$\$([\s\S]+?)\$\$|\\\[([\s\S]+?)\\\]|\\\(([\s\S]+?)\\\)|\$([^$\n]+?)\$/g;
+
+    var cache = new Map();
+    var messages = new Map();
+    var detached = [];
+    var dirty = new Set();
+    var scheduled = false;
+    var hits = 0;
+    var misses = 0;
+
+    function container() {
+        return document.getElementById('chat-container');
+    }
+
+    function escapeHtml(text) {
+        return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+    }
+
+    function renderMath(source, display) {
+        var key = (display ? 'D' : 'I') + source;
+        var html = cache.get(key);
+        if (html !== undefined) {
+            // Refresh LRU position
+            cache.delete(key);
+            cache.set(key, html);
+            hits++;
+            return html;
+        }
+        misses++;
+        if (window.katex) {
+            html = katex.renderToString(source, {displayMode: display, throwOnError: false});
+        } else {
+            html = escapeHtml(display ? '$$' + source + '$$' : '$' + source + '$');
+        }
+        cache.set(key, html);
+        if (cache.size > CACHE_LIMIT) {
+            cache.delete(cache.keys().next().value);
+        }
+        return html;
+    }
+
+    function renderText(text) {
+        var html = '';
+        var last = 0;
+        var match;
+        MATH.lastIndex = 0;
+        while ((match = MATH.exec(text)) !== null) {
+            html += escapeHtml(text.slice(last, match.index));
+            if (match[1] !== undefined) html += renderMath(match[1], true);
+            else if (match[2] !== undefined) html += renderMath(match[2], true);
+            else if (match[3] !== undefined) html += renderMath(match[3], false);
+            else html += renderMath(match[4], false);
+            last = MATH.lastIndex;
+        }
+        return html + escapeHtml(text.slice(last));
+    }
+
+    function nearBottom() {
+        return window.innerHeight + window.scrollY >= document.body.scrollHeight - 40;
+    }
+
+    function render(node) {
+        node.querySelector('.text').innerHTML = renderText(node.source);
+    }
+
+    function flush() {
+        scheduled = false;
+        var stick = nearBottom();
+        dirty.forEach(render);
+        dirty.clear();
+        if (stick) window.scrollTo(0, document.body.scrollHeight);
+    }
+
+    function schedule(node) {
+        dirty.add(node);
+        if (!scheduled) {
+            scheduled = true;
+            window.requestAnimationFrame(flush);
+        }
+    }
+
+    function makeMessage(className, label) {
+        var node = document.createElement('div');
+        node.className = 'message ' + className;
+        node.innerHTML = '<strong>' + label + ':</strong> <span class="text"></span>';
+        node.source = '';
+        return node;
+    }
+
+    function trim() {
+        var root = container();
+        while (root.children.length > MAX_LIVE) {
+            detached.push(root.removeChild(root.firstChild));
+        }
+    }
+
+    function restore() {
+        var root = container();
+        var before = document.body.scrollHeight;
+        var fragment = document.createDocumentFragment();
+        detached.splice(Math.max(0, detached.length - RESTORE_BATCH)).forEach(function (node) {
+            fragment.appendChild(node);
+        });
+        root.insertBefore(fragment, root.firstChild);
+        // Keep the message the user was looking at in place
+        window.scrollTo(0, window.scrollY + document.body.scrollHeight - before);
+    }
+
+    window.addEventListener('scroll', function () {
+        if (window.scrollY < 40 && detached.length) restore();
+    });
+
+    window.chat = {
+        addExchange: function (id, userText) {
+            var stick = nearBottom();
+            var user = makeMessage('user-message', 'You');
+            user.querySelector('.text').textContent = userText;
+            var ai = makeMessage('ai-message', 'AI');
+            ai.id = id;
+            messages.set(id, ai);
+            container().appendChild(user);
+            container().appendChild(ai);
+            trim();
+            if (stick) window.scrollTo(0, document.body.scrollHeight);
+        },
+        append: function (id, text) {
+            var node = messages.get(id);
+            if (!text) return;
+            node.source += text;
+            schedule(node);
+        },
+        finish: function (id) {
+            var node = messages.get(id);
+            var stick = nearBottom();
+            dirty.delete(node);
+            render(node);
+            // Finished replies never change again, so stop tracking them by id
+            messages.delete(id);
+            if (stick) window.scrollTo(0, document.body.scrollHeight);
+        },
+        stats: function () {
+            return {cached: cache.size, hits: hits, misses: misses,
+                    live: container().children.length, detached: detached.length};
+        }
+    };
+})();
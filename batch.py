@@ -0,0 +1,175 @@
+"""Submit many chat questions at once, e.g. a teacher's homework list.
+
+Prompts are answered concurrently through a shared `ChatClient`, at most
+`concurrency` upstream calls at a time.  Identical prompts (after
+`normalize_prompt`) that are in flight together share one upstream call,
+a 429 with Retry-After pauses every worker (see `ChatClient._request`), and
+results are written as JSON lines in completion order:
+
+    python batch.py questions.txt --concurrency 8 > answers.jsonl
+    python batch.py --mock --sweep 1,2,4,8,16 questions.txt
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from chat_client import ChatClient, ChatError, load_config
+from response_cache import ResponseCache, normalize_prompt
+
+
+def read_prompts(path):
+    """One prompt per non-blank line; `.jsonl` files may hold strings or {"prompt": ...} objects."""
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    with f:
+        lines = [line.strip() for line in f if line.strip()]
+    if path.endswith(".jsonl"):
+        items = [json.loads(line) for line in lines]
+        return [item if isinstance(item, str) else item["prompt"] for item in items]
+    return lines
+
+
+async def run_batch(prompts, client, concurrency=8, instruction="", cache=None, on_result=None, **params):
+    """Answer `prompts` and return one result dict per prompt, in input order.
+
+    Each result has index, prompt, response, error, seconds and source
+    ("upstream", "coalesced" or "cache").  `on_result` is called with each
+    result as soon as it is ready.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    # asyncio's default executor may have fewer threads than `concurrency`
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch")
+    loop = asyncio.get_running_loop()
+    in_flight = {}
+    results = [None] * len(prompts)
+    model, sampling = client.config["model"], dict(client.config["params"], **params)
+
+    async def upstream(prompt):
+        async with semaphore:
+            messages = [{"role": "user", "content": prompt}]
+            if instruction:
+                messages.insert(0, {"role": "system", "content": instruction})
+            response = await loop.run_in_executor(executor, partial(client.complete, messages, **params))
+        if cache is not None:
+            cache.put(prompt, model, sampling, response, instruction)
+        return response
+
+    async def answer(index, prompt):
+        started = time.perf_counter()
+        response = error = None
+        key = normalize_prompt(prompt)
+        cached = cache.get(prompt, model, sampling, instruction) if cache is not None else None
+        if cached is not None:
+            response, source = cached, "cache"
+        else:
+            task = in_flight.get(key)
+            source = "coalesced" if task is not None else "upstream"
+            if task is None:
+                task = in_flight[key] = asyncio.ensure_future(upstream(prompt))
+                task.add_done_callback(lambda _, key=key: in_flight.pop(key, None))
+            try:
+                # shield: one waiter being cancelled must not cancel the shared call
+                response = await asyncio.shield(task)
+            except ChatError as e:
+                error = str(e)
+        result = {"index": index, "prompt": prompt, "response": response, "error": error,
+                  "seconds": time.perf_counter() - started, "source": source}
+        results[index] = result
+        if on_result is not None:
+            on_result(result)
+
+    try:
+        await asyncio.gather(*(answer(index, prompt) for index, prompt in enumerate(prompts)))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def make_client(url=None, concurrency=8):
+    """A dedicated client whose pool keeps one idle connection per worker."""
+    config = load_config()
+    if url:
+        config["url"] = url
+    config["pool_size"] = max(config["pool_size"], concurrency)
+    return ChatClient(config)
+
+
+def throughput(prompts, url=None, levels=(1, 2, 4, 8, 16), **params):
+    """Answer `prompts` once per concurrency level and return a report row for each."""
+    rows = []
+    for concurrency in levels:
+        client = make_client(url, concurrency)
+        started = time.perf_counter()
+        results = asyncio.run(run_batch(prompts, client, concurrency, **params))
+        elapsed = time.perf_counter() - started
+        stats = client.stats()
+        client.close()
+        rows.append({
+            "concurrency": concurrency,
+            "prompts": len(prompts),
+            "errors": sum(result["error"] is not None for result in results),
+            "upstream_requests": stats["requests"],
+            "coalesced": sum(result["source"] == "coalesced" for result in results),
+            "rate_limited": stats["rate_limited"],
+            "seconds": elapsed,
+            "prompts_per_second": len(prompts) / elapsed if elapsed else 0.0,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Answer a file of questions concurrently, writing JSONL")
+    parser.add_argument("prompts", nargs="?", help="file with one question per line ('-' for stdin)")
+    parser.add_argument("--prompt", action="append", default=[], help="a question (repeatable)")
+    parser.add_argument("--concurrency", type=int, default=8, help="maximum simultaneous upstream calls")
+    parser.add_argument("--output", default="-", help="JSONL output file (default stdout)")
+    parser.add_argument("--instruction", default="", help="system message sent with every question")
+    parser.add_argument("--cache", help="ResponseCache SQLite file to read and fill")
+    parser.add_argument("--url", help="chat completions endpoint (overrides the config)")
+    parser.add_argument("--mock", action="store_true", help="answer from an in-process mock endpoint")
+    parser.add_argument("--latency", type=float, default=0.05, help="mock endpoint latency in seconds")
+    parser.add_argument("--sweep", help="comma-separated concurrency levels; prints a throughput report")
+    args = parser.parse_args()
+
+    prompts = (read_prompts(args.prompts) if args.prompts else []) + args.prompt
+    if not prompts:
+        parser.error("no prompts given")
+    url = args.url
+    if args.mock:
+        from mock_server import MockChatServer
+        url = MockChatServer(latency=args.latency).start().url
+
+    if args.sweep:
+        levels = [int(level) for level in args.sweep.split(",")]
+        rows = throughput(prompts, url, levels, instruction=args.instruction)
+        print(f"{'concurrency':>11}  {'prompts/s':>9}  {'seconds':>8}  {'upstream':>8}  {'coalesced':>9}  errors")
+        for row in rows:
+            print(f"{row['concurrency']:11d}  {row['prompts_per_second']:9.1f}  {row['seconds']:8.2f}  "
+                  f"{row['upstream_requests']:8d}  {row['coalesced']:9d}  {row['errors']}")
+        return
+
+    client = make_client(url, args.concurrency)
+    cache = ResponseCache(args.cache) if args.cache else None
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    def write(result):
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        out.flush()
+
+    try:
+        results = asyncio.run(run_batch(prompts, client, args.concurrency, args.instruction, cache, write))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if cache is not None:
+            cache.close()
+        client.close()
+    failed = sum(result["error"] is not None for result in results)
+    print(f"{len(results)} answered, {failed} failed; {client.stats()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
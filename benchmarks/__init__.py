@@ -0,0 +1 @@
+"""Headless benchmark suite; run with `python -m benchmarks.run`."""
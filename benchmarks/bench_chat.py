@@ -0,0 +1,93 @@
+"""Chat round trips against the local mock endpoint: latency, streaming and batch throughput.
+
+The router cases use in-process fake providers, so they measure routing
+and failover overhead rather than HTTP.
+"""
+import time
+from functools import partial
+
+import batch
+from chat_client import ChatClient, load_config
+from mock_server import MockChatServer
+from providers import FakeProvider, Router
+
+from .harness import metrics, timed
+
+MESSAGES = [{"role": "user", "content": "What does F = ma mean?"}]
+
+
+def _client(url, pool_size=4):
+    config = load_config()
+    config.update(url=url, pool_size=pool_size, api_key="")
+    return ChatClient(config)
+
+
+def _percentiles(latencies):
+    latencies = sorted(latencies)
+    return {
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def _round_trips(url, count):
+    client = _client(url)
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        client.complete(MESSAGES)
+        latencies.append(time.perf_counter() - started)
+    stats = client.stats()
+    client.close()
+    return dict(_percentiles(latencies), requests=count, connections_opened=stats["connections_opened"])
+
+
+def _streams(url, count):
+    client = _client(url)
+    first, total = [], []
+    for _ in range(count):
+        started = time.perf_counter()
+        for index, _ in enumerate(client.stream(MESSAGES)):
+            if index == 0:
+                first.append(time.perf_counter() - started)
+        total.append(time.perf_counter() - started)
+    client.close()
+    return {
+        "first_token_p50_ms": _percentiles(first)["p50_ms"],
+        "complete_p50_ms": _percentiles(total)["p50_ms"],
+    }
+
+
+def _throughput(url, concurrency, prompts):
+    row = batch.throughput(prompts, url, [concurrency])[0]
+    return {key: row[key] for key in ("prompts_per_second", "seconds", "upstream_requests", "errors")}
+
+
+def _routed(count, fail_every):
+    """Round trips through a `Router` whose preferred provider fails every `fail_every`th request."""
+    router = Router({"flaky": FakeProvider(fail_every=fail_every), "backup": FakeProvider(latency=0.001)},
+                    routing="failover")
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        router.complete(MESSAGES)
+        latencies.append(time.perf_counter() - started)
+    stats = router.stats()
+    return dict(_percentiles(latencies), requests=count, failovers=stats["failovers"],
+                backup_requests=stats["providers"]["backup"]["successes"])
+
+
+def cases(quick):
+    server = MockChatServer(latency=0.0, token_delay=0.0).start()
+    slow = MockChatServer(latency=0.02).start()
+    count = 50 if quick else 500
+    yield metrics("chat_round_trip", lambda: _round_trips(server.url, count), latency_ms=0)
+    yield metrics("chat_stream", lambda: _streams(server.url, count // 5), latency_ms=0)
+    yield timed("chat_router", partial(Router({"fake": FakeProvider()}).complete, MESSAGES))
+    yield timed("chat_router", partial(FakeProvider().complete, MESSAGES), direct=True)
+    yield metrics("chat_failover", lambda: _routed(count, 10), fail_every=10)
+    prompts = [f"Question {i}" for i in range(40 if quick else 200)]
+    for concurrency in ([1, 8] if quick else [1, 2, 4, 8, 16, 32]):
+        yield metrics("chat_batch", lambda c=concurrency: _throughput(slow.url, c, prompts),
+                      latency_ms=20, concurrency=concurrency)
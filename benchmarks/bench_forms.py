@@ -0,0 +1,77 @@
+"""Topic switching in the main window: latency and widgets created per switch.
+
+Runs on Qt's offscreen platform, so no display is needed.
+"""
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEvent, QObject
+from PyQt6.QtWidgets import QApplication
+
+from .harness import metrics
+
+
+class _ChildCounter(QObject):
+    """Counts widgets added to any parent, i.e. widgets constructed by the switch."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.ChildAdded and event.child().isWidgetType():
+            self.count += 1
+        return False
+
+
+def _switches(rounds):
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["DOTMINI_CHAT_CACHE"] = os.path.join(directory, "cache.sqlite3")
+        import main
+        window = main.DotminiENGLab()
+        combo = window.physics_topic
+        topics = list(range(1, combo.count()))
+        # First visit pays for imports (physics_engine, numpy) and is not what we measure
+        for index in topics:
+            combo.setCurrentIndex(index)
+        app.processEvents()
+        # Selecting Calculus starts the SymPy workers in the background; let that finish first
+        main.get_pool()
+
+        counter = _ChildCounter()
+        app.installEventFilter(counter)
+        tracemalloc.start()
+        latencies = []
+        for _ in range(rounds):
+            for index in topics:
+                started = time.perf_counter()
+                combo.setCurrentIndex(index)
+                # Deferred deletes and layout run here, so they count toward the switch
+                app.processEvents()
+                latencies.append(time.perf_counter() - started)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        app.removeEventFilter(counter)
+        window.close()
+        app.processEvents()
+
+    latencies.sort()
+    return {
+        "switches": len(latencies),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "widgets_per_switch": counter.count / len(latencies),
+        "python_peak_kb": peak / 1024,
+    }
+
+
+def cases(quick):
+    rounds = 5 if quick else 50
+    yield metrics("topic_switch", lambda: _switches(rounds), rounds=rounds)
@@ -0,0 +1,38 @@
+"""Topic formulas: scalar GUI calculations, solving for an input, and batch sweeps by size."""
+import numpy as np
+
+import physics_engine
+from units import Quantity
+
+from .harness import timed
+
+SIZES = [10 ** 2, 10 ** 4, 10 ** 6]
+QUICK_SIZES = [10 ** 2, 10 ** 4]
+
+
+def cases(quick):
+    for name, formula in physics_engine.FORMULAS.items():
+        values = {key: "2.5" for key in formula.inputs}
+        yield timed("calculate", lambda name=name, values=values: physics_engine.calculate(name, **values),
+                    formula=name)
+        # Solve for the first input from the output and the remaining inputs
+        unknown = next(iter(formula.inputs))
+        solve_values = {key: "2.5" for key in physics_engine.units(formula) if key != unknown}
+        physics_engine.calculate(name, **solve_values)
+        yield timed("solve", lambda name=name, values=solve_values: physics_engine.calculate(name, **values),
+                    formula=name, unknown=unknown)
+
+    rng = np.random.default_rng(0)
+    for size in QUICK_SIZES if quick else SIZES:
+        mass, velocity = rng.uniform(1, 100, size), rng.uniform(0, 50, size)
+        yield timed("evaluate", lambda m=mass, v=velocity: physics_engine.evaluate(
+            "kinetic_energy", mass=m, velocity=v), formula="kinetic_energy", size=size)
+        yield timed("evaluate_units", lambda m=mass, v=velocity: physics_engine.evaluate(
+            "kinetic_energy", mass=Quantity(m, "g"), velocity=Quantity(v, "km/h")),
+            formula="kinetic_energy", size=size)
+        yield timed("raw_numpy", lambda m=mass, v=velocity: 0.5 * m * v ** 2, formula="kinetic_energy", size=size)
+
+    for side in ([10, 100] if quick else [10, 100, 1000]):
+        axis = np.linspace(1, 10, side)
+        yield timed("sweep", lambda axis=axis: physics_engine.sweep("force", mass=axis, acceleration=axis),
+                    formula="force", size=side * side)
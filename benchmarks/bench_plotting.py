@@ -0,0 +1,37 @@
+"""Plot data generation and projectile simulation as the amount of work grows."""
+import numpy as np
+
+import trajectory
+from plotting import CurveSampler, adaptive_sample, minmax_decimate
+
+from .harness import timed
+
+
+def _zoom_session(function, steps=10):
+    # A fresh sampler zoomed in step by step, as the plot panel does on scroll
+    sampler = CurveSampler(function)
+    for step in range(steps):
+        half = 10 / 1.5 ** step
+        sampler.view(-half, half, 800)
+
+
+def cases(quick):
+    smooth = np.sin
+    spiky = lambda x: np.tan(x) + np.sin(40 * x)
+    for label, function in (("smooth", smooth), ("spiky", spiky)):
+        yield timed("adaptive_sample", lambda f=function: adaptive_sample(f, -10, 10), curve=label)
+        yield timed("zoom_session", lambda f=function: _zoom_session(f), curve=label)
+
+    rng = np.random.default_rng(0)
+    for size in ([10 ** 4, 10 ** 5] if quick else [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]):
+        x = np.linspace(0, 1, size)
+        y = rng.standard_normal(size)
+        yield timed("minmax_decimate", lambda x=x, y=y: minmax_decimate(x, y, 800), size=size)
+
+    yield timed("projectile_single", lambda: trajectory.simulate(20, 45, method="adaptive", record=False),
+                method="adaptive")
+    yield timed("projectile_path", lambda: trajectory.simulate(20, 45, method="rk4", dt=0.006), method="rk4")
+    for side in ([10, 30] if quick else [10, 30, 100]):
+        angles, speeds = np.linspace(5, 85, side), np.linspace(5, 50, side)
+        yield timed("projectile_sweep", lambda a=angles, s=speeds: trajectory.sweep(a, s, drag=0.01),
+                    size=side * side)
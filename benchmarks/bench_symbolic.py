@@ -0,0 +1,57 @@
+"""Symbolic pipeline over a corpus of expressions of increasing complexity."""
+import numpy as np
+
+import calculus
+import symbolic
+from sandbox import SymbolicPool
+
+from .harness import metrics, timed
+
+# Ordered from trivial to deeply nested compositions
+CORPUS = [
+    "x**2 + 2*x + 1",
+    "sin(x)*exp(-x**2)",
+    "log(1 + x**2)/(1 + cos(x)**2)",
+    "tanh(sin(x**3)*exp(cos(x))) + sqrt(1 + x**4)*atan(x)",
+    "exp(sin(exp(cos(x**2))))*log(2 + sin(x*exp(x)))/(1 + x**2)**3",
+]
+
+
+def _cold(expression):
+    symbolic.clear()
+    symbolic.derivative(expression, "x")
+    symbolic.numeric(expression, "x", order=1)
+
+
+def _sandbox_round_trips(count=50):
+    import time
+
+    pool = SymbolicPool(workers=1)
+    try:
+        pool.submit("derivative", "x**2").result()
+        latencies = []
+        for i in range(count):
+            started = time.perf_counter()
+            pool.submit("derivative", f"x**{i + 2}*sin(x)", "x").result()
+            latencies.append(time.perf_counter() - started)
+    finally:
+        pool.close()
+    latencies.sort()
+    return {"p50_ms": latencies[len(latencies) // 2] * 1000, "max_ms": latencies[-1] * 1000}
+
+
+def cases(quick):
+    x = np.linspace(-5, 5, 10 ** 5)
+    for level, expression in enumerate(CORPUS[:3] if quick else CORPUS, start=1):
+        yield timed("derivative_cold", lambda e=expression: _cold(e), level=level)
+        symbolic.derivative(expression, "x")
+        yield timed("derivative_cached", lambda e=expression: symbolic.derivative(e, "x"), level=level)
+        yield timed("evaluate_1e5", lambda e=expression: symbolic.evaluate(e, "x", x, order=1), level=level)
+    for level, expression in enumerate(CORPUS[:3] if quick else CORPUS, start=1):
+        function = symbolic.numeric(expression, "x")
+        for bounds in (1, 1000) if quick else (1, 100, 10000):
+            upper = np.linspace(0.5, 5, bounds)
+            yield timed("integrate_numeric", lambda f=function, b=upper: calculus.integrate(f, 0.0, b),
+                        level=level, bounds=bounds)
+        yield timed("roots_numeric", lambda f=function: calculus.find_roots(f, -5, 5), level=level)
+    yield metrics("sandbox_round_trip", lambda: _sandbox_round_trips(10 if quick else 50))
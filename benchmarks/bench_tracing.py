@@ -0,0 +1,43 @@
+"""Cost of a tracing span when tracing is off and on, against the bare block."""
+import tracing
+
+from .harness import timed
+
+# Spans per timed call, so the loop overhead is shared out
+SPANS = 1000
+
+
+def _bare():
+    for _ in range(SPANS):
+        pass
+
+
+def _spans(on):
+    def run():
+        previous = tracing.enabled
+        tracing.enable(on)
+        try:
+            for _ in range(SPANS):
+                with tracing.span("bench", n=1):
+                    pass
+        finally:
+            tracing.enable(previous)
+    return run
+
+
+def _begin_end():
+    previous = tracing.enabled
+    tracing.enable()
+    try:
+        for _ in range(SPANS):
+            tracing.end(tracing.begin("bench"))
+    finally:
+        tracing.enable(previous)
+
+
+def cases(quick):
+    yield timed("tracing_bare", _bare, spans=SPANS)
+    yield timed("tracing_span", _spans(False), spans=SPANS, enabled=False)
+    yield timed("tracing_span", _spans(True), spans=SPANS, enabled=True)
+    yield timed("tracing_begin_end", _begin_end, spans=SPANS, enabled=True)
+    tracing.clear()
@@ -0,0 +1,102 @@
+"""Timing, result records and comparison shared by the benchmark modules.
+
+Each benchmark module exposes `cases(quick)`, yielding `Case`s.  A "timed"
+case's function is called repeatedly and reported per call; a "metrics"
+case's function runs once and returns its own measurements (throughput,
+latency percentiles), which are recorded as-is.
+"""
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+Case = namedtuple("Case", "name params function kind")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def timed(name, function, **params):
+    return Case(name, params, function, "timed")
+
+
+def metrics(name, function, **params):
+    return Case(name, params, function, "metrics")
+
+
+def measure(function, repeat=7, min_time=0.05):
+    """Time `function`, calibrating loops so each of `repeat` runs takes at least `min_time` seconds."""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    samples = []
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(loops):
+                function()
+            samples.append((time.perf_counter() - started) / loops)
+    finally:
+        if enabled:
+            gc.enable()
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "max_s": max(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def environment():
+    """What the numbers depend on: commit, interpreter, library versions and machine."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    versions = {}
+    for module in ("numpy", "sympy", "matplotlib"):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        **versions,
+    }
+
+
+def key(record):
+    return f"{record['name']} {json.dumps(record['params'], sort_keys=True)}"
+
+
+def compare(baseline, current, threshold=0.10):
+    """Pair timed results by name and params; returns rows of (key, before, after, ratio, regressed)."""
+    before = {key(record): record for record in baseline["results"] if "median_s" in record}
+    rows = []
+    for record in current["results"]:
+        old = before.get(key(record))
+        if old is None or "median_s" not in record:
+            continue
+        ratio = record["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+        rows.append((key(record), old["median_s"], record["median_s"], ratio, ratio > 1 + threshold))
+    return rows
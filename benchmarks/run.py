@@ -0,0 +1,79 @@
+"""Run the headless benchmark suite and write JSON results, or compare two result files.
+
+    python -m benchmarks.run --output before.json
+    python -m benchmarks.run --output after.json --only formulas,symbolic
+    python -m benchmarks.run --compare before.json after.json --threshold 0.1
+
+No display or network is needed: chat cases talk to `mock_server` and the
+forms cases use Qt's offscreen platform.  The compare mode exits with
+status 1 when any timed case got slower by more than the threshold, so it
+can gate a commit.
+"""
+import argparse
+import importlib
+import json
+import sys
+
+from .harness import compare, environment, measure
+
+MODULES = ["formulas", "symbolic", "plotting", "chat", "tracing", "forms"]
+
+
+def run(modules=MODULES, quick=False, pattern=None, log=sys.stderr):
+    """Run the selected benchmark modules and return the results document."""
+    results = []
+    for module_name in modules:
+        module = importlib.import_module(f"benchmarks.bench_{module_name}")
+        for case in module.cases(quick):
+            if pattern and pattern not in case.name:
+                continue
+            if case.kind == "timed":
+                values = measure(case.function, repeat=3 if quick else 7, min_time=0.01 if quick else 0.05)
+            else:
+                values = case.function()
+            record = {"group": module_name, "name": case.name, "params": case.params, **values}
+            results.append(record)
+            if log is not None:
+                summary = (f"{values['median_s'] * 1e6:12.1f} us" if case.kind == "timed"
+                           else ", ".join(f"{k}={v:.3g}" if isinstance(v, float) else f"{k}={v}"
+                                          for k, v in values.items()))
+                log.write(f"{module_name:9} {case.name:20} {json.dumps(case.params):45} {summary}\n")
+                log.flush()
+    return {"environment": environment(), "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenGenPhysX benchmark suite")
+    parser.add_argument("--output", help="write results JSON here (default stdout)")
+    parser.add_argument("--only", help=f"comma-separated groups from {','.join(MODULES)}")
+    parser.add_argument("--filter", help="only cases whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="smaller sizes and fewer repeats")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare two result files")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before flagging")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        rows = compare(baseline, current, args.threshold)
+        for name, before, after, ratio, regressed in rows:
+            flag = "REGRESSION" if regressed else ""
+            print(f"{name:70} {before * 1e6:12.1f} -> {after * 1e6:12.1f} us  {ratio:6.2f}x  {flag}")
+        regressions = sum(row[4] for row in rows)
+        print(f"{len(rows)} cases compared, {regressions} slower by more than {args.threshold:.0%}")
+        sys.exit(1 if regressions else 0)
+
+    modules = args.only.split(",") if args.only else MODULES
+    document = run(modules, args.quick, args.filter)
+    text = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,557 @@
+"""Integrals, limits, Taylor series and roots for the Calculus topic.
+
+Every query is first tried in closed form by `symbolic` inside the sandbox
+under a short time budget.  When SymPy times out or finds no answer, the
+query is re-run with numerical methods on the lambdified function:
+
+- `integrate`: adaptive 7/15-point Gauss-Kronrod quadrature, vectorized over
+  every subinterval of every pair of bounds at once;
+- `find_roots`: sign changes on a grid, each refined by Brent's method;
+- `numeric_limit`: one-sided sequences with Richardson extrapolation;
+- `taylor_coefficients`: Cauchy-integral coefficients from an FFT on a
+  circle around the point.
+
+`CalculusEngine` caches each result together with the method that produced
+it.  An expression whose closed form failed once goes straight to the
+numerical path for later queries of the same kind.
+
+    get_engine().submit("integral", "exp(-x^2)", "x", "0", "1, 2, 3").result().text
+"""
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
+
+import numpy as np
+
+Result = namedtuple("Result", "operation value text method")
+
+# Operation names with their display labels
+OPERATIONS = {"derivative": "Derivative", "integral": "Integral", "limit": "Limit",
+              "series": "Taylor series", "roots": "Roots"}
+# Seconds a closed-form attempt may take before the numerical fallback runs
+SYMBOLIC_BUDGET = 2.0
+# Results kept by CalculusEngine
+CACHE_SIZE = 512
+DEFAULT_SERIES_ORDER = 6
+# Search interval for roots when no bounds are given
+DEFAULT_ROOT_BOUNDS = ("-10", "10")
+# Grid points scanned for sign changes by find_roots
+ROOT_SAMPLES = 2001
+
+# Kronrod nodes on [0, 1] (the rest are mirrored) with their weights; the
+# 7-point Gauss rule uses every other node, so one evaluation gives both rules
+_XK = np.array([0.991455371120812639, 0.949107912342758525, 0.864864423359769073, 0.741531185599394440,
+                0.586087235467691130, 0.405845151377397167, 0.207784955007898468, 0.0])
+_WK = np.array([0.022935322010529225, 0.063092092629978553, 0.104790010322250184, 0.140653259715525919,
+                0.169004726639267903, 0.190350578064785410, 0.204432940075298892, 0.209482141084727828])
+_WG = np.array([0.0, 0.129484966168869693, 0.0, 0.279705391489276668,
+                0.0, 0.381830050505118945, 0.0, 0.417959183673469388])
+NODES = np.concatenate([-_XK[:-1], _XK[::-1]])
+KRONROD_WEIGHTS = np.concatenate([_WK[:-1], _WK[::-1]])
+GAUSS_WEIGHTS = np.concatenate([_WG[:-1], _WG[::-1]])
+
+
+def _mapped(function, t, kind, offset):
+    """Integrand in the variable t that maps infinite ranges onto finite ones."""
+    with np.errstate(all="ignore"):
+        x = np.select([kind == 1, kind == 2, kind == 3], [offset + t / (1 - t), offset - t / (1 - t),
+                                                           t / (1 - t * t)], t)
+        jacobian = np.select([kind == 3, kind > 0], [(1 + t * t) / (1 - t * t) ** 2, 1 / (1 - t) ** 2], 1.0)
+        return np.broadcast_to(np.asarray(function(x), dtype=float), x.shape) * jacobian
+
+
+def integrate(function, lower, upper, rtol=1e-9, atol=1e-12, max_rounds=64, max_intervals=1_000_000):
+    """Definite integrals of vectorized `function` for arrays of bounds.
+
+    `lower` and `upper` broadcast; returns (values, errors) of their shape.
+    Each round evaluates the 15 nodes of every unfinished subinterval in one
+    call.  An integral is finished once its summed Kronrod-Gauss error is
+    within tolerance.  Until then, subintervals over their share of the
+    tolerance are halved.  Infinite bounds are mapped onto finite intervals
+    first.  Integrals that are not finite or do not converge come back as nan.
+
+    With one lower bound and many upper bounds (an antiderivative sampled
+    for a plot), only the pieces between neighbouring sorted bounds are
+    integrated and then summed, so overlapping ranges aren't integrated again.
+    """
+    lower, upper = np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+    options = dict(rtol=rtol, atol=atol, max_rounds=max_rounds, max_intervals=max_intervals)
+    if lower.size == 1 and upper.size > 2:
+        return _cumulative(function, lower.item(), upper, options)
+    return _integrate(function, lower, upper, **options)
+
+
+def _cumulative(function, lower, upper, options):
+    grid, positions = np.unique(np.append(upper.ravel(), lower), return_inverse=True)
+    pieces, piece_errors = _integrate(function, grid[:-1], grid[1:], **options)
+    # Sum outwards from the lower bound, so a divergent piece only spoils the bounds beyond it
+    start = positions[-1]
+    values, errors = np.zeros(grid.size), np.zeros(grid.size)
+    values[start + 1:], errors[start + 1:] = np.cumsum(pieces[start:]), np.cumsum(piece_errors[start:])
+    values[:start] = -np.cumsum(pieces[:start][::-1])[::-1]
+    errors[:start] = np.cumsum(piece_errors[:start][::-1])[::-1]
+    return values[positions[:-1]].reshape(upper.shape), errors[positions[:-1]].reshape(upper.shape)
+
+
+def _integrate(function, lower, upper, rtol, atol, max_rounds, max_intervals):
+    lower, upper = np.broadcast_arrays(lower, upper)
+    shape = lower.shape
+    a, b = lower.ravel(), upper.ravel()
+    sign = np.where(a > b, -1.0, 1.0)
+    a, b = np.minimum(a, b), np.maximum(a, b)
+    # 1 is [a, oo), 2 is (-oo, b] and 3 is (-oo, oo)
+    kind = np.where(np.isinf(b), 1, 0) + np.where(np.isinf(a), 2, 0)
+    start = np.where(kind == 0, a, np.where(kind == 3, -1.0, 0.0))
+    stop = np.where(kind == 0, b, 1.0)
+    offset = np.where(kind == 1, a, np.where(kind == 2, b, 0.0))
+    width = stop - start
+
+    totals = np.zeros(a.size)
+    errors = np.zeros(a.size)
+    tolerance = None
+    owner = np.nonzero(width > 0)[0]
+    left, right = start[owner], stop[owner]
+    for round_ in range(max_rounds):
+        if not owner.size:
+            break
+        mid, half = (left + right) / 2, (right - left) / 2
+        y = _mapped(function, mid[:, None] + half[:, None] * NODES, kind[owner, None], offset[owner, None])
+        kronrod = half * (y @ KRONROD_WEIGHTS)
+        error = np.abs(kronrod - half * (y @ GAUSS_WEIGHTS))
+        if tolerance is None:
+            tolerance = np.zeros(a.size)
+            tolerance[owner] = np.maximum(atol, rtol * np.abs(kronrod))
+        pending = np.bincount(owner, weights=error, minlength=a.size)
+        finished = (errors + pending <= tolerance) | ~np.isfinite(totals + pending)
+        done = (finished[owner] | (error <= tolerance[owner] * 2 * half / width[owner])
+                | ~np.isfinite(kronrod))
+        np.add.at(totals, owner[done], kronrod[done])
+        np.add.at(errors, owner[done], error[done])
+        split = ~done
+        if round_ == max_rounds - 1 or 2 * split.sum() > max_intervals:
+            np.add.at(totals, owner[split], kronrod[split])
+            np.add.at(errors, owner[split], error[split])
+            break
+        owner = np.repeat(owner[split], 2)
+        left = np.column_stack([left[split], mid[split]]).ravel()
+        right = np.column_stack([mid[split], right[split]]).ravel()
+
+    converged = np.isfinite(totals) & (errors <= 100 * np.maximum(atol, rtol * np.abs(totals)))
+    values = np.where(converged, sign * totals, np.nan)
+    return values.reshape(shape), errors.reshape(shape)
+
+
+def brent(function, a, b, xtol=1e-12, max_iterations=100):
+    """Root of scalar `function` in [a, b], whose ends must differ in sign, by Brent's method."""
+    fa, fb = function(a), function(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa * fb > 0:
+        raise ValueError("The function has the same sign at both ends of the interval")
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iterations):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2 * np.finfo(float).eps * abs(b) + xtol / 2
+        m = (c - b) / 2
+        if abs(m) <= tol or fb == 0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p, q = 2 * m * s, 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = function(b)
+    return b
+
+
+def find_roots(function, lower, upper, samples=ROOT_SAMPLES):
+    """Sorted roots of vectorized `function` in [lower, upper].
+
+    Roots are found where the sign changes between grid points, so roots
+    that only touch zero (like x**2 at 0) are missed unless a grid point
+    lands on them.  A sign change across a pole converges to the pole,
+    where the function is large, and is discarded.
+    """
+    x = np.linspace(lower, upper, samples)
+    with np.errstate(all="ignore"):
+        y = np.broadcast_to(np.asarray(function(x), dtype=float), x.shape)
+
+    def scalar(value):
+        with np.errstate(all="ignore"):
+            return float(function(np.float64(value)))
+
+    roots = [float(root) for root in x[y == 0]]
+    finite = np.isfinite(y[:-1]) & np.isfinite(y[1:])
+    for i in np.nonzero(finite & (np.sign(y[:-1]) * np.sign(y[1:]) < 0))[0]:
+        root = brent(scalar, x[i], x[i + 1])
+        if abs(scalar(root)) <= 1e-6 * (abs(y[i]) + abs(y[i + 1])):
+            roots.append(float(root))
+    roots.sort()
+    return [root for i, root in enumerate(roots) if i == 0 or root - roots[i - 1] > 1e-9 * (1 + abs(root))]
+
+
+def _one_sided(function, point, side):
+    """Limit from one side, taken from where successive estimates agree best."""
+    steps = 10.0 ** -np.arange(1, 13)
+    x = side / steps if np.isinf(point) else point + side * steps
+    with np.errstate(all="ignore"):
+        values = np.broadcast_to(np.asarray(function(x), dtype=float), x.shape)
+    if np.all(np.isfinite(values[-4:])) and abs(values[-1]) > 1e10 and np.all(np.diff(np.abs(values[-4:])) > 0):
+        return np.copysign(np.inf, values[-1])
+    # Richardson extrapolation for an error linear in the step
+    extrapolated = (10 * values[1:] - values[:-1]) / 9
+    best, best_change = np.nan, np.inf
+    for sequence in (values, extrapolated):
+        change = np.abs(np.diff(sequence))
+        if np.any(np.isfinite(change)):
+            i = np.nanargmin(change)
+            if change[i] < best_change:
+                best, best_change = sequence[i + 1], change[i]
+    if not best_change <= 1e-6 * max(1.0, abs(best)):
+        raise ValueError("The limit could not be determined numerically (the function does not settle)")
+    return float(best)
+
+
+def numeric_limit(function, point, direction="+-"):
+    """Limit of vectorized `function` at `point` from the right ("+"), left ("-") or both."""
+    if np.isinf(point):
+        sides = [np.sign(point)]
+    else:
+        sides = {"+": [1.0], "-": [-1.0], "+-": [1.0, -1.0]}[direction]
+    estimates = [_one_sided(function, point, side) for side in sides]
+    if len(estimates) == 2 and not (estimates[0] == estimates[1]
+                                    or np.isclose(estimates[0], estimates[1], rtol=1e-5, atol=1e-8)):
+        raise ValueError(f"The limit does not exist (left {estimates[1]:.6g}, right {estimates[0]:.6g})")
+    return estimates[0]
+
+
+def taylor_coefficients(function, point, order):
+    """The first `order` Taylor coefficients of vectorized `function` about `point`.
+
+    Uses the Cauchy integral formula: samples on a circle in the complex
+    plane, FFT, divide by radius**k.  Circles shrink until two successive
+    radii agree, which fails when the function is not analytic at `point`.
+    """
+    points = max(64, 4 * order)
+    k = np.arange(order)
+    circle = np.exp(2j * np.pi * np.arange(points) / points)
+    previous = None
+    for radius in (1.0, 0.5, 0.25, 0.125, 0.0625):
+        z = point + radius * circle
+        with np.errstate(all="ignore"):
+            values = np.broadcast_to(np.asarray(function(z), dtype=complex), z.shape)
+            coefficients = (np.fft.fft(values) / points)[:order] / radius ** k
+        if previous is not None and np.allclose(coefficients, previous, rtol=1e-6, atol=1e-9):
+            return coefficients.real
+        previous = coefficients
+    raise ValueError("No Taylor series found numerically (the function is not smooth at that point)")
+
+
+def _format(value):
+    if np.isinf(value):
+        return "∞" if value > 0 else "-∞"
+    return f"{value:.10g}"
+
+
+def _polynomial(coefficients, name, point):
+    base = name if point == 0 else f"({name} {'-' if point > 0 else '+'} {abs(point):.10g})"
+    cutoff = 1e-12 * max(1.0, np.max(np.abs(coefficients)))
+    terms = []
+    for k, c in enumerate(coefficients):
+        if abs(c) <= cutoff:
+            continue
+        power = "" if k == 0 else base if k == 1 else f"{base}**{k}"
+        coefficient = f"{c:.10g}"
+        if not power:
+            terms.append(coefficient)
+        elif coefficient in ("1", "-1"):
+            terms.append(coefficient[:-1] + power)
+        else:
+            terms.append(f"{coefficient}*{power}")
+    return " + ".join(terms).replace("+ -", "- ") or "0"
+
+
+def _number(expression):
+    """(value, text) for a closed-form number, or None when it isn't a real number."""
+    try:
+        value = float(expression)
+    except TypeError:
+        return None
+    if expression.is_Integer or expression.is_Float or np.isinf(value):
+        return value, _format(value) if np.isinf(value) else str(expression)
+    return value, f"{expression} ≈ {_format(value)}"
+
+
+def _bounds(text):
+    import symbolic
+    try:
+        return np.array([float(symbolic.parse(part)) for part in text.split(",")])
+    except TypeError:
+        raise ValueError(f"Bounds must be numbers, got {text!r}")
+
+
+def _point(text):
+    (value,) = _bounds(text)
+    return value
+
+
+def _is_batch(*bounds):
+    return any(isinstance(bound, str) and "," in bound for bound in bounds)
+
+
+def _symbolic_integral(expression, name, lower=None, upper=None):
+    import symbolic
+    if _is_batch(lower, upper):
+        return None
+    result = symbolic.integral(expression, name, lower, upper)
+    if result is None:
+        return None
+    if lower is None:
+        return str(result), f"{result} + C"
+    return _number(result)
+
+
+def _symbolic_limit(expression, name, point, direction="+-"):
+    import symbolic
+    result = symbolic.limit(expression, name, point, direction)
+    return None if result is None else _number(result)
+
+
+def _symbolic_series(expression, name, point="0", order=DEFAULT_SERIES_ORDER):
+    import symbolic
+    result = str(symbolic.series(expression, name, point, order))
+    return result, result
+
+
+def _symbolic_roots(expression, name, lower, upper):
+    import symbolic
+    roots = symbolic.roots(expression, name, lower, upper)
+    if roots is None:
+        return None
+    numbers = [_number(root) for root in roots]
+    return [value for value, _ in numbers], ", ".join(text for _, text in numbers) or f"none in [{lower}, {upper}]"
+
+
+def _numeric_integral(expression, name, lower=None, upper=None):
+    import symbolic
+    if lower is None:
+        return None, "no closed form found; Plot Graph shows it integrated numerically from 0"
+    function = symbolic.numeric(expression, name)
+    a, b = _bounds(lower), _bounds(upper)
+    try:
+        values, errors = integrate(function, a, b)
+    except ValueError:
+        raise ValueError("Give one lower bound or as many lower bounds as upper bounds")
+    texts = ["diverges or did not converge" if np.isnan(value) else f"≈ {_format(value)} (± {error:.1g})"
+             for value, error in zip(values, errors)]
+    if values.size == 1:
+        return float(values[0]), texts[0]
+    a, b = np.broadcast_arrays(a, b)
+    return values, "; ".join(f"[{lo:g}, {hi:g}] {text}" for lo, hi, text in zip(a, b, texts))
+
+
+def _numeric_limit(expression, name, point, direction="+-"):
+    import symbolic
+    value = numeric_limit(symbolic.numeric(expression, name), _point(point), direction)
+    return value, _format(value) if np.isinf(value) else f"≈ {_format(value)}"
+
+
+def _numeric_series(expression, name, point="0", order=DEFAULT_SERIES_ORDER):
+    import symbolic
+    center = _point(point)
+    if not np.isfinite(center):
+        raise ValueError("A numerical Taylor series needs a finite point")
+    result = _polynomial(taylor_coefficients(symbolic.numeric(expression, name), center, order), name, center)
+    return result, f"≈ {result}"
+
+
+def _numeric_roots(expression, name, lower, upper):
+    import symbolic
+    a, b = _point(lower), _point(upper)
+    if not (np.isfinite(a) and np.isfinite(b)):
+        raise ValueError("Root finding needs finite bounds")
+    roots = find_roots(symbolic.numeric(expression, name), a, b)
+    return roots, ", ".join(f"≈ {_format(root)}" for root in roots) or f"none found in [{a:g}, {b:g}]"
+
+
+SYMBOLIC = {"integral": _symbolic_integral, "limit": _symbolic_limit,
+            "series": _symbolic_series, "roots": _symbolic_roots}
+NUMERIC = {"integral": _numeric_integral, "limit": _numeric_limit,
+           "series": _numeric_series, "roots": _numeric_roots}
+
+
+def compute(method, operation, expression, variable, *args):
+    """Run one query in this process (a sandbox worker).
+
+    Returns (value, text), or None when `method` is "symbolic" and no closed
+    form was found.
+    """
+    import symbolic
+    names = symbolic.canonical_variables(variable)
+    if operation == "derivative":
+        result = str(symbolic.derivative(expression, names, *args))
+        return result, result
+    if len(names) != 1:
+        raise ValueError("Integrals, limits, series and roots take a single variable.")
+    return (SYMBOLIC if method == "symbolic" else NUMERIC)[operation](expression, names[0], *args)
+
+
+def arguments(operation, lower="", upper="", order=""):
+    """Job arguments for `operation` from the Calculus form's text fields.
+
+    `lower` is the point for limits and series; a trailing "+" or "-" on a
+    limit point picks one side.  Bounds may be comma-separated lists,
+    which integrate every pair in one batch.
+    """
+    lower, upper, order = lower.strip(), upper.strip(), order.strip()
+    if order and not order.isdigit():
+        raise ValueError("Order must be a whole number.")
+    if operation == "derivative":
+        return (int(order or 1),)
+    if operation == "integral":
+        if bool(lower) != bool(upper):
+            raise ValueError("Enter both bounds for a definite integral, or neither.")
+        return (lower, upper) if lower else ()
+    if operation == "limit":
+        if not lower:
+            raise ValueError("Enter the point the limit is taken at.")
+        if lower[-1] in "+-" and len(lower) > 1:
+            return lower[:-1], lower[-1]
+        return lower, "+-"
+    if operation == "series":
+        return lower or "0", int(order or DEFAULT_SERIES_ORDER)
+    if operation == "roots":
+        return lower or DEFAULT_ROOT_BOUNDS[0], upper or DEFAULT_ROOT_BOUNDS[1]
+    raise ValueError(f"Unknown operation {operation!r}; expected one of {', '.join(OPERATIONS)}.")
+
+
+class CalculusEngine:
+    """Runs queries on a `SymbolicPool`, closed form first, and caches the results."""
+
+    def __init__(self, pool=None, budget=SYMBOLIC_BUDGET, cache_size=CACHE_SIZE):
+        # None uses the process-wide pool from `sandbox.get_pool`
+        self.pool = pool
+        self.budget = budget
+        self.cache_size = cache_size
+        self._results = OrderedDict()
+        # (operation, expression, variable) whose closed form timed out or wasn't found
+        self._numeric_only = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    def submit(self, operation, expression, variable="x", *args):
+        """Return a Future for the `Result` of `operation`; cached results are already done.
+
+        `args` are as returned by `arguments`.  The future raises ValueError
+        for invalid input and `sandbox.SandboxError` when even the numerical
+        method fails in its worker.
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation {operation!r}; expected one of {', '.join(OPERATIONS)}.")
+        key = (operation, " ".join(expression.replace("^", "**").split()), " ".join(variable.split()), args)
+        future = Future()
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+                numeric_only = key[:3] in self._numeric_only
+        if result is not None:
+            future.set_result(result)
+        elif operation == "derivative":
+            self._attempt(future, key, ["symbolic"])
+        elif numeric_only or _is_batch(*args[:2]):
+            self._attempt(future, key, ["numeric"])
+        else:
+            self._attempt(future, key, ["symbolic", "numeric"])
+        return future
+
+    def _attempt(self, future, key, methods):
+        from sandbox import SandboxError, get_pool
+        method, rest = methods[0], methods[1:]
+        operation, expression, variable, args = key
+        try:
+            job = (self.pool or get_pool()).submit(
+                "calculus", method, operation, expression, variable, *args,
+                timeout=self.budget if rest else None,
+            )
+        except RuntimeError as e:
+            future.set_exception(SandboxError(str(e)))
+            return
+        job.add_done_callback(lambda job: self._finished(future, key, method, rest, job))
+
+    def _finished(self, future, key, method, rest, job):
+        from sandbox import SandboxError
+        try:
+            answer = job.result()
+        except SandboxError as e:
+            if not rest:
+                future.set_exception(e)
+                return
+            answer = None
+        except Exception as e:
+            future.set_exception(e)
+            return
+        if answer is None:
+            with self._lock:
+                self._numeric_only.add(key[:3])
+                self.fallbacks += 1
+            self._attempt(future, key, rest)
+            return
+        result = Result(key[0], answer[0], answer[1], method)
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        future.set_result(result)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "fallbacks": self.fallbacks,
+                    "cached": len(self._results), "numeric_only": len(self._numeric_only)}
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self._numeric_only.clear()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the process-wide `CalculusEngine`, which uses `sandbox.get_pool`."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = CalculusEngine()
+        return _engine
@@ -0,0 +1,354 @@
+"""Shared, connection-pooled client for the OpenTyphoon chat completions API.
+
+main.py, app.py and requests.py all talk to the same endpoint through
+`get_client()`, so the TCP/TLS handshake is paid once per pooled connection
+instead of once per message.  Endpoint, key, model and sampling parameters
+come from the environment or a JSON config file rather than being inlined.
+"""
+import http.client
+import json
+import os
+import random
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+
+import tracing
+
+DEFAULT_CONFIG = {
+    "url": "https://api.opentyphoon.ai/v1/chat/completions",
+    "api_key": "",
+    "model": "typhoon-v1.5x-70b-instruct",
+    "timeout": 60.0,
+    "retries": 3,
+    "backoff": 0.5,
+    "pool_size": 4,
+    "params": {
+        "max_tokens": 512,
+        "temperature": 0.96,
+        "top_p": 0.9,
+        "top_k": 0,
+        "repetition_penalty": 1.05,
+        "min_p": 0,
+    },
+}
+
+# Environment variables override the config file, which overrides the defaults
+ENV_VARS = {
+    "url": "OPENTYPHOON_URL",
+    "api_key": "OPENTYPHOON_API_KEY",
+    "model": "OPENTYPHOON_MODEL",
+    "timeout": "DOTMINI_CHAT_TIMEOUT",
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class ChatError(Exception):
+    """Raised when the chat endpoint cannot produce a response."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class ChatCancelled(Exception):
+    """Raised inside `ChatClient.stream` when the caller cancels."""
+
+
+class CancelToken:
+    """Cancels a `ChatClient.stream` from another thread, interrupting a blocked read."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def is_set(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+        with self._lock:
+            conn = self._conn
+        if conn is not None and conn.sock is not None:
+            try:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def attach(self, conn):
+        with self._lock:
+            self._conn = conn
+        if self._event.is_set():
+            self.cancel()
+
+    def detach(self):
+        with self._lock:
+            self._conn = None
+
+
+def _content(data, key):
+    """`choices[0][key]["content"]` of a response or stream chunk; ChatError if it is malformed."""
+    try:
+        choices = data.get("choices") or [{}]
+        return (choices[0].get(key) or {}).get("content") or ""
+    except (AttributeError, IndexError, TypeError):
+        raise ChatError(f"Invalid response from AI: unexpected shape {str(data)[:200]}") from None
+
+
+def load_config(path=None):
+    """Build the client config from defaults, an optional JSON file and the environment."""
+    config = dict(DEFAULT_CONFIG, params=dict(DEFAULT_CONFIG["params"]))
+    path = path or os.environ.get("DOTMINI_CHAT_CONFIG", "chat_config.json")
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            overrides = json.load(f)
+        config["params"].update(overrides.pop("params", {}))
+        config.update(overrides)
+    for key, var in ENV_VARS.items():
+        if os.environ.get(var):
+            value = os.environ[var]
+            config[key] = type(DEFAULT_CONFIG[key])(value)
+    return config
+
+
+class ConnectionPool:
+    """Keeps idle HTTP/1.1 keep-alive connections to a single host for reuse."""
+
+    def __init__(self, scheme, host, port, maxsize=4):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self._idle = []
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context() if scheme == "https" else None
+        self.opened = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, timeout):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+            if conn is not None:
+                self.reused += 1
+            else:
+                self.opened += 1
+        if conn is None:
+            if self.scheme == "https":
+                conn = http.client.HTTPSConnection(
+                    self.host, self.port, timeout=timeout, context=self._ssl_context
+                )
+            else:
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        else:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        return conn
+
+    def release(self, conn, reusable=True):
+        """Return `conn` to the pool, or close it if the response was not fully consumed."""
+        with self._lock:
+            if reusable and len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+            self.discarded += 1
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class ChatClient:
+    """Thread-safe chat completions client with keep-alive pooling, retries and deadlines."""
+
+    def __init__(self, config=None):
+        self.config = config or load_config()
+        parsed = urllib.parse.urlsplit(self.config["url"])
+        self.path = parsed.path or "/"
+        if parsed.query:
+            self.path += "?" + parsed.query
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.pool = ConnectionPool(
+            parsed.scheme, parsed.hostname, port, maxsize=self.config["pool_size"]
+        )
+        # Counters are updated from every thread using the client, under `_stats_lock`
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self._stats_lock = threading.Lock()
+        # A 429 with Retry-After pauses every thread sharing this client, not just the caller
+        self._paused_until = 0.0
+        self._pause_lock = threading.Lock()
+
+    def build_payload(self, messages, stream=False, **params):
+        payload = {"model": self.config["model"], "messages": messages}
+        payload.update(self.config["params"])
+        payload.update(params)
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    def headers(self, stream=False):
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream" if stream else "application/json",
+            "Connection": "keep-alive",
+        }
+        if self.config["api_key"]:
+            headers["Authorization"] = f"Bearer {self.config['api_key']}"
+        return headers
+
+    def complete(self, messages, deadline=None, **params):
+        """Return the full assistant reply for `messages`.
+
+        `deadline` is a budget in seconds covering every retry; it defaults to
+        the configured timeout.
+        """
+        body = json.dumps(self.build_payload(messages, **params)).encode("utf-8")
+        conn, response = self._request(body, self.headers(), deadline)
+        try:
+            data = json.loads(response.read())
+        except (ValueError, OSError, http.client.HTTPException) as e:
+            self.pool.release(conn, reusable=False)
+            raise ChatError(f"Invalid response from AI: {e}")
+        self.pool.release(conn, reusable=not response.will_close)
+        return _content(data, "message")
+
+    def stream(self, messages, deadline=None, cancel=None, **params):
+        """Yield reply fragments as the server streams them.
+
+        `cancel` is an optional `CancelToken`; cancelling it from another
+        thread stops the stream and raises `ChatCancelled`.  Retries only
+        happen before the first byte is received.
+        """
+        body = json.dumps(self.build_payload(messages, stream=True, **params)).encode("utf-8")
+        conn, response = self._request(body, self.headers(stream=True), deadline)
+        finished = False
+        if cancel is not None:
+            cancel.attach(conn)
+        try:
+            while True:
+                if cancel is not None and cancel.is_set():
+                    raise ChatCancelled()
+                line = response.readline()
+                if not line:
+                    finished = True
+                    break
+                line = line.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    # Drain the terminating chunk so the connection can be reused
+                    response.read()
+                    finished = True
+                    break
+                try:
+                    chunk = json.loads(data)
+                except ValueError as e:
+                    raise ChatError(f"Invalid response from AI: {e}")
+                delta = _content(chunk, "delta")
+                if delta:
+                    yield delta
+        except (OSError, http.client.HTTPException) as e:
+            if cancel is not None and cancel.is_set():
+                raise ChatCancelled()
+            raise ChatError(f"Error: {e}")
+        finally:
+            if cancel is not None:
+                cancel.detach()
+            self.pool.release(conn, reusable=finished and not response.will_close)
+
+    def _request(self, body, headers, deadline):
+        """POST `body`, retrying 429/5xx and connection errors with exponential backoff."""
+        budget = deadline if deadline is not None else self.config["timeout"]
+        expires = time.monotonic() + budget
+        attempt = 0
+        while True:
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                raise ChatError("Error: request deadline exceeded")
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                if pause >= remaining:
+                    raise ChatError("Error 429: rate limited past the request deadline", 429)
+                time.sleep(pause)
+                remaining -= pause
+            timeout = min(self.config["timeout"], remaining)
+            conn = self.pool.acquire(timeout)
+            with self._stats_lock:
+                self.requests += 1
+            retry_after = None
+            try:
+                with tracing.span("chat.http", attempt=attempt):
+                    conn.request("POST", self.path, body=body, headers=headers)
+                    response = conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                # A pooled connection may have been closed by the server while idle
+                self.pool.release(conn, reusable=False)
+                error = ChatError(f"Error: {e}")
+            else:
+                if response.status == 200:
+                    return conn, response
+                retry_after = response.getheader("Retry-After")
+                response.read()
+                self.pool.release(conn, reusable=not response.will_close)
+                error = ChatError(
+                    f"Error {response.status}: Unable to communicate with AI.", response.status
+                )
+                if response.status not in RETRY_STATUSES:
+                    raise error
+            if attempt >= self.config["retries"]:
+                raise error
+            delay = self.config["backoff"] * (2 ** attempt) * (0.5 + random.random())
+            if retry_after is not None:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+                if error.status == 429:
+                    with self._stats_lock:
+                        self.rate_limited += 1
+                    with self._pause_lock:
+                        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            if time.monotonic() + delay >= expires:
+                raise error
+            attempt += 1
+            with self._stats_lock:
+                self.retries += 1
+            time.sleep(delay)
+
+    def stats(self):
+        """Connection-reuse counters; `handshakes_saved` is the number of reused connections."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "connections_opened": self.pool.opened,
+            "handshakes_saved": self.pool.reused,
+            "connections_discarded": self.pool.discarded,
+        }
+
+    def close(self):
+        self.pool.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide shared `ChatClient`."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ChatClient()
+        return _client
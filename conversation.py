@@ -0,0 +1,132 @@
+"""Multi-turn chat history kept within a prompt-token budget.
+
+The fixed instruction is sent once as a system message.  Recent turns are
+sent verbatim; when the prompt would exceed `budget` tokens the oldest
+turns are folded into a short extractive summary (also a system message),
+so request size stays bounded however long the conversation runs.
+Token counts are local estimates, good enough for budgeting without a
+tokenizer download.
+"""
+import re
+from collections import namedtuple
+
+Turn = namedtuple("Turn", "user assistant")
+
+DEFAULT_BUDGET = 2048
+# Role and separator tokens the API adds around every message
+MESSAGE_OVERHEAD = 4
+# Longest excerpt of a question / answer kept in the summary (characters)
+SUMMARY_QUESTION_CHARS = 100
+SUMMARY_ANSWER_CHARS = 160
+# Earlier turns that must match for a cached answer to be reused
+CACHE_CONTEXT_TURNS = 1
+
+_PIECES = re.compile(r"\w+|[^\w\s]")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text):
+    """Approximate BPE token count: about one token per four word characters, one per symbol."""
+    return sum((len(piece) + 3) // 4 for piece in _PIECES.findall(text))
+
+
+def message_tokens(messages):
+    return sum(estimate_tokens(message["content"]) + MESSAGE_OVERHEAD for message in messages)
+
+
+def _excerpt(text, limit):
+    text = " ".join(text.split())
+    text = _SENTENCE_END.split(text, 1)[0]
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+def summarize(turn):
+    """One summary line for `turn`: the question and the first sentence of the answer."""
+    return (f"Q: {_excerpt(turn.user, SUMMARY_QUESTION_CHARS)} "
+            f"A: {_excerpt(turn.assistant, SUMMARY_ANSWER_CHARS)}")
+
+
+class Conversation:
+    """Chat history that builds budgeted message lists for `ChatClient`.
+
+    `summary_budget` caps the tokens spent on the summary of trimmed turns
+    (default a quarter of `budget`); the oldest summary lines go first.
+    """
+
+    def __init__(self, system="", budget=DEFAULT_BUDGET, summary_budget=None):
+        self.system = system
+        self.budget = budget
+        self.summary_budget = budget // 4 if summary_budget is None else summary_budget
+        self.turns = []
+        self.summary = []
+        self.summarized = 0
+        self.trimmed_tokens = 0
+        self.prompt_tokens = 0
+        self.untrimmed_tokens = 0
+
+    def _summary_message(self):
+        text = "Earlier in this conversation:\n" + "\n".join(self.summary)
+        return {"role": "system", "content": text}
+
+    def _build(self, question):
+        messages = []
+        if self.system:
+            messages.append({"role": "system", "content": self.system})
+        if self.summary:
+            messages.append(self._summary_message())
+        for turn in self.turns:
+            messages.append({"role": "user", "content": turn.user})
+            messages.append({"role": "assistant", "content": turn.assistant})
+        messages.append({"role": "user", "content": question})
+        return messages
+
+    def messages(self, question):
+        """Messages to send for `question`, trimming old turns into the summary as needed.
+
+        Also records `prompt_tokens`, and `untrimmed_tokens`: the estimate for
+        resending the whole history with the instruction inside every user turn.
+        """
+        messages = self._build(question)
+        while self.turns and message_tokens(messages) > self.budget:
+            turn = self.turns.pop(0)
+            self.trimmed_tokens += message_tokens([{"content": turn.user}, {"content": turn.assistant}])
+            self.summary.append(summarize(turn))
+            self.summarized += 1
+            while len(self.summary) > 1 and estimate_tokens("\n".join(self.summary)) > self.summary_budget:
+                self.summary.pop(0)
+            messages = self._build(question)
+        self.prompt_tokens = message_tokens(messages)
+        history = messages[-2 * len(self.turns) - 1:]
+        self.untrimmed_tokens = (self.trimmed_tokens + message_tokens(history)
+                                 + estimate_tokens(self.system) * (self.summarized + len(self.turns) + 1))
+        return messages
+
+    def cache_context(self):
+        """What a cached answer to the next question must have been asked after.
+
+        The instruction and the latest `CACHE_CONTEXT_TURNS` turns only: with
+        the whole history in the key, nothing but first questions would ever
+        hit.  Call after `messages`, which may have trimmed turns.
+        """
+        lines = [f"system: {self.system}"]
+        for turn in self.turns[-CACHE_CONTEXT_TURNS:]:
+            lines += [f"user: {turn.user}", f"assistant: {turn.assistant}"]
+        return "\n".join(lines)
+
+    def add(self, question, answer):
+        """Record a completed exchange."""
+        self.turns.append(Turn(question, answer))
+
+    def clear(self):
+        self.turns = []
+        self.summary = []
+        self.summarized = 0
+        self.trimmed_tokens = 0
+
+    def stats(self):
+        return {
+            "turns": len(self.turns),
+            "summarized_turns": self.summarized,
+            "prompt_tokens": self.prompt_tokens,
+            "untrimmed_tokens": self.untrimmed_tokens,
+        }
@@ -0,0 +1,21 @@
+"""Deliver `concurrent.futures.Future` results to the Qt UI thread.
+
+Sandbox and calculus jobs complete on background threads; both GUIs use
+`FutureRelay` so their result callbacks touch widgets only from the UI
+thread and never block it waiting.
+"""
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+
+class FutureRelay(QObject):
+    """Runs a callback on the UI thread when a concurrent.futures.Future completes."""
+    done = pyqtSignal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.done.connect(lambda callback, future: callback(future), Qt.ConnectionType.QueuedConnection)
+
+    def watch(self, future, callback):
+        # Queued even when the future is already done (a cached result), so
+        # the callback never runs inside the caller
+        future.add_done_callback(lambda f: self.done.emit(callback, f))
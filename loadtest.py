@@ -0,0 +1,90 @@
+"""Load-test harness for server.py.
+
+Opens `--concurrency` keep-alive connections, sends `--requests` POSTs in
+total and reports throughput and latency percentiles:
+
+    python server.py --port 8000 &
+    python loadtest.py --url http://127.0.0.1:8000/calculate \\
+        --body '{"formula": "force", "inputs": {"mass": 2, "acceleration": 3}}'
+"""
+import argparse
+import asyncio
+import json
+import time
+import urllib.parse
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def _client(host, port, path, body, count, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    request = (
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1") + body
+    try:
+        for _ in range(count):
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(url, body, requests=1000, concurrency=16):
+    """Return a dict with requests/sec and latency percentiles (ms)."""
+    parsed = urllib.parse.urlsplit(url)
+    data = json.dumps(body).encode("utf-8") if not isinstance(body, bytes) else body
+    latencies, errors = [], []
+    per_client = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _client(parsed.hostname, parsed.port or 80, parsed.path or "/", data, count, latencies, errors)
+        for count in per_client if count
+    ))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p90_ms": percentile(latencies, 0.90) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure requests/sec and p99 latency of server.py")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/calculate")
+    parser.add_argument("--body", default='{"formula": "force", "inputs": {"mass": 2, "acceleration": 3}}')
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    report = asyncio.run(run(args.url, args.body.encode("utf-8"), args.requests, args.concurrency))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
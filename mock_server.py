@@ -0,0 +1,137 @@
+"""Local stand-in for the OpenTyphoon chat completions endpoint.
+
+Speaks just enough of the OpenAI-compatible API (plain and `"stream": true`
+responses over HTTP/1.1 keep-alive) to exercise `chat_client` offline:
+
+    python mock_server.py --port 8765 --latency 0.05
+    OPENTYPHOON_URL=http://127.0.0.1:8765/v1/chat/completions python requests.py "What is F = ma?"
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle on, each response waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.record_connection()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        status = self.server.next_status()
+        if status != 200:
+            body = json.dumps({"error": {"message": "mock failure"}}).encode("utf-8")
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", str(self.server.retry_after))
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        time.sleep(self.server.latency)
+        messages = payload.get("messages") or [{}]
+        reply = self.server.reply_for(messages[-1].get("content", ""))
+        if payload.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for word in reply.split(" "):
+                chunk = {"choices": [{"delta": {"content": word + " "}}]}
+                self.write_chunk(f"data: {json.dumps(chunk)}\n\n")
+                time.sleep(self.server.token_delay)
+            self.write_chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            body = json.dumps({
+                "model": payload.get("model"),
+                "choices": [{"message": {"role": "assistant", "content": reply}}],
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+class MockChatServer(ThreadingHTTPServer):
+    """Threaded mock server; `fail_every` makes every Nth request return `fail_status`.
+
+    429 responses carry `Retry-After: <retry_after>`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), latency=0.0, token_delay=0.0,
+                 fail_every=0, fail_status=503, retry_after=0):
+        super().__init__(address, MockChatHandler)
+        self.latency = latency
+        self.token_delay = token_delay
+        self.fail_every = fail_every
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def record_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def next_status(self):
+        with self._lock:
+            self.requests += 1
+            if self.fail_every and self.requests % self.fail_every == 0:
+                return self.fail_status
+        return 200
+
+    def reply_for(self, prompt):
+        return f"Mock answer: $F = ma$ relates force and acceleration. ({len(prompt)} chars)"
+
+    def start(self):
+        """Serve from a daemon thread and return `self`."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before the first byte")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="seconds between streamed words")
+    parser.add_argument("--fail-every", type=int, default=0, help="fail every Nth request")
+    parser.add_argument("--fail-status", type=int, default=503, help="status returned by failing requests")
+    parser.add_argument("--retry-after", type=float, default=0, help="Retry-After seconds sent with 429")
+    args = parser.parse_args()
+    server = MockChatServer((args.host, args.port), args.latency, args.token_delay, args.fail_every,
+                            args.fail_status, args.retry_after)
+    print(f"Mock chat endpoint at {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
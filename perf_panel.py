@@ -0,0 +1,77 @@
+"""In-app performance overlay listing recent span latencies from `tracing`.
+
+Toggled with Ctrl+Shift+P in the main window; showing it turns tracing on.
+"""
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtWidgets import QFileDialog, QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout
+
+import tracing
+
+# Overlay refresh period while visible (ms)
+REFRESH_INTERVAL = 500
+
+
+class PerfPanel(QFrame):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("perfPanel")
+        self.setStyleSheet("""
+            QFrame#perfPanel {
+                background-color: rgba(29, 29, 31, 220);
+                border-radius: 8px;
+            }
+            QLabel { color: #f5f5f7; }
+        """)
+        self.table = QLabel("No spans recorded yet.")
+        self.table.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        export_button = QPushButton("Export Trace...")
+        export_button.clicked.connect(self.export)
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear)
+        buttons = QHBoxLayout()
+        buttons.addWidget(export_button)
+        buttons.addWidget(clear_button)
+        layout = QVBoxLayout()
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+        self.setLayout(layout)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(REFRESH_INTERVAL)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        tracing.enable()
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        stats = tracing.stats()
+        if not stats:
+            self.table.setText("No spans recorded yet.")
+        else:
+            lines = [f"{'span':<20}{'n':>6}{'last':>9}{'p50':>9}{'p95':>9}{'max':>9}  ms"]
+            lines += [
+                f"{name[:19]:<20}{s['count']:>6}{s['last_ms']:>9.1f}{s['p50_ms']:>9.1f}"
+                f"{s['p95_ms']:>9.1f}{s['max_ms']:>9.1f}"
+                for name, s in stats.items()
+            ]
+            self.table.setText("\n".join(lines))
+        self.adjustSize()
+
+    def clear(self):
+        tracing.clear()
+        self.refresh()
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Trace", "opengenphysx-trace.json", "Chrome trace (*.json)"
+        )
+        if path:
+            tracing.export(path)
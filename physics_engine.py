@@ -0,0 +1,198 @@
+"""Headless, vectorized physics formulas.
+
+Every formula accepts scalars or NumPy arrays and broadcasts, so a whole
+problem set or parameter sweep is evaluated in one call instead of driving
+the GUI once per row:
+
+    >>> evaluate("force", mass=[1, 2, 3], acceleration=9.81).value
+    array([ 9.81, 19.62, 29.43])
+
+Formulas are declared once as expression strings in `FORMULAS`; leaving
+any one quantity out solves for it (e.g. mass from force and acceleration)
+through the cached SymPy pipeline in `symbolic`.  Inputs may carry units
+(`units.Quantity` arrays or strings like "500 g"); they are converted to
+the formula's units once per array and dimension-checked.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+import units as unit_system
+
+Formula = namedtuple("Formula", "name label inputs output unit expression function")
+Result = namedtuple("Result", "name label value unit")
+
+# Display names of every quantity a formula uses
+QUANTITIES = {
+    "mass": "Mass",
+    "acceleration": "Acceleration",
+    "force": "Force",
+    "work": "Work",
+    "energy": "Energy",
+    "work_energy": "Total Work-Energy",
+    "v0": "Initial Velocity",
+    "v": "Final Velocity",
+    "t": "Time",
+    "velocity": "Velocity",
+    "kinetic_energy": "Kinetic Energy",
+    "displacement": "Displacement",
+}
+
+
+def _formula(name, label, inputs, output, unit, expression):
+    """Declare a formula; `expression` is compiled to a NumPy-ready function once, at import."""
+    source = f"lambda {', '.join(inputs)}: {expression}"
+    function = eval(compile(source, f"<formula {name}>", "eval"), {"np": np})
+    return Formula(name, label, inputs, output, unit, expression, function)
+
+
+# inputs map each argument name to its unit
+FORMULAS = {
+    formula.name: formula for formula in [
+        _formula("force", "Calculated Force", {"mass": "kg", "acceleration": "m/s²"},
+                 "force", "N", "mass * acceleration"),
+        _formula("acceleration", "Calculated Acceleration", {"mass": "kg", "force": "N"},
+                 "acceleration", "m/s²", "force / mass"),
+        _formula("work_energy_total", "Total Work-Energy", {"work": "J", "energy": "J"},
+                 "work_energy", "J", "work + energy"),
+        _formula("average_acceleration", "Average Acceleration", {"v0": "m/s", "v": "m/s", "t": "s"},
+                 "acceleration", "m/s²", "(v - v0) / t"),
+        _formula("kinetic_energy", "Kinetic Energy", {"mass": "kg", "velocity": "m/s"},
+                 "kinetic_energy", "J", "mass * velocity ** 2 / 2"),
+        _formula("work", "Work Done", {"force": "N", "displacement": "m"},
+                 "work", "J", "force * displacement"),
+    ]
+}
+
+
+def get_formula(name):
+    try:
+        return FORMULAS[name]
+    except KeyError:
+        raise KeyError(f"Unknown formula {name!r}; expected one of {sorted(FORMULAS)}") from None
+
+
+def units(formula):
+    """Unit of every quantity in `formula`, inputs first and the output last."""
+    return dict(formula.inputs, **{formula.output: formula.unit})
+
+
+def _unknown(formula, given):
+    """The one quantity of `formula` missing from `given` (the output if nothing is missing)."""
+    missing = [quantity for quantity in units(formula) if quantity not in given]
+    if not missing:
+        return formula.output
+    if len(missing) > 1:
+        labels = ", ".join(QUANTITIES[quantity] for quantity in missing)
+        raise ValueError(f"Leave only one value blank to solve for it (missing {labels})")
+    return missing[0]
+
+
+def _solve(formula, unknown, values):
+    """Evaluate `unknown` from the other quantities, preferring non-negative real roots."""
+    if unknown == formula.output:
+        return formula.function(**{key: values[key] for key in formula.inputs})
+    import symbolic
+
+    known = tuple(quantity for quantity in units(formula) if quantity != unknown)
+    roots = [
+        np.asarray(function(*(values[key] for key in known)), dtype=float)
+        for function in symbolic.solutions(formula.expression, formula.output, unknown, known)
+    ]
+    if not roots:
+        raise ValueError(f"{QUANTITIES[unknown]} cannot be solved for in {formula.name}")
+    roots = np.broadcast_arrays(*roots)
+    value = roots[0]
+    # Walk back so the first usable root wins
+    for root in reversed(roots):
+        value = np.where(np.isfinite(root) & (root >= 0), root, value)
+    return value
+
+
+def _result(formula, unknown, value):
+    if unknown == formula.output:
+        return Result(formula.output, formula.label, value, formula.unit)
+    return Result(unknown, f"Calculated {QUANTITIES[unknown]}", value, units(formula)[unknown])
+
+
+def evaluate(name, **inputs):
+    """Evaluate formula `name` on broadcastable inputs and return a `Result`.
+
+    Give every input to compute the output, or the output plus all but one
+    input to solve for that input.  Division by zero yields inf/nan in the
+    affected elements rather than aborting the whole batch.
+    """
+    formula = get_formula(name)
+    unknown = _unknown(formula, inputs)
+    arrays = {
+        key: np.asarray(unit_system.to_value(inputs[key], unit), dtype=float)
+        for key, unit in units(formula).items() if key != unknown
+    }
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = _solve(formula, unknown, arrays)
+    return _result(formula, unknown, value)
+
+
+def calculate(name, **inputs):
+    """Scalar evaluation for the GUI.
+
+    Blank ("" or None) values count as missing, so the one left blank is
+    solved for.  Values may be strings with units ("36 km/h").  Raises
+    ValueError for non-numeric input or wrong units and FloatingPointError
+    on division by zero.
+    """
+    formula = get_formula(name)
+    given = {key: value for key, value in inputs.items() if value is not None and str(value).strip() != ""}
+    unknown = _unknown(formula, given)
+    values = {}
+    for key, unit in units(formula).items():
+        if key == unknown:
+            continue
+        try:
+            values[key] = np.float64(unit_system.to_value(given[key], unit))
+        except ValueError as e:
+            raise ValueError(f"{QUANTITIES[key]}: {e}") from None
+    try:
+        with np.errstate(divide="raise", invalid="raise"):
+            value = _solve(formula, unknown, values)
+    except (FloatingPointError, ZeroDivisionError, OverflowError):
+        value = np.nan
+    if not np.isfinite(value):
+        raise FloatingPointError(f"{QUANTITIES[unknown]} has no finite solution for these values")
+    return _result(formula, unknown, float(value))
+
+
+def sweep(name, **ranges):
+    """Evaluate `name` over the Cartesian product of 1-D input ranges.
+
+    Returns the result plus the broadcast input grids, e.g.
+    `sweep("kinetic_energy", mass=np.linspace(1, 10, 100), velocity=np.linspace(0, 20, 1000))`
+    gives a 100 x 1000 energy grid.
+    """
+    formula = get_formula(name)
+    axes = [np.asarray(ranges[key], dtype=float) for key in formula.inputs]
+    grids = np.meshgrid(*axes, indexing="ij", sparse=True)
+    result = evaluate(name, **dict(zip(formula.inputs, grids)))
+    return result, dict(zip(formula.inputs, grids))
+
+
+def read_columns(path):
+    """Load named input columns from a CSV (with header), .npz or Parquet file."""
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            return {key: data[key] for key in data.files}
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+        return {column: table[column].to_numpy() for column in table.column_names}
+    data = np.genfromtxt(path, delimiter=",", names=True, dtype=float, encoding="utf-8")
+    return {key: np.atleast_1d(data[key]) for key in data.dtype.names}
+
+
+def evaluate_table(name, columns):
+    """Evaluate `name` on a mapping of column name to array (dict, npz, DataFrame).
+
+    Solves for whichever single quantity has no column.
+    """
+    formula = get_formula(name)
+    return evaluate(name, **{key: np.asarray(columns[key]) for key in units(formula) if key in columns})
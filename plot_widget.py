@@ -0,0 +1,169 @@
+"""Embedded matplotlib plot panel for the main window.
+
+Samples are produced by `plotting.CurveSampler` on a worker thread and
+handed back to the UI thread for drawing, so neither the first plot nor
+zoom/pan ever blocks the window.  Replotting the same figure with new
+inputs (live recalculation) keeps the lines and the zoom and only
+resamples the curves whose key changed.
+"""
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
+from matplotlib.figure import Figure
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QVBoxLayout, QWidget
+
+import tracing
+from plotting import CurveSampler, sample_curves
+
+# Delay before resampling after the view stops changing (ms)
+RESAMPLE_DELAY = 50
+
+
+class SampleSignals(QObject):
+    done = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class SampleJob(QRunnable):
+    """Computes one view of every curve off the UI thread."""
+
+    def __init__(self, generation, samplers, start, stop, pixels):
+        super().__init__()
+        self.generation = generation
+        self.samplers = samplers
+        self.start = start
+        self.stop = stop
+        self.pixels = pixels
+        self.signals = SampleSignals()
+
+    def run(self):
+        try:
+            with tracing.span("plot.sample", curves=len(self.samplers), pixels=self.pixels):
+                data = sample_curves(self.samplers, self.start, self.stop, self.pixels)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.done.emit(self.generation, data)
+
+
+class PlotPanel(QWidget):
+    """Plot canvas with toolbar that resamples curves at screen resolution on zoom/pan."""
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.figure = Figure(figsize=(5, 3), tight_layout=True)
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.toolbar = NavigationToolbar2QT(self.canvas, self)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+        self.setLayout(layout)
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.samplers = {}
+        self.lines = {}
+        self.keys = {}
+        self.layout_key = None
+        self.span = None
+        self.generation = 0
+        self.busy = False
+        self.pending = False
+        self.autoscale_y = True
+        self.resample_timer = QTimer(self)
+        self.resample_timer.setSingleShot(True)
+        self.resample_timer.setInterval(RESAMPLE_DELAY)
+        self.resample_timer.timeout.connect(self.resample)
+        self.axes.callbacks.connect("xlim_changed", self.on_xlim_changed)
+
+    def plot(self, curves, start, stop, xlabel="", ylabel="", title=""):
+        """Show `curves`, a list of `plotting.Curve`, over [start, stop].
+
+        When the curve labels and titles match the current plot, the lines
+        stay and only curves without a key or with a new key are resampled.
+        The zoom is kept unless [start, stop] changed.
+        """
+        layout_key = ([curve.label for curve in curves], xlabel, ylabel, title)
+        if layout_key == self.layout_key:
+            self.update_curves(curves, start, stop)
+            return
+        self.layout_key = layout_key
+        self.keys = {curve.label: curve.key for curve in curves}
+        self.span = (start, stop)
+        self.generation += 1
+        self.samplers = {curve.label: CurveSampler(curve.function) for curve in curves}
+        self.axes.clear()
+        self.axes.callbacks.connect("xlim_changed", self.on_xlim_changed)
+        self.lines = {
+            curve.label: self.axes.plot([], [], label=curve.label)[0] for curve in curves
+        }
+        self.axes.set_xlabel(xlabel)
+        self.axes.set_ylabel(ylabel)
+        self.axes.set_title(title)
+        self.axes.grid(True)
+        self.axes.legend()
+        self.autoscale_y = True
+        self.axes.set_xlim(start, stop)
+        self.resample()
+
+    def update_curves(self, curves, start, stop):
+        changed = [curve.label for curve in curves if curve.key is None or curve.key != self.keys[curve.label]]
+        for curve in curves:
+            if curve.label in changed:
+                self.samplers[curve.label] = CurveSampler(curve.function)
+                self.keys[curve.label] = curve.key
+        if (start, stop) != self.span:
+            self.span = (start, stop)
+            self.generation += 1
+            self.autoscale_y = True
+            self.axes.set_xlim(start, stop)
+            self.resample()
+        elif changed:
+            self.generation += 1
+            self.autoscale_y = True
+            self.resample(changed)
+
+    def on_xlim_changed(self, axes):
+        if self.samplers:
+            self.resample_timer.start()
+
+    def resample(self, labels=None):
+        """Sample the current view of the curves in `labels` (default all) on the worker thread."""
+        if not self.samplers:
+            return
+        if self.busy:
+            # The follow-up resamples every curve, which covers `labels`
+            self.pending = True
+            return
+        self.busy = True
+        start, stop = self.axes.get_xlim()
+        pixels = max(int(self.axes.bbox.width), 100)
+        samplers = {label: self.samplers[label] for label in labels or self.samplers}
+        job = SampleJob(self.generation, samplers, start, stop, pixels)
+        job.signals.done.connect(self.on_samples)
+        job.signals.failed.connect(self.on_sample_failed)
+        self.pool.start(job)
+
+    def on_samples(self, generation, data):
+        self.busy = False
+        if generation == self.generation:
+            for label, (x, y) in data.items():
+                self.lines[label].set_data(x, y)
+            if self.autoscale_y:
+                self.axes.relim()
+                self.axes.autoscale_view(scalex=False)
+                self.autoscale_y = False
+            self.canvas.draw_idle()
+        if self.pending:
+            self.pending = False
+            self.resample()
+
+    def on_sample_failed(self, generation, error):
+        self.busy = False
+        if generation == self.generation:
+            self.failed.emit(error)
+        if self.pending:
+            self.pending = False
+            self.resample()
@@ -0,0 +1,127 @@
+"""Headless curve sampling for the plot panel.
+
+`adaptive_sample` spends points where a curve bends instead of on a fixed
+`linspace`, and `minmax_decimate` reduces dense data to two points per
+pixel column without losing peaks.  `CurveSampler` combines both with a
+cache of previously computed samples so zooming and panning only evaluate
+the function where the cache is too sparse.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# `key` identifies what the function computes (e.g. its fixed inputs); a
+# replotted curve with the same key keeps its cached samples
+Curve = namedtuple("Curve", "label function key", defaults=(None,))
+
+# Upper bound on points kept per curve across zoom/pan
+MAX_CACHED_POINTS = 2_000_000
+
+
+def _call(function, x):
+    with np.errstate(all="ignore"):
+        return np.broadcast_to(np.asarray(function(x), dtype=float), x.shape).copy()
+
+
+def adaptive_sample(function, start, stop, initial=129, depth=8, tol=1e-3, max_points=20_000):
+    """Sample vectorized `function` on [start, stop], refining high-curvature intervals.
+
+    Each pass evaluates the midpoints of the intervals still marked active and
+    splits those whose midpoint deviates from the linear interpolation by more
+    than `tol` times the curve's vertical extent.  Only split intervals stay
+    active, so flat regions stop costing evaluations after the first pass.
+    """
+    x = np.linspace(start, stop, initial)
+    y = _call(function, x)
+    active = np.ones(len(x) - 1, dtype=bool)
+    finite = y[np.isfinite(y)]
+    scale = np.ptp(finite) if finite.size else 1.0
+    threshold = tol * (scale or 1.0)
+    for _ in range(depth):
+        left = np.nonzero(active)[0]
+        if not left.size or len(x) + left.size > max_points:
+            break
+        xm = (x[left] + x[left + 1]) / 2
+        ym = _call(function, xm)
+        linear = (y[left] + y[left + 1]) / 2
+        with np.errstate(invalid="ignore"):
+            error = np.abs(ym - linear)
+        # Discontinuities and poles show up as nan/inf; keep refining those too
+        refine = ~(error <= threshold)
+        if not refine.any():
+            break
+        split = left[refine]
+        x = np.insert(x, split + 1, xm[refine])
+        y = np.insert(y, split + 1, ym[refine])
+        marks = np.zeros(len(active), dtype=bool)
+        marks[split] = True
+        active = np.repeat(marks, np.where(marks, 2, 1))
+    return x, y
+
+
+def minmax_decimate(x, y, buckets, start=None, stop=None):
+    """Keep the min and max of each of `buckets` equal-width x columns of [start, stop].
+
+    `x` must be sorted; the range defaults to the data's.  Columns are cut by
+    x rather than by sample count, so on an adaptively refined grid a dense
+    stretch near a feature still gets only its share of the screen width.
+    """
+    n = len(x)
+    if buckets <= 0 or n <= 2 * buckets:
+        return x, y
+    start = x[0] if start is None else start
+    stop = x[-1] if stop is None else stop
+    edges = np.linspace(start, stop, buckets + 1)[1:-1]
+    # First index of every non-empty column
+    starts = np.unique(np.concatenate([[0], np.searchsorted(x, edges, side="left")]))
+    starts = starts[starts < n]
+    counts = np.diff(np.append(starts, n))
+    lows = np.where(np.isnan(y), np.inf, y)
+    highs = np.where(np.isnan(y), -np.inf, y)
+    # Each column's extreme, then the first sample attaining it (every column has one)
+    hits = np.flatnonzero(lows == np.repeat(np.minimum.reduceat(lows, starts), counts))
+    imin = hits[np.searchsorted(hits, starts)]
+    hits = np.flatnonzero(highs == np.repeat(np.maximum.reduceat(highs, starts), counts))
+    imax = hits[np.searchsorted(hits, starts)]
+    index = np.unique(np.concatenate([imin, imax, [0, n - 1]]))
+    return x[index], y[index]
+
+
+class CurveSampler:
+    """Caches samples of one curve and serves pixel-resolution views of it."""
+
+    def __init__(self, function):
+        self.function = function
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.evaluations = 0
+
+    def view(self, start, stop, pixels=800):
+        """Return at most ~2 * `pixels` points covering [start, stop].
+
+        The function is only evaluated when the cache does not span the view
+        or holds fewer than `pixels` points inside it.
+        """
+        covered = self.x.size and self.x[0] <= start and self.x[-1] >= stop
+        lo = np.searchsorted(self.x, start, side="left")
+        hi = np.searchsorted(self.x, stop, side="right")
+        if not covered or hi - lo < pixels:
+            x, y = adaptive_sample(self.function, start, stop, initial=max(pixels // 4, 64) + 1)
+            self.evaluations += len(x)
+            self._merge(x, y)
+            lo = np.searchsorted(self.x, start, side="left")
+            hi = np.searchsorted(self.x, stop, side="right")
+        return minmax_decimate(self.x[lo:hi], self.y[lo:hi], pixels, start, stop)
+
+    def _merge(self, x, y):
+        x_all = np.concatenate([self.x, x])
+        y_all = np.concatenate([self.y, y])
+        x_all, unique = np.unique(x_all, return_index=True)
+        self.x, self.y = x_all, y_all[unique]
+        if len(self.x) > MAX_CACHED_POINTS:
+            self.x, self.y = minmax_decimate(self.x, self.y, MAX_CACHED_POINTS // 2)
+
+
+def sample_curves(samplers, start, stop, pixels=800):
+    """Return `{label: (x, y)}` for a dict of `CurveSampler`s over one view."""
+    return {label: sampler.view(start, stop, pixels) for label, sampler in samplers.items()}
@@ -0,0 +1,321 @@
+"""Evaluate physics formulas over large problem sets stored in files.
+
+Reads named input columns from a CSV file with a header row, a Parquet
+file, a structured `.npy` array or a directory of one `.npy` file per
+column, evaluates the chosen formulas chunk by chunk in worker processes
+and streams the inputs plus one column per result to CSV, `.npy` or
+Parquet.  Each formula solves for whichever of its quantities has no
+column, exactly as `physics_engine.evaluate` does:
+
+    python problems.py bank.npy --topic Dynamics --output results.npy
+    python problems.py bank.csv --formula force --formula kinetic_energy -o results.csv
+
+`.npy` inputs are memory-mapped and workers map the same file, so the
+parent never reads them; CSV lines are handed to the workers unparsed and
+Parquet is read one record batch at a time.  At most `2 * workers` chunks
+are in flight, so memory stays bounded by the chunk size, not the file.
+"""
+import argparse
+import io
+import os
+import resource
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+import physics_engine
+
+# Rows evaluated per task
+DEFAULT_CHUNK_ROWS = 100_000
+# Chunks queued per worker, so reading overlaps evaluation without buffering the file
+CHUNKS_PER_WORKER = 2
+
+# Columns of a memory-mapped source: name -> (path, structured field or None)
+MappedChunk = namedtuple("MappedChunk", "files start stop")
+# Unparsed CSV lines and the index of each wanted column in them
+TextChunk = namedtuple("TextChunk", "names indices text")
+
+
+class Source:
+    """Named input columns of a file, read as picklable chunks that workers `load`."""
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.isdir(path):
+            self._open_directory()
+        elif path.endswith(".npy"):
+            self._open_npy()
+        elif path.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            self._parquet = pq.ParquetFile(path)
+            self.columns = list(self._parquet.schema_arrow.names)
+            self.rows = self._parquet.metadata.num_rows
+            self.kind = "parquet"
+        else:
+            with open(path, encoding="utf-8") as f:
+                self.columns = [name.strip() for name in f.readline().split(",")]
+            self.rows = None
+            self.kind = "csv"
+
+    def _open_npy(self):
+        array = np.load(self.path, mmap_mode="r")
+        if array.dtype.names is None or array.ndim != 1:
+            raise ValueError(f"{self.path}: expected a 1-D structured array with named fields")
+        self.files = {name: (self.path, name) for name in array.dtype.names}
+        self.columns = list(array.dtype.names)
+        self.rows = len(array)
+        self.kind = "npy"
+
+    def _open_directory(self):
+        self.files, lengths = {}, set()
+        for entry in sorted(os.listdir(self.path)):
+            if entry.endswith(".npy"):
+                column = os.path.join(self.path, entry)
+                lengths.add(np.load(column, mmap_mode="r").shape)
+                self.files[entry[:-4]] = (column, None)
+        if len(lengths) != 1 or len(next(iter(lengths))) != 1:
+            raise ValueError(f"{self.path}: expected 1-D .npy columns of equal length")
+        self.columns = list(self.files)
+        self.rows = next(iter(lengths))[0]
+        self.kind = "npy"
+
+    def count_rows(self):
+        """Number of data rows; CSV files are scanned once to find it."""
+        if self.rows is None:
+            with open(self.path, encoding="utf-8") as f:
+                next(f, None)
+                self.rows = sum(1 for line in f if line.strip())
+        return self.rows
+
+    def chunks(self, names, chunk_rows):
+        """Yield chunks holding columns `names`, `chunk_rows` rows at a time."""
+        if self.kind == "npy":
+            files = {name: self.files[name] for name in names}
+            for start in range(0, self.rows, chunk_rows):
+                yield MappedChunk(files, start, min(start + chunk_rows, self.rows))
+        elif self.kind == "parquet":
+            for batch in self._parquet.iter_batches(batch_size=chunk_rows, columns=list(names)):
+                yield {name: batch.column(name).to_numpy(zero_copy_only=False) for name in names}
+        else:
+            indices = [self.columns.index(name) for name in names]
+            with open(self.path, encoding="utf-8") as f:
+                next(f)
+                while True:
+                    text = "".join(islice(f, chunk_rows))
+                    if not text:
+                        break
+                    yield TextChunk(tuple(names), indices, text)
+
+
+# Memory maps opened by this process, by path
+_mapped = {}
+
+
+def load(chunk):
+    """Column arrays of a chunk produced by `Source.chunks`."""
+    if isinstance(chunk, MappedChunk):
+        columns = {}
+        for name, (path, field) in chunk.files.items():
+            if path not in _mapped:
+                _mapped[path] = np.load(path, mmap_mode="r")
+            array = _mapped[path][chunk.start:chunk.stop]
+            columns[name] = array if field is None else array[field]
+        return columns
+    if isinstance(chunk, TextChunk):
+        data = np.loadtxt(io.StringIO(chunk.text), delimiter=",", usecols=chunk.indices,
+                          dtype=float, ndmin=2)
+        return {name: data[:, i] for i, name in enumerate(chunk.names)}
+    return chunk
+
+
+def plan(formulas, columns):
+    """Output column for each formula, given the input `columns` available.
+
+    The output is named after the quantity solved for.  Returns the
+    outputs plus, for each formula skipped because its quantity is already
+    an input or another formula's output, the reason.
+    """
+    outputs, skipped = {}, {}
+    producers = {column: "an input column" for column in columns}
+    for name in formulas:
+        formula = physics_engine.get_formula(name)
+        missing = [quantity for quantity in physics_engine.units(formula) if quantity not in columns]
+        if len(missing) > 1:
+            raise ValueError(f"{name} needs columns {', '.join(missing)}")
+        column = missing[0] if missing else formula.output
+        if column in producers:
+            skipped[name] = f"{column} is {producers[column]}"
+            continue
+        outputs[name] = column
+        producers[column] = f"computed by {name}"
+    return outputs, skipped
+
+
+def applicable(columns):
+    """Formulas that can be evaluated from `columns`, i.e. missing at most one quantity.
+
+    Formulas that compute their own output come first, so `plan` keeps
+    them over ones that would solve for the same quantity symbolically.
+    """
+    names = [
+        name for name, formula in physics_engine.FORMULAS.items()
+        if sum(quantity not in columns for quantity in physics_engine.units(formula)) <= 1
+    ]
+    return sorted(names, key=lambda name: physics_engine.FORMULAS[name].output in columns)
+
+
+def evaluate_chunk(chunk, outputs, csv_names=None):
+    """Inputs of `chunk` plus each formula's result, as float64 column arrays.
+
+    With `csv_names`, returns those columns already formatted as CSV lines
+    instead, so text formatting runs in the workers rather than the writer.
+    """
+    columns = {name: np.asarray(values, dtype=float) for name, values in load(chunk).items()}
+    results = dict(columns)
+    for name, column in outputs.items():
+        formula = physics_engine.get_formula(name)
+        inputs = {key: columns[key] for key in physics_engine.units(formula) if key in columns}
+        results[column] = np.broadcast_to(physics_engine.evaluate(name, **inputs).value,
+                                          len(next(iter(columns.values()))))
+    if csv_names is None:
+        return results
+    text = io.StringIO()
+    np.savetxt(text, np.column_stack([results[name] for name in csv_names]), delimiter=",", fmt="%.17g")
+    return text.getvalue()
+
+
+class Writer:
+    """Stream column chunks to CSV (or stdout), `.npy` (structured) or Parquet.
+
+    `write` takes a mapping of column arrays, or preformatted lines when
+    `csv` is true.
+    """
+
+    def __init__(self, path, names, rows=None):
+        self.path, self.names, self.position = path, names, 0
+        self.csv = not path.endswith((".npy", ".parquet"))
+        if path.endswith(".npy"):
+            dtype = np.dtype([(name, float) for name in names])
+            self._array = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(rows,))
+        elif path.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            self._schema = pa.schema([(name, pa.float64()) for name in names])
+            self._parquet = pq.ParquetWriter(path, self._schema)
+        else:
+            self._file = sys.stdout if path == "-" else open(path, "w", encoding="utf-8", newline="")
+            self._file.write(",".join(names) + "\n")
+
+    def write(self, columns):
+        if isinstance(columns, str):
+            self._file.write(columns)
+            self.position += columns.count("\n")
+            return
+        rows = len(columns[self.names[0]])
+        if self.path.endswith(".npy"):
+            block = self._array[self.position:self.position + rows]
+            for name in self.names:
+                block[name] = columns[name]
+        elif self.path.endswith(".parquet"):
+            import pyarrow as pa
+            self._parquet.write_table(pa.table({name: columns[name] for name in self.names},
+                                               schema=self._schema))
+        else:
+            np.savetxt(self._file, np.column_stack([columns[name] for name in self.names]),
+                       delimiter=",", fmt="%.17g")
+        self.position += rows
+
+    def close(self):
+        if self.path.endswith(".npy"):
+            self._array.flush()
+            del self._array
+        elif self.path.endswith(".parquet"):
+            self._parquet.close()
+        elif self._file is not sys.stdout:
+            self._file.close()
+
+
+def run(source, outputs, writer, chunk_rows=DEFAULT_CHUNK_ROWS, workers=None):
+    """Evaluate `outputs` (from `plan`) over `source` into `writer`; returns the row count.
+
+    Chunks are written in input order.  `workers=0` evaluates in this process.
+    """
+    names = [name for name in writer.names if name in source.columns]
+    chunks = source.chunks(names, chunk_rows)
+    csv_names = writer.names if writer.csv else None
+    if workers == 0:
+        for chunk in chunks:
+            writer.write(evaluate_chunk(chunk, outputs, csv_names))
+        return writer.position
+
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        limit = CHUNKS_PER_WORKER * workers
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(evaluate_chunk, chunk, outputs, csv_names))
+            if len(pending) >= limit:
+                writer.write(pending.popleft().result())
+        while pending:
+            writer.write(pending.popleft().result())
+    return writer.position
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process and of its largest finished child, in MB."""
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate formulas over a CSV, Parquet or .npy problem set")
+    parser.add_argument("input", help="CSV with header, .parquet, structured .npy or a directory of <column>.npy")
+    parser.add_argument("-o", "--output", default="-", help="CSV, .npy or .parquet file (default CSV on stdout)")
+    parser.add_argument("--formula", action="append", default=[], help="formula name (repeatable)")
+    parser.add_argument("--topic", action="append", default=[], help="GUI topic name, e.g. Dynamics (repeatable)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="rows per task")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (0 = in-process)")
+    args = parser.parse_args()
+
+    from topics import TOPICS
+    formulas = list(args.formula)
+    for name in args.topic:
+        if name not in TOPICS or TOPICS[name].formula is None:
+            parser.error(f"{name!r} is not a formula topic")
+        formulas.append(TOPICS[name].formula)
+    try:
+        source = Source(args.input)
+        formulas = list(dict.fromkeys(formulas)) or applicable(source.columns)
+        if not formulas:
+            parser.error(f"no formula can be evaluated from columns {', '.join(source.columns)}")
+        outputs, skipped = plan(formulas, source.columns)
+    except (KeyError, ValueError, OSError, ImportError) as e:
+        parser.error(str(e))
+    for name, reason in skipped.items():
+        print(f"Skipping {name}: {reason}", file=sys.stderr)
+    if not outputs:
+        parser.error("every formula's result is already an input column")
+    used = {quantity for name in outputs for quantity in physics_engine.units(physics_engine.get_formula(name))}
+    names = [name for name in source.columns if name in used] + list(outputs.values())
+    rows = source.count_rows() if args.output.endswith(".npy") else None
+
+    started = time.perf_counter()
+    writer = Writer(args.output, names, rows)
+    try:
+        count = run(source, outputs, writer, args.chunk_rows, args.workers)
+    finally:
+        writer.close()
+    seconds = time.perf_counter() - started
+    parent, child = peak_memory_mb()
+    print(f"{count} rows, {', '.join(f'{name} -> {column}' for name, column in outputs.items())}; "
+          f"{seconds:.2f} s ({count / seconds:,.0f} rows/s); peak memory {parent:.0f} MB "
+          f"(largest worker {child:.0f} MB)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
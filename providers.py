@@ -0,0 +1,339 @@
+"""Chat providers and the router the GUIs and server send chat through.
+
+A provider is anything with the `ChatClient` interface (`config`,
+`complete`, `stream`, `stats`, `close`).  Three kinds are built in:
+
+- "remote": the OpenAI-compatible API from `chat_client.load_config`
+  (OpenTyphoon unless overridden)
+- "local": an OpenAI-compatible server on this machine (llama.cpp,
+  Ollama, vLLM, `mock_server.py`), at `DOTMINI_LOCAL_URL`
+- "fake": `FakeProvider`, a deterministic in-process stand-in for tests
+  and benchmarks that needs no network
+
+`Router` holds the configured providers.  Each request goes to the
+healthy provider with the lowest recent latency (or the first healthy one
+with `"routing": "failover"`); a provider that fails is skipped for a
+cooldown and the request moves on to the next one.  Providers are listed
+in the config file:
+
+    {"providers": [{"kind": "local", "model": "llama3"}, {"kind": "remote"}]}
+
+or picked by name or kind with `DOTMINI_CHAT_PROVIDERS=local,remote`.
+Without either, chat goes to the remote API alone, as before.
+"""
+import os
+import threading
+import time
+
+import tracing
+from chat_client import ChatCancelled, ChatClient, ChatError, load_config
+
+DEFAULT_LOCAL_URL = "http://127.0.0.1:8080/v1/chat/completions"
+DEFAULT_LOCAL_MODEL = "local"
+# Weight of the newest sample in a provider's moving-average latency
+LATENCY_SMOOTHING = 0.3
+# Seconds a failed provider is skipped, per consecutive failure, and the cap
+COOLDOWN = 5.0
+MAX_COOLDOWN = 120.0
+# Every Nth request goes to the provider measured longest ago, so a
+# provider that was slow once gets a chance to show it has recovered
+PROBE_EVERY = 20
+
+
+class FakeProvider:
+    """Deterministic in-process provider: the reply depends only on the last message.
+
+    `latency` is slept before the first token, `token_delay` between
+    streamed words; every `fail_every`th request raises a 503 `ChatError`.
+    """
+
+    def __init__(self, config=None, latency=0.0, token_delay=0.0, fail_every=0):
+        self.config = dict({"model": "fake", "params": {}, "timeout": 60.0}, **(config or {}))
+        self.latency = latency
+        self.token_delay = token_delay
+        self.fail_every = fail_every
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def reply_for(self, messages):
+        prompt = messages[-1].get("content", "") if messages else ""
+        return f"Fake answer: $F = ma$ relates force and acceleration. ({len(prompt)} chars)"
+
+    def _start(self, messages):
+        with self._lock:
+            self.requests += 1
+            failing = self.fail_every and self.requests % self.fail_every == 0
+        if failing:
+            raise ChatError("Error 503: Unable to communicate with AI.", 503)
+        if self.latency:
+            time.sleep(self.latency)
+        return self.reply_for(messages)
+
+    def complete(self, messages, deadline=None, **params):
+        return self._start(messages)
+
+    def stream(self, messages, deadline=None, cancel=None, **params):
+        reply = self._start(messages)
+        for word in reply.split(" "):
+            if cancel is not None and cancel.is_set():
+                raise ChatCancelled()
+            yield word + " "
+            if self.token_delay:
+                time.sleep(self.token_delay)
+
+    def stats(self):
+        return {"requests": self.requests}
+
+    def close(self):
+        pass
+
+
+def make_provider(kind, overrides=None, base=None):
+    """Build a provider of `kind` ("remote", "local" or "fake").
+
+    `overrides` are config keys for this provider; `base` is the shared
+    config from `load_config`.
+    """
+    overrides = dict(overrides or {})
+    base = base or load_config()
+    if kind == "fake":
+        options = {key: overrides.pop(key) for key in ("latency", "token_delay", "fail_every") if key in overrides}
+        return FakeProvider(overrides, **options)
+    config = dict(base, params=dict(base["params"], **overrides.pop("params", {})))
+    if kind == "local":
+        config.update(
+            url=os.environ.get("DOTMINI_LOCAL_URL", DEFAULT_LOCAL_URL),
+            model=os.environ.get("DOTMINI_LOCAL_MODEL", DEFAULT_LOCAL_MODEL),
+            api_key="",
+            # The next provider is the retry
+            retries=1,
+        )
+    elif kind != "remote":
+        raise ValueError(f"Unknown chat provider kind {kind!r}; expected remote, local or fake")
+    config.update(overrides)
+    return ChatClient(config)
+
+
+class _Health:
+    """Latency and error record of one provider."""
+
+    def __init__(self):
+        self.latency = tracing.Histogram()
+        self.average_ms = None
+        self.errors = 0
+        self.failures = 0
+        self.cooldown_until = 0.0
+        self.last_used = 0.0
+        self.last_error = None
+
+    def succeeded(self, ms):
+        self.latency.add(ms)
+        self.average_ms = ms if self.average_ms is None else (
+            LATENCY_SMOOTHING * ms + (1 - LATENCY_SMOOTHING) * self.average_ms
+        )
+        self.failures = 0
+        self.cooldown_until = 0.0
+
+    def failed(self, error):
+        self.errors += 1
+        self.failures += 1
+        self.last_error = str(error)
+        self.cooldown_until = time.monotonic() + min(MAX_COOLDOWN, COOLDOWN * 2 ** (self.failures - 1))
+
+
+class Router:
+    """Sends each chat request to the best available provider, failing over on errors.
+
+    Has the `ChatClient` interface, so it drops in wherever a client is
+    used.  `config` is the first provider's; the timeout in it is the
+    budget for a request across every provider tried.  After a request,
+    `last_provider` and `last_config` name the provider that answered it;
+    they are per thread, so read them on the thread that made the request.
+    """
+
+    def __init__(self, providers, routing="latency"):
+        if not providers:
+            raise ValueError("Router needs at least one provider")
+        if routing not in ("latency", "failover"):
+            raise ValueError(f"Unknown routing {routing!r}; expected latency or failover")
+        self.providers = dict(providers)
+        self.routing = routing
+        self.health = {name: _Health() for name in self.providers}
+        self.requests = 0
+        self.failovers = 0
+        self._lock = threading.Lock()
+        self._answered = threading.local()
+
+    @property
+    def config(self):
+        return next(iter(self.providers.values())).config
+
+    @property
+    def configs(self):
+        """Every provider's config, in configured order."""
+        return [provider.config for provider in self.providers.values()]
+
+    @property
+    def last_provider(self):
+        """Name of the provider that answered this thread's latest request, or None."""
+        return getattr(self._answered, "name", None)
+
+    @property
+    def last_config(self):
+        name = self.last_provider
+        return None if name is None else self.providers[name].config
+
+    def order(self):
+        """Provider names in the order the next request will try them."""
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            names = list(self.providers)
+            if self.routing == "latency":
+                # Unmeasured providers sort first so each is measured once
+                names.sort(key=lambda name: self.health[name].average_ms or 0.0)
+                if self.requests % PROBE_EVERY == 0:
+                    stalest = min(names, key=lambda name: self.health[name].last_used)
+                    names.remove(stalest)
+                    names.insert(0, stalest)
+            # Providers cooling down after a failure go last, soonest available first
+            cooling = sorted((name for name in names if self.health[name].cooldown_until > now),
+                             key=lambda name: self.health[name].cooldown_until)
+            return [name for name in names if name not in cooling] + cooling
+
+    def _succeeded(self, name, started):
+        self._answered.name = name
+        ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.health[name].succeeded(ms)
+
+    def _failed(self, name, error):
+        with self._lock:
+            self.health[name].failed(error)
+
+    def _attempts(self, deadline):
+        """Yield (name, provider, remaining budget) for each provider worth trying."""
+        self._answered.name = None
+        budget = deadline if deadline is not None else self.config["timeout"]
+        expires = time.monotonic() + budget
+        for index, name in enumerate(self.order()):
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                return
+            with self._lock:
+                self.failovers += bool(index)
+                self.health[name].last_used = time.monotonic()
+            yield name, self.providers[name], remaining
+
+    def _exhausted(self, errors):
+        if not errors:
+            return ChatError("Error: request deadline exceeded")
+        status = errors[-1][1].status
+        return ChatError("; ".join(f"{name}: {error}" for name, error in errors), status)
+
+    def complete(self, messages, deadline=None, **params):
+        errors = []
+        for name, provider, remaining in self._attempts(deadline):
+            started = time.perf_counter()
+            token = tracing.begin(f"provider.{name}")
+            try:
+                reply = provider.complete(messages, deadline=remaining, **params)
+            except ChatError as e:
+                tracing.end(token, error=str(e))
+                self._failed(name, e)
+                errors.append((name, e))
+                continue
+            tracing.end(token)
+            self._succeeded(name, started)
+            return reply
+        raise self._exhausted(errors)
+
+    def stream(self, messages, deadline=None, cancel=None, **params):
+        """Stream from the first provider that yields a token; latency is time to first token.
+
+        Failover only happens before the first token, since the caller has
+        already shown earlier fragments.
+        """
+        errors = []
+        for name, provider, remaining in self._attempts(deadline):
+            started = time.perf_counter()
+            token = tracing.begin(f"provider.{name}")
+            fragments = provider.stream(messages, deadline=remaining, cancel=cancel, **params)
+            try:
+                first = next(fragments, None)
+            except ChatError as e:
+                tracing.end(token, error=str(e))
+                self._failed(name, e)
+                errors.append((name, e))
+                continue
+            tracing.end(token)
+            self._succeeded(name, started)
+            if first is not None:
+                yield first
+            try:
+                yield from fragments
+            except ChatError as e:
+                self._failed(name, e)
+                raise
+            return
+        raise self._exhausted(errors)
+
+    def stats(self):
+        """Per-provider request, error and latency figures, plus the provider's own counters."""
+        now = time.monotonic()
+        with self._lock:
+            providers = {}
+            for name, provider in self.providers.items():
+                health = self.health[name]
+                summary = health.latency.summary()
+                providers[name] = {
+                    "model": provider.config["model"],
+                    "successes": summary["count"],
+                    "errors": health.errors,
+                    "average_ms": health.average_ms,
+                    "p50_ms": summary["p50_ms"],
+                    "p95_ms": summary["p95_ms"],
+                    "max_ms": summary["max_ms"],
+                    "cooling_down_s": max(0.0, health.cooldown_until - now),
+                    "last_error": health.last_error,
+                    "client": provider.stats(),
+                }
+            return {"requests": self.requests, "failovers": self.failovers,
+                    "routing": self.routing, "providers": providers}
+
+    def close(self):
+        for provider in self.providers.values():
+            provider.close()
+
+
+def load_router(config=None):
+    """Build a `Router` from the config's "providers" list and `DOTMINI_CHAT_PROVIDERS`."""
+    config = config or load_config()
+    entries = [dict(entry) for entry in config.get("providers") or [{"kind": "remote"}]]
+    for entry in entries:
+        entry.setdefault("name", entry.get("kind", "remote"))
+    selected = os.environ.get("DOTMINI_CHAT_PROVIDERS")
+    if selected:
+        by_name = {entry["name"]: entry for entry in entries}
+        entries = [by_name.get(name.strip(), {"name": name.strip(), "kind": name.strip()})
+                   for name in selected.split(",") if name.strip()]
+    base = {key: value for key, value in config.items() if key not in ("providers", "routing")}
+    providers = {}
+    for entry in entries:
+        overrides = {key: value for key, value in entry.items() if key not in ("name", "kind")}
+        providers[entry["name"]] = make_provider(entry.get("kind", "remote"), overrides, base)
+    routing = os.environ.get("DOTMINI_CHAT_ROUTING") or config.get("routing", "latency")
+    return Router(providers, routing)
+
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_provider():
+    """Return the process-wide `Router` built by `load_router`."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = load_router()
+        return _router
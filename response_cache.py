@@ -0,0 +1,150 @@
+"""Two-tier cache for AI chat answers.
+
+Answers are keyed on the normalized prompt plus the model and sampling
+parameters.  An in-memory LRU sits in front of a SQLite file so that a
+classroom asking the same question repeatedly only pays for one upstream
+completion, even across restarts.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "opengenphysx", "chat_cache.sqlite3")
+
+
+# Typographic quotes and apostrophes that keyboards and phones substitute
+_QUOTES = str.maketrans("‘’“”", "''\"\"")
+
+
+def normalize_prompt(text):
+    """Case-fold and normalize whitespace, quotes and punctuation so trivial variants share a key.
+
+    Only spelling-neutral differences are removed: "elastic" and
+    "inelastic", or "2 kg" and "5 kg", always stay different keys.
+    """
+    text = re.sub(r"\s+", " ", text.casefold().translate(_QUOTES)).strip()
+    text = re.sub(r" (?=[,;:?!])", "", text)
+    return text.rstrip(" ?!.")
+
+
+class ResponseCache:
+    """LRU in front of a SQLite store, with TTL, size caps and hit/miss counters."""
+
+    def __init__(self, path=DEFAULT_PATH, max_memory=256, max_disk=10000,
+                 ttl=7 * 24 * 3600):
+        self.path = path
+        self.max_memory = max_memory
+        self.max_disk = max_disk
+        self.ttl = ttl
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._puts = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._db = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, bucket TEXT, prompt TEXT, response TEXT, "
+                "created REAL, accessed REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+            self._db.commit()
+
+    @staticmethod
+    def bucket(model, params, context=""):
+        """Identify the model, sampling parameters and fixed prompt context an answer depends on."""
+        return json.dumps([model, params, context], sort_keys=True)
+
+    @staticmethod
+    def key(prompt, bucket):
+        return hashlib.sha256(f"{bucket}\0{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+    def get(self, prompt, model, params, context=""):
+        """Return a cached answer or None.
+
+        `context` is the fixed text sent around `prompt` (instructions,
+        earlier turns); it must match exactly.
+        """
+        bucket = self.bucket(model, params, context)
+        key = self.key(prompt, bucket)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry["created"] < self.ttl:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry["response"]
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] < self.ttl:
+                    self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                    self._db.commit()
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, prompt, model, params, response, context=""):
+        bucket = self.bucket(model, params, context)
+        key = self.key(prompt, bucket)
+        now = time.time()
+        with self._lock:
+            self._remember(key, response, now)
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, bucket, prompt, response, now, now),
+            )
+            self._puts += 1
+            # Expiry and the size cap are enforced periodically rather than on every write
+            if self._puts % 64 == 1:
+                self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                    "ORDER BY accessed DESC LIMIT -1 OFFSET ?)", (self.max_disk,)
+                )
+            self._db.commit()
+
+    def _remember(self, key, response, created):
+        self._memory[key] = {"response": response, "created": created}
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,363 @@
+"""Run SymPy work on user-typed expressions in killable worker processes.
+
+Simplifying arbitrary text can pin a core or eat memory indefinitely
+(try `9**9**9**9`), so the GUI and the compute server never run it
+in-process.  The workers only bound CPU and memory: keeping typed text
+from calling into Python is `symbolic.parse`'s job, which accepts only
+names, numbers and operators and resolves only whitelisted names.
+`SymbolicPool` keeps pre-warmed workers (SymPy imported and exercised
+once), sends each job to an idle one and returns a
+`concurrent.futures.Future`.  On Linux allocations past the memory limit
+fail inside the worker (RLIMIT_AS); a manager thread kills and replaces
+any worker that exceeds the job's wall-clock timeout or, as a fallback,
+the polled RSS limit, and recycles workers after `max_jobs` jobs so slow
+leaks can't accumulate.
+
+    pool = get_pool()
+    pool.submit("derivative", "x**2 * sin(x)", "x").result()  # 'x**2*cos(x) + 2*x*sin(x)'
+"""
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+
+DEFAULT_TIMEOUT = 10.0
+# Memory a worker may allocate beyond its warmed-up size (bytes)
+DEFAULT_MEMORY_LIMIT = 512 * 1024 * 1024
+# Jobs a worker runs before it is replaced by a fresh one
+MAX_JOBS_PER_WORKER = 500
+# How often running jobs are checked against their limits (seconds)
+POLL_INTERVAL = 0.05
+
+
+class SandboxError(Exception):
+    """A job could not finish inside its worker."""
+
+
+class SandboxTimeout(SandboxError):
+    pass
+
+
+class SandboxMemoryError(SandboxError):
+    pass
+
+
+def _derivative(expression, variables="x", order=1):
+    import symbolic
+    return str(symbolic.derivative(expression, variables, order))
+
+
+def _check(expression, variables="x", order=1):
+    """Parse `expression` and build its numeric forms up to `order`; returns the canonical text."""
+    import symbolic
+    for n in range(order + 1):
+        symbolic.numeric(expression, variables, n)
+    return str(symbolic.parse(expression))
+
+
+def _evaluate(expression, variables, *values, order=0):
+    import symbolic
+    return symbolic.evaluate(expression, variables, *values, order=order)
+
+
+def _antiderivative(expression, variable, start, upper):
+    """Numerical integral of `expression` from `start` to each of `upper`."""
+    import calculus
+    import symbolic
+    return calculus.integrate(lambda t: symbolic.evaluate(expression, variable, t), start, upper)[0]
+
+
+def _calculus(method, operation, expression, variable, *args):
+    import calculus
+    return calculus.compute(method, operation, expression, variable, *args)
+
+
+# Jobs are named rather than passed as callables so only these can run in a worker
+JOBS = {
+    "derivative": _derivative,
+    "check": _check,
+    "evaluate": _evaluate,
+    "antiderivative": _antiderivative,
+    "calculus": _calculus,
+}
+
+
+def _limit_memory(limit):
+    """Cap this process's address space at its current size plus `limit` bytes.
+
+    Only where `resource.RLIMIT_AS` exists and the current size can be read
+    from /proc (Linux); elsewhere the pool's RSS poll is the only check.
+    """
+    try:
+        import resource
+        size = _address_space(os.getpid())
+        if not limit or size is None:
+            return
+        soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        cap = size + limit if hard == resource.RLIM_INFINITY else min(size + limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (cap, hard))
+    except (ImportError, AttributeError, ValueError, OSError):
+        pass
+
+
+def _serve(conn, memory_limit=0):
+    """Worker main loop: run (name, args, kwargs) jobs until the pipe closes."""
+    _check("x**2")
+    # Set after warming up, so the cap counts only what jobs allocate
+    _limit_memory(memory_limit)
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        name, args, kwargs = message
+        try:
+            reply = ("ok", JOBS[name](*args, **kwargs))
+        except ValueError as e:
+            reply = ("value_error", str(e))
+        except MemoryError:
+            reply = ("memory_error", "Expression needs too much memory")
+        except Exception as e:
+            reply = ("error", f"{type(e).__name__}: {e}")
+        conn.send(reply)
+
+
+def _statm(pid, field):
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[field]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _rss(pid):
+    """Resident set size of `pid` in bytes, or None where /proc is unavailable."""
+    return _statm(pid, 1)
+
+
+def _address_space(pid):
+    """Virtual memory size of `pid` in bytes, or None where /proc is unavailable."""
+    return _statm(pid, 0)
+
+
+def _context():
+    # forkserver forks each worker from a process that already imported SymPy,
+    # without inheriting the GUI's threads
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["symbolic"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+class _Worker:
+    def __init__(self, context, memory_limit=0):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, memory_limit), daemon=True,
+                                       name="sympy-worker")
+        self.process.start()
+        child.close()
+        self.job = None
+        self.started = 0.0
+        self.deadline = None
+        self.jobs = 0
+
+    def stop(self, kill=False):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class SymbolicPool:
+    """Pre-warmed SymPy worker processes with per-job timeouts and memory caps.
+
+    On Linux each worker's address space is capped with RLIMIT_AS at its
+    warmed-up size plus `memory_limit`, so a runaway allocation fails with
+    SandboxMemoryError instead of racing the poll.  Elsewhere the cap is
+    advisory: the resident size is polled every POLL_INTERVAL where it can
+    be read (not at all on macOS and Windows), and a fast allocation can
+    overshoot it between polls.
+    """
+
+    def __init__(self, workers=None, timeout=DEFAULT_TIMEOUT, memory_limit=DEFAULT_MEMORY_LIMIT,
+                 max_jobs=MAX_JOBS_PER_WORKER):
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_jobs = max_jobs
+        self._context = _context()
+        self._workers = [_Worker(self._context, memory_limit) for _ in range(workers or os.cpu_count() or 1)]
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._wake_reader, self._wake_writer = multiprocessing.Pipe(duplex=False)
+        self._closed = False
+        self.completed = 0
+        self.timeouts = 0
+        self.memory_kills = 0
+        self.recycled = 0
+        self._manager = threading.Thread(target=self._run, name="sympy-pool", daemon=True)
+        self._manager.start()
+
+    def submit(self, name, *args, timeout=None, **kwargs):
+        """Queue job `name` from `JOBS` and return a Future for its result.
+
+        The future raises ValueError for invalid expressions, SandboxTimeout
+        after `timeout` seconds (default the pool's) and SandboxMemoryError
+        when the worker exceeds the memory limit.
+        """
+        if name not in JOBS:
+            raise KeyError(f"Unknown job {name!r}; expected one of {sorted(JOBS)}")
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SymbolicPool is closed")
+            self._pending.append((future, name, args, kwargs, self.timeout if timeout is None else timeout))
+        self._wake_writer.send(None)
+        return future
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._closed:
+                    break
+                self._dispatch()
+            busy = [worker.conn for worker in self._workers if worker.job is not None]
+            for conn in wait(busy + [self._wake_reader], POLL_INTERVAL):
+                if conn is self._wake_reader:
+                    while self._wake_reader.poll():
+                        self._wake_reader.recv()
+                else:
+                    self._receive(next(w for w in self._workers if w.conn is conn))
+            self._enforce_limits()
+
+    def _dispatch(self):
+        for worker in self._workers:
+            if not self._pending:
+                return
+            if worker.job is not None:
+                continue
+            future, name, args, kwargs, timeout = self._pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                worker.conn.send((name, args, kwargs))
+            except OSError:
+                future.set_exception(SandboxError("Symbolic worker exited unexpectedly"))
+                self._replace(worker)
+                continue
+            worker.job = future
+            worker.started = time.monotonic()
+            worker.deadline = worker.started + timeout if timeout else None
+
+    def _receive(self, worker):
+        future, worker.job = worker.job, None
+        try:
+            status, value = worker.conn.recv()
+        except (EOFError, OSError):
+            future.set_exception(SandboxError("Symbolic worker exited unexpectedly"))
+            self._replace(worker)
+            return
+        self.completed += 1
+        if status == "ok":
+            future.set_result(value)
+        elif status == "value_error":
+            future.set_exception(ValueError(value))
+        elif status == "memory_error":
+            self.memory_kills += 1
+            future.set_exception(SandboxMemoryError(value))
+        else:
+            future.set_exception(SandboxError(value))
+        worker.jobs += 1
+        rss = _rss(worker.process.pid)
+        # A worker that hit its address-space cap may have left memory fragmented; start afresh
+        if (status == "memory_error" or worker.jobs >= self.max_jobs
+                or (rss is not None and self.memory_limit and rss > self.memory_limit)):
+            self.recycled += 1
+            self._replace(worker)
+
+    def _enforce_limits(self):
+        now = time.monotonic()
+        for worker in self._workers:
+            if worker.job is None:
+                continue
+            if worker.deadline is not None and now > worker.deadline:
+                self.timeouts += 1
+                error = SandboxTimeout(f"Gave up after {now - worker.started:.1f} s")
+            elif not worker.process.is_alive():
+                error = SandboxError("Symbolic worker exited unexpectedly")
+            else:
+                rss = _rss(worker.process.pid)
+                if rss is None or not self.memory_limit or rss <= self.memory_limit:
+                    continue
+                self.memory_kills += 1
+                error = SandboxMemoryError(f"Used more than {self.memory_limit // 2 ** 20} MB")
+            worker.job.set_exception(error)
+            worker.job = None
+            self._replace(worker, kill=True)
+
+    def _replace(self, worker, kill=False):
+        index = self._workers.index(worker)
+        worker.stop(kill=kill)
+        self._workers[index] = _Worker(self._context, self.memory_limit)
+
+    def stats(self):
+        return {
+            "workers": len(self._workers),
+            "pending": len(self._pending),
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "memory_kills": self.memory_kills,
+            "recycled": self.recycled,
+        }
+
+    def close(self):
+        """Stop the workers; queued jobs fail with SandboxError."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending, self._pending = self._pending, deque()
+        self._wake_writer.send(None)
+        self._manager.join()
+        for future, *_ in pending:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(SandboxError("SymbolicPool closed"))
+        for worker in self._workers:
+            if worker.job is not None:
+                worker.job.set_exception(SandboxError("SymbolicPool closed"))
+            worker.stop(kill=worker.job is not None)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide `SymbolicPool`, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SymbolicPool(workers=min(4, os.cpu_count() or 1))
+        return _pool
+
+
+def close_pool():
+    """Stop the process-wide pool if it was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,276 @@
+"""Headless JSON compute service for serving a whole school from one box.
+
+Exposes the physics formulas, the symbolic derivative pipeline, the
+calculus engine (integrals, limits, series, roots), the projectile simulator and the AI chat proxy over HTTP/1.1 keep-alive using
+only asyncio (no Qt).  SymPy work runs in sandboxed worker processes
+(see sandbox.py) so one slow derivative cannot stall other requests and a
+runaway one is killed; chat calls run on threads.
+
+    python server.py --port 8000 --workers 4
+    curl -d '{"formula": "force", "inputs": {"mass": [1, 2], "acceleration": 9.81}}' localhost:8000/calculate
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+
+import numpy as np
+
+import physics_engine
+import trajectory
+from calculus import CalculusEngine, arguments
+from chat_client import ChatError
+from providers import get_provider
+from sandbox import SandboxError, SandboxTimeout, SymbolicPool
+
+# Largest accepted request body (bytes)
+MAX_BODY = 1 << 20
+# Seconds a single symbolic job may take before the request fails
+SYMBOLIC_TIMEOUT = 10.0
+# Headers accepted per request
+MAX_HEADERS = 100
+# Projectile requests: trajectories per request, integration steps per
+# trajectory, and recorded path samples (steps x trajectories)
+MAX_TRAJECTORIES = 10_000
+MAX_STEPS = 100_000
+MAX_PATH_SAMPLES = 1_000_000
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 502: "Bad Gateway",
+           504: "Gateway Timeout"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def to_json(value):
+    """Convert NumPy values to JSON-safe Python values (non-finite floats become null)."""
+    if isinstance(value, np.ndarray):
+        return [to_json(item) for item in value.tolist()] if value.ndim else to_json(value.item())
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    if isinstance(value, (float, np.floating)):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+class ComputeService:
+    """Request handlers; `routes` maps (method, path) to a coroutine taking the JSON body."""
+
+    def __init__(self, workers=None):
+        self.pool = SymbolicPool(workers, timeout=SYMBOLIC_TIMEOUT)
+        self.calculus = CalculusEngine(self.pool)
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/formulas"): self.formulas,
+            ("POST", "/calculate"): self.calculate,
+            ("POST", "/derivative"): self.derivative,
+            ("POST", "/calculus"): self.calculus_query,
+            ("POST", "/projectile"): self.projectile,
+            ("POST", "/chat"): self.chat,
+            ("GET", "/chat/providers"): self.chat_providers,
+        }
+
+    async def health(self, body):
+        return {"status": "ok"}
+
+    async def formulas(self, body):
+        return {
+            name: {"label": formula.label, "inputs": formula.inputs, "output": formula.output,
+                   "unit": formula.unit, "expression": formula.expression}
+            for name, formula in physics_engine.FORMULAS.items()
+        }
+
+    async def calculate(self, body):
+        try:
+            result = physics_engine.evaluate(body["formula"], **body.get("inputs", {}))
+        except KeyError as e:
+            raise HTTPError(400, e.args[0])
+        return {"name": result.name, "label": result.label, "value": result.value, "unit": result.unit}
+
+    async def derivative(self, body):
+        if "expression" not in body:
+            raise HTTPError(400, "expression is required")
+        job = self.pool.submit("derivative", body["expression"], body.get("variable", "x"), int(body.get("order", 1)))
+        try:
+            derivative = await asyncio.wrap_future(job)
+        except SandboxTimeout:
+            raise HTTPError(504, "Derivative took too long")
+        except SandboxError as e:
+            raise HTTPError(500, str(e))
+        return {"derivative": derivative}
+
+    async def calculus_query(self, body):
+        if "expression" not in body or "operation" not in body:
+            raise HTTPError(400, "expression and operation are required")
+        # Bounds may be JSON lists, which are integrated as one batch
+        lower, upper = (", ".join(map(str, value)) if isinstance(value, list) else str(value)
+                        for value in (body.get("lower", ""), body.get("upper", "")))
+        args = arguments(body["operation"], lower, upper, str(body.get("order", "")))
+        try:
+            result = await asyncio.wrap_future(
+                self.calculus.submit(body["operation"], body["expression"], body.get("variable", "x"), *args)
+            )
+        except SandboxTimeout:
+            raise HTTPError(504, "Calculation took too long")
+        except SandboxError as e:
+            raise HTTPError(500, str(e))
+        return {"value": result.value, "text": result.text, "method": result.method}
+
+    async def projectile(self, body):
+        options = {key: body[key] for key in ("height", "drag", "method") if key in body}
+        dt = float(body.get("dt", 0.01))
+        if not math.isfinite(dt) or dt <= 0:
+            raise HTTPError(400, "dt must be a positive number")
+        count = np.broadcast(*(np.asarray(body.get(key, 0), dtype=float)
+                               for key in ("speed", "angle", "height", "drag"))).size
+        if count < 1:
+            raise HTTPError(400, "speed and angle must not be empty")
+        if count > MAX_TRAJECTORIES:
+            raise HTTPError(400, f"At most {MAX_TRAJECTORIES} trajectories per request")
+        # Steps at dt until the slowest launch lands, from its drag-free flight time
+        with np.errstate(invalid="ignore"):
+            flight_time = trajectory.analytic(*(np.asarray(body.get(key, 0.0), dtype=float)
+                                                for key in ("speed", "angle", "height"))).flight_time
+        steps = int(np.nanmax(np.ceil(np.atleast_1d(flight_time) / dt), initial=0)) + 1
+        if steps > MAX_STEPS:
+            raise HTTPError(400, f"dt is too small: landing takes about {steps} steps, over the limit of {MAX_STEPS}")
+        record = bool(body.get("path"))
+        # Recorded paths hold one sample per step per trajectory
+        if record and steps * count > MAX_PATH_SAMPLES:
+            raise HTTPError(400, f"Recorded paths would hold about {steps * count} samples, over the limit of "
+                                 f"{MAX_PATH_SAMPLES}; use a larger dt or fewer launches")
+        # Drag can still stretch a flight past the estimate; those launches are flagged truncated
+        max_steps = min(MAX_STEPS, MAX_PATH_SAMPLES // count) if record else MAX_STEPS
+        result = await asyncio.to_thread(
+            trajectory.simulate, body["speed"], body["angle"], dt=dt, max_steps=max_steps,
+            record=record, **options
+        )
+        response = {"range": result.range, "apex": result.apex, "flight_time": result.flight_time,
+                    "truncated": np.asarray(np.isnan(result.flight_time))}
+        if result.x is not None:
+            response.update(t=result.t.T, x=result.x.T, y=result.y.T)
+        return response
+
+    async def chat(self, body):
+        if not body.get("message"):
+            raise HTTPError(400, "message is required")
+        try:
+            reply = await asyncio.to_thread(
+                get_provider().complete, [{"role": "user", "content": body["message"]}]
+            )
+        except ChatError as e:
+            raise HTTPError(502, str(e))
+        return {"response": reply}
+
+    async def chat_providers(self, body):
+        return get_provider().stats()
+
+    async def dispatch(self, method, path, raw_body):
+        handler = self.routes.get((method, path))
+        if handler is None:
+            known = any(route_path == path for _, route_path in self.routes)
+            raise HTTPError(405 if known else 404, f"No route for {method} {path}")
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            raise HTTPError(400, "Request body must be JSON")
+        try:
+            return await handler(body)
+        except HTTPError:
+            raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise HTTPError(400, f"Invalid request: {e}")
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one keep-alive connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while len(headers) <= MAX_HEADERS:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = headers.get("content-length", "0")
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                # The body can't be skipped reliably after a bad header, so those close the connection
+                if len(headers) > MAX_HEADERS:
+                    status, payload, keep_alive = 400, {"error": "Too many headers"}, False
+                # isdigit() also accepts digits like "²" that int() rejects
+                elif not (length.isascii() and length.isdecimal()):
+                    status, payload, keep_alive = 400, {"error": "Invalid Content-Length"}, False
+                elif int(length) > MAX_BODY:
+                    status, payload, keep_alive = 413, {"error": "Request body too large"}, False
+                else:
+                    length = int(length)
+                    raw_body = await reader.readexactly(length) if length else b""
+                    try:
+                        status, payload = 200, await self.dispatch(method, target.split("?")[0], raw_body)
+                    except HTTPError as e:
+                        status, payload = e.status, {"error": str(e)}
+                    except Exception as e:
+                        status, payload = 500, {"error": str(e)}
+                data = json.dumps(to_json(payload)).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            # ValueError: a line longer than the reader's limit
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.close()
+
+
+async def serve(host="127.0.0.1", port=8000, workers=None, ready=None):
+    """Run the service until cancelled; `ready` is an optional asyncio.Event set once listening."""
+    service = ComputeService(workers)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    if ready is not None:
+        ready.set()
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless OpenGenPhysX compute service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="SymPy worker processes")
+    args = parser.parse_args()
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
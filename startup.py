@@ -0,0 +1,82 @@
+"""Startup timing and background warm-up for main.py.
+
+Import this module first so `PROCESS_START` is as close to interpreter
+start as possible.  `python main.py --startup-report` prints the phase
+timings up to the first paint plus an `-X importtime` breakdown of
+`import main`, then exits, so startup regressions can be tracked.
+"""
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+
+PROCESS_START = time.perf_counter()
+
+# Modules imported by `warm_up` once the window is visible
+WARM_MODULES = ["numpy", "physics_engine", "plotting", "trajectory", "sympy", "symbolic",
+                "matplotlib.figure", "matplotlib.backends.backend_agg"]
+
+phases = []
+
+
+def mark(name):
+    """Record `name` at the current time since process start."""
+    phases.append((name, time.perf_counter() - PROCESS_START))
+
+
+def warm_up(modules=WARM_MODULES):
+    """Import heavy modules on a daemon thread so first use doesn't pay for them."""
+    def run():
+        started = time.perf_counter()
+        for name in modules:
+            importlib.import_module(name)
+        phases.append(("background warm-up done", time.perf_counter() - PROCESS_START))
+        phases.append(("background warm-up duration", time.perf_counter() - started))
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def import_breakdown(module="main", top=15):
+    """Run `python -X importtime -c "import <module>"` and return the slowest top-level imports.
+
+    Returns (name, self_us, cumulative_us) tuples sorted by cumulative time.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=False,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    rows, children = [], []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nesting is shown as two spaces per level after the separator's own space;
+        # children are printed before the module that imported them
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        row = (name.strip(), int(self_us), int(cumulative_us))
+        if level == 1:
+            children.append(row)
+        elif level == 0:
+            if row[0] == module:
+                rows = children + [row]
+            children = []
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows[:top]
+
+
+def report(module="main"):
+    """Human-readable startup report."""
+    lines = ["Startup phases (seconds since process start):"]
+    lines += [f"  {seconds:8.3f}  {name}" for name, seconds in phases]
+    lines.append(f"Slowest imports of {module!r} (-X importtime, ms):")
+    lines.append(f"  {'cumulative':>10}  {'self':>8}  module")
+    lines += [
+        f"  {cumulative / 1000:10.1f}  {self_us / 1000:8.1f}  {name}"
+        for name, self_us, cumulative in import_breakdown(module)
+    ]
+    return "\n".join(lines)
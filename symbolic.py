@@ -0,0 +1,230 @@
+"""Memoized SymPy pipeline for the Calculus topic.
+
+Parsing, differentiation, integration, limits, series, solving and
+`lambdify` are each cached by canonical expression string and variables,
+so a function typed once can be differentiated, plotted and evaluated over
+millions of points without re-parsing.  Parsing accepts only names,
+numbers and arithmetic operators and resolves only the names in
+`ALLOWED_NAMES`, so untrusted text cannot call into Python.  The closed-form
+operations return None when SymPy finds no answer, leaving the numerical
+fallback to `calculus`.
+"""
+import io
+import keyword
+import re
+import tokenize
+from functools import lru_cache
+from tokenize import TokenError
+
+import numpy as np
+import sympy as sp
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations
+
+CACHE_SIZE = 256
+
+# Names an expression may use; any other name becomes a symbol (or an
+# undefined function when called), so typed text never reaches Python builtins
+ALLOWED_NAMES = (
+    "sin cos tan cot sec csc asin acos atan atan2 acot sinh cosh tanh coth asinh acosh atanh "
+    "exp log ln sqrt cbrt root Abs sign floor ceiling factorial binomial gamma erf Heaviside "
+    "Min Max Piecewise pi E I oo zoo nan"
+).split()
+# The parser's generated code refers to these
+_PARSER_NAMES = ("Symbol", "Function", "Integer", "Float", "Rational")
+_GLOBALS = {name: getattr(sp, name) for name in ALLOWED_NAMES + list(_PARSER_NAMES)}
+_GLOBALS.update(abs=sp.Abs, __builtins__={})
+# Everything an expression may contain besides names and numbers.  String
+# literals are left out on purpose: SymPy functions sympify (and so eval)
+# string arguments, and strings can spell out anything the names can't.
+_OPERATORS = frozenset("+ - * / ** ( ) , ^ % ! < > <= >=".split())
+_LAYOUT = (tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER)
+
+
+def canonical(expression):
+    """Canonical cache key for an expression string: `^` as `**`, whitespace collapsed."""
+    return re.sub(r"\s+", " ", expression.replace("^", "**")).strip()
+
+
+def canonical_variables(variables):
+    """Accept "x", "x, y", "x y" or a sequence of names and return a tuple of names."""
+    if isinstance(variables, str):
+        variables = re.split(r"[\s,]+", variables.strip())
+    names = tuple(name for name in variables if name)
+    if not names:
+        raise ValueError("Please enter a variable.")
+    for name in names:
+        if not _safe_name(name):
+            raise ValueError(f"{name!r} is not a valid variable name.")
+    return names
+
+
+def _safe_name(name):
+    return name.isidentifier() and not keyword.iskeyword(name) and "__" not in name
+
+
+def _check_tokens(expression):
+    """Raise ValueError unless `expression` is only names, numbers and arithmetic operators."""
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(expression).readline))
+    except (TokenError, SyntaxError) as e:
+        raise ValueError(f"Could not parse expression {expression!r}: {e}") from None
+    for token in tokens:
+        if token.type in _LAYOUT or token.type == tokenize.NUMBER:
+            continue
+        if token.type == tokenize.NAME and (_safe_name(token.string) or token.string in ("True", "False")):
+            continue
+        # "!" (factorial) is an error token to Python's tokenizer before 3.12
+        if token.type in (tokenize.OP, tokenize.ERRORTOKEN) and token.string in _OPERATORS:
+            continue
+        raise ValueError(f"Unsupported syntax in expression {expression!r}: {token.string!r}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(expression):
+    """Parse `expression` without `eval` reaching anything outside `ALLOWED_NAMES`."""
+    _check_tokens(expression)
+    try:
+        return parse_expr(expression, local_dict={}, global_dict=dict(_GLOBALS),
+                          transformations=standard_transformations)
+    except (SyntaxError, TokenError, TypeError, AttributeError) as e:
+        raise ValueError(f"Could not parse expression {expression!r}: {e}") from None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _symbols(names):
+    return tuple(sp.Symbol(name) for name in names)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _derivative(expression, names, order):
+    if order == 0:
+        return _parse(expression)
+    # Build higher orders from the cached lower order so d2 reuses d1
+    return sp.diff(_derivative(expression, names, order - 1), *_symbols(names))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _lambdified(expression, names, order):
+    expr = _derivative(expression, names, order)
+    symbols = _symbols(names)
+    unknown = expr.free_symbols - set(symbols)
+    if unknown:
+        raise ValueError(f"Expression has unbound symbols: {', '.join(sorted(map(str, unknown)))}")
+    function = sp.lambdify(symbols, expr, modules="numpy")
+    if expr.free_symbols:
+        return function
+    # Constant expressions would otherwise return a scalar for array input
+    constant = float(expr)
+    return lambda *args: np.full(np.broadcast(*args).shape, constant)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _solved(expression, output, unknown, names):
+    """Solve `output = expression` for `unknown` and lambdify each root over `names`."""
+    roots = sp.solve(sp.Eq(sp.Symbol(output), _parse(expression)), sp.Symbol(unknown))
+    return tuple(sp.lambdify(_symbols(names), root, modules="numpy") for root in roots)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _integral(expression, name, lower, upper):
+    x = sp.Symbol(name)
+    if lower is None:
+        result = sp.integrate(_parse(expression), x)
+    else:
+        result = sp.integrate(_parse(expression), (x, _parse(lower), _parse(upper)))
+    return None if result.has(sp.Integral) else result
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _limit(expression, name, point, direction):
+    result = sp.limit(_parse(expression), sp.Symbol(name), _parse(point), direction)
+    if isinstance(result, sp.AccumBounds):
+        raise ValueError(f"The limit does not exist (the function oscillates within {result})")
+    if result is sp.zoo:
+        raise ValueError("The limit does not exist (the one-sided limits are infinite with opposite signs)")
+    return None if result.has(sp.Limit) else result
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _series(expression, name, point, order):
+    return sp.series(_parse(expression), sp.Symbol(name), _parse(point), order).removeO()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _roots(expression, name, lower, upper):
+    roots = sp.solveset(_parse(expression), sp.Symbol(name), sp.Interval(_parse(lower), _parse(upper)))
+    if not isinstance(roots, sp.FiniteSet) or not all(root.is_real for root in roots):
+        return None
+    return tuple(sorted(roots, key=float))
+
+
+def parse(expression):
+    """Return the SymPy expression for `expression`."""
+    return _parse(canonical(expression))
+
+
+def derivative(expression, variables="x", order=1):
+    """Return the `order`-th derivative of `expression`.
+
+    Several variables give a mixed partial per order, e.g.
+    `derivative("x**2*y**3", "x, y")` is d²/dxdy.
+    """
+    return _derivative(canonical(expression), canonical_variables(variables), order)
+
+
+def numeric(expression, variables="x", order=0):
+    """Return a NumPy-vectorized callable for `expression` (or its derivative)."""
+    return _lambdified(canonical(expression), canonical_variables(variables), order)
+
+
+def evaluate(expression, variables, *values, order=0):
+    """Evaluate `expression` (or its derivative) on array `values`, one per variable."""
+    arrays = [np.asarray(value, dtype=float) for value in values]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray(numeric(expression, variables, order)(*arrays), dtype=float)
+
+
+def integral(expression, variable="x", lower=None, upper=None):
+    """Antiderivative of `expression`, or its definite integral when bounds are given; None if not found."""
+    if lower is not None:
+        lower, upper = canonical(lower), canonical(upper)
+    return _integral(canonical(expression), canonical_variables(variable)[0], lower, upper)
+
+
+def limit(expression, variable="x", point="0", direction="+-"):
+    """Limit of `expression` at `point` from `direction` ("+", "-" or "+-"); None if not found."""
+    return _limit(canonical(expression), canonical_variables(variable)[0], canonical(point), direction)
+
+
+def series(expression, variable="x", point="0", order=6):
+    """Taylor polynomial of `expression` about `point`, without terms of degree `order` and above."""
+    return _series(canonical(expression), canonical_variables(variable)[0], canonical(point), order)
+
+
+def roots(expression, variable="x", lower="-10", upper="10"):
+    """Sorted real roots of `expression` in [lower, upper]; None unless SymPy finds them all exactly."""
+    return _roots(canonical(expression), canonical_variables(variable)[0], canonical(lower), canonical(upper))
+
+
+def solutions(expression, output, unknown, variables):
+    """Vectorized callables, one per root, giving `unknown` from `variables` where `output = expression`.
+
+    Used by `physics_engine` to solve a formula for any of its quantities;
+    each (formula, unknown) pair is solved symbolically only once.
+    """
+    return _solved(canonical(expression), output, unknown, canonical_variables(variables))
+
+
+def stats():
+    """Hit/miss counters for each cache stage."""
+    return {
+        name: function.cache_info()._asdict()
+        for name, function in [("parse", _parse), ("derivative", _derivative),
+                               ("lambdify", _lambdified), ("solve", _solved), ("integral", _integral),
+                               ("limit", _limit), ("series", _series), ("roots", _roots)]
+    }
+
+
+def clear():
+    for function in (_parse, _symbols, _derivative, _lambdified, _solved, _integral, _limit, _series, _roots):
+        function.cache_clear()
@@ -0,0 +1,94 @@
+import math
+
+import numpy as np
+import pytest
+
+import calculus
+
+
+def test_integrate_finite_interval():
+    value, error = calculus.integrate(np.sin, 0.0, np.pi)
+    assert value == pytest.approx(2.0, rel=1e-10)
+    assert error < 1e-8
+
+
+def test_integrate_infinite_bounds():
+    value, _ = calculus.integrate(lambda x: np.exp(-x ** 2), -np.inf, np.inf)
+    assert value == pytest.approx(math.sqrt(math.pi), rel=1e-9)
+    value, _ = calculus.integrate(lambda x: 1 / x ** 2, 1.0, np.inf)
+    assert value == pytest.approx(1.0, rel=1e-9)
+
+
+def test_integrate_many_upper_bounds_matches_antiderivative():
+    upper = np.linspace(0.0, 10.0, 101)
+    values, _ = calculus.integrate(np.cos, 0.0, upper)
+    np.testing.assert_allclose(values, np.sin(upper), atol=1e-10)
+
+
+def test_integrate_reversed_bounds_changes_sign():
+    value, _ = calculus.integrate(lambda x: x ** 2, 1.0, 0.0)
+    assert value == pytest.approx(-1 / 3, rel=1e-12)
+
+
+def test_brent():
+    assert calculus.brent(lambda x: x ** 3 - 2, 0.0, 2.0) == pytest.approx(2 ** (1 / 3), abs=1e-12)
+    with pytest.raises(ValueError):
+        calculus.brent(lambda x: x ** 2 + 1, -1.0, 1.0)
+
+
+def test_find_roots():
+    roots = calculus.find_roots(lambda x: x ** 2 - 2, -10, 10)
+    np.testing.assert_allclose(roots, [-math.sqrt(2), math.sqrt(2)], atol=1e-10)
+    roots = calculus.find_roots(np.sin, -4, 4)
+    np.testing.assert_allclose(roots, [-np.pi, 0.0, np.pi], atol=1e-10)
+
+
+def test_find_roots_discards_poles():
+    # tan changes sign across its poles at ±pi/2 but is only zero at 0
+    roots = calculus.find_roots(np.tan, -2, 2)
+    np.testing.assert_allclose(roots, [0.0], atol=1e-10)
+
+
+def test_numeric_limit():
+    assert calculus.numeric_limit(lambda x: np.sin(x) / x, 0.0) == pytest.approx(1.0, rel=1e-8)
+    assert calculus.numeric_limit(lambda x: (1 + 1 / x) ** x, np.inf) == pytest.approx(math.e, rel=1e-5)
+    assert calculus.numeric_limit(lambda x: 1 / x, 0.0, "+") == np.inf
+
+
+def test_numeric_limit_two_sided_mismatch():
+    with pytest.raises(ValueError):
+        calculus.numeric_limit(lambda x: np.abs(x) / x, 0.0)
+
+
+def test_taylor_coefficients():
+    coefficients = calculus.taylor_coefficients(np.exp, 0.0, 6)
+    expected = [1 / math.factorial(k) for k in range(6)]
+    np.testing.assert_allclose(coefficients, expected, rtol=1e-8, atol=1e-12)
+
+
+def test_taylor_coefficients_not_analytic():
+    with pytest.raises(ValueError):
+        calculus.taylor_coefficients(np.abs, 0.0, 4)
+
+
+@pytest.mark.parametrize("operation, args, expected", [
+    ("integral", ("0", "1"), 1 / 3),
+    ("limit", ("0", "+-"), 1.0),
+])
+def test_compute_numeric_agrees_with_symbolic(operation, args, expected):
+    expression = "x**2" if operation == "integral" else "sin(x)/x"
+    symbolic, _ = calculus.compute("symbolic", operation, expression, "x", *args)
+    numeric, text = calculus.compute("numeric", operation, expression, "x", *args)
+    assert float(symbolic) == pytest.approx(expected, rel=1e-9)
+    assert float(numeric) == pytest.approx(expected, rel=1e-8)
+    assert text.startswith("≈")
+
+
+def test_arguments():
+    assert calculus.arguments("derivative", order="2") == (2,)
+    assert calculus.arguments("limit", "0+") == ("0", "+")
+    assert calculus.arguments("integral") == ()
+    with pytest.raises(ValueError):
+        calculus.arguments("integral", "0", "")
+    with pytest.raises(ValueError):
+        calculus.arguments("frobnicate")
@@ -0,0 +1,117 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from chat_client import ChatClient, ChatError, load_config
+
+MESSAGES = [{"role": "user", "content": "What is F = ma?"}]
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answers each POST with the next (status, body) in the server's `replies`."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.server.requests.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+        status, body = self.server.replies.pop(0)
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.replies, server.requests = [], []
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    monkeypatch.setenv("DOTMINI_CHAT_CONFIG", "missing.json")
+    config = load_config()
+    config.update(url=f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions",
+                  api_key="", retries=2, backoff=0.01)
+    client = ChatClient(config)
+    yield client
+    client.close()
+
+
+def sse(*chunks):
+    return b"".join(b"data: " + chunk.encode("utf-8") + b"\n\n" for chunk in chunks)
+
+
+def delta(text):
+    return json.dumps({"choices": [{"delta": {"content": text}}]})
+
+
+def test_complete(server, client):
+    server.replies.append((200, json.dumps({"choices": [{"message": {"content": "F is force."}}]}).encode()))
+    assert client.complete(MESSAGES, temperature=0.1) == "F is force."
+    assert server.requests[0]["temperature"] == 0.1
+    assert server.requests[0]["messages"] == MESSAGES
+
+
+def test_stream_and_connection_reuse(server, client):
+    server.replies += [(200, sse(delta("F "), delta("= ma"), "[DONE]"))] * 2
+    assert list(client.stream(MESSAGES)) == ["F ", "= ma"]
+    assert "".join(client.stream(MESSAGES)) == "F = ma"
+    assert server.requests[0]["stream"] is True
+    assert client.stats()["handshakes_saved"] == 1
+
+
+@pytest.mark.parametrize("body", [
+    sse("not json"),
+    sse("[1, 2]"),
+    sse(json.dumps({"choices": ["oops"]})),
+])
+def test_malformed_stream_chunk_raises_chat_error(server, client, body):
+    server.replies.append((200, body))
+    with pytest.raises(ChatError):
+        list(client.stream(MESSAGES))
+
+
+def test_empty_chunks_are_skipped(server, client):
+    server.replies.append((200, sse(json.dumps({"choices": []}), json.dumps({"choices": [{"delta": None}]}),
+                                    delta("ok"), "[DONE]")))
+    assert list(client.stream(MESSAGES)) == ["ok"]
+
+
+def test_malformed_complete_raises_chat_error(server, client):
+    server.replies.append((200, b"<html>"))
+    with pytest.raises(ChatError):
+        client.complete(MESSAGES)
+
+
+def test_retries_server_errors(server, client):
+    ok = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode()
+    server.replies += [(503, b""), (502, b""), (200, ok)]
+    assert client.complete(MESSAGES) == "ok"
+    assert client.stats()["retries"] == 2
+
+
+def test_gives_up_after_retries(server, client):
+    server.replies += [(503, b"")] * 3
+    with pytest.raises(ChatError) as raised:
+        client.complete(MESSAGES)
+    assert raised.value.status == 503
+    assert client.stats()["requests"] == 3
+
+
+def test_client_errors_are_not_retried(server, client):
+    server.replies.append((401, b""))
+    with pytest.raises(ChatError) as raised:
+        client.complete(MESSAGES)
+    assert raised.value.status == 401
+    assert len(server.requests) == 1
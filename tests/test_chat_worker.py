@@ -0,0 +1,168 @@
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["DOTMINI_CHAT_CACHE"] = ""
+
+from PyQt6.QtCore import Qt, QThread  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+import main  # noqa: E402
+from chat_client import ChatClient, load_config  # noqa: E402
+from mock_server import MockChatServer  # noqa: E402
+from providers import Router  # noqa: E402
+
+MESSAGES = [{"role": "user", "content": "What is F = ma?"}]
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def server():
+    server = MockChatServer(token_delay=0.01).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    monkeypatch.setenv("DOTMINI_CHAT_CONFIG", "missing.json")
+    config = load_config()
+    config.update(url=server.url, api_key="", retries=0)
+    client = ChatClient(config)
+    yield client
+    client.close()
+
+
+def pump(app, until, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not until() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    assert until(), "timed out"
+
+
+def start(worker, parent):
+    """Run `worker` on a QThread the way main.py does."""
+    thread = QThread(parent)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    thread.start()
+    return thread
+
+
+def test_worker_streams_tokens_off_the_ui_thread(app, server, client):
+    worker = main.ChatWorker(client, MESSAGES, timeout=10)
+    tokens, finished, threads = [], [], set()
+    worker.token.connect(tokens.append)
+    # A direct connection runs in the emitting thread, which must not be this one
+    worker.token.connect(lambda token: threads.add(threading.get_ident()), Qt.ConnectionType.DirectConnection)
+    worker.finished.connect(lambda text, config: finished.append((text, config)))
+    thread = start(worker, app)
+    pump(app, lambda: finished)
+    thread.quit()
+    thread.wait()
+
+    text, config = finished[0]
+    assert text == "".join(tokens)
+    assert text.strip() == server.reply_for(MESSAGES[-1]["content"])
+    assert len(tokens) > 5
+    assert config["url"] == server.url
+    assert threading.get_ident() not in threads
+
+
+def test_worker_cancel_stops_stream(app, server, client):
+    server.token_delay = 0.2
+    worker = main.ChatWorker(client, MESSAGES, timeout=10)
+    tokens, finished, failed = [], [], []
+    worker.token.connect(tokens.append)
+    worker.finished.connect(lambda text, config: finished.append(text))
+    worker.failed.connect(failed.append)
+    thread = start(worker, app)
+    pump(app, lambda: tokens)
+    started = time.monotonic()
+    worker.cancel()
+    pump(app, lambda: finished or failed)
+    thread.quit()
+    thread.wait()
+
+    # Cancelling interrupts the blocked read rather than waiting for the stream to end
+    assert time.monotonic() - started < 1.0
+    assert not failed
+    reply = server.reply_for(MESSAGES[-1]["content"])
+    assert finished[0] == "".join(tokens) and len(finished[0]) < len(reply)
+
+
+def test_worker_reports_errors(app, client, server):
+    server.fail_every, server.fail_status = 1, 401
+    worker = main.ChatWorker(client, MESSAGES, timeout=10)
+    failed = []
+    worker.failed.connect(failed.append)
+    worker.run()
+    assert failed and "401" in failed[0]
+
+
+class Page:
+    def __init__(self, scripts):
+        self.scripts = scripts
+
+    def runJavaScript(self, script, callback=None):
+        self.scripts.append(script)
+
+
+class View:
+    """Stands in for the QWebEngineView, recording the scripts the window runs."""
+
+    def __init__(self):
+        self.scripts = []
+
+    def page(self):
+        return Page(self.scripts)
+
+
+@pytest.fixture
+def window(app, client):
+    window = main.DotminiENGLab()
+    window.chat_client = Router({"mock": client})
+    window.web_view = View()
+    window.chat_loaded = True
+    yield window
+    window.close()
+
+
+def test_window_batches_tokens_into_flushes(app, server, window):
+    server.token_delay = 0.002
+    window.get_ai_response("What is F = ma?")
+    assert window.send_button.text() == "Stop"
+    pump(app, lambda: window.chat_worker is None)
+
+    reply = server.reply_for("What is F = ma?")
+    appends = [script for script in window.web_view.scripts if "chat.append" in script]
+    tokens = len(reply.split(" "))
+    # Tokens arriving within one flush interval share a single script
+    assert 2 <= len(appends) < tokens
+    assert "chat.finish" in window.web_view.scripts[-1]
+    assert window.send_button.text() == "Send"
+    assert window.conversation.turns[-1].assistant.strip() == reply
+    assert window.response_cache.stats()["memory_entries"] == 1
+
+
+def test_window_stop_button_cancels(app, server, window):
+    server.token_delay = 0.2
+    window.get_ai_response("What is F = ma?")
+    pump(app, lambda: window.chat_buffer or len(window.web_view.scripts) > 1)
+    window.send_button.click()
+    pump(app, lambda: window.chat_worker is None, timeout=2.0)
+
+    assert window.send_button.text() == "Send"
+    assert "[stopped]" in window.web_view.scripts[-1]
+    # A cut-off reply is neither remembered nor cached
+    assert window.conversation.turns == []
+    assert window.response_cache.stats()["memory_entries"] == 0
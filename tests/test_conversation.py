@@ -0,0 +1,61 @@
+from conversation import Conversation, estimate_tokens, message_tokens
+from response_cache import ResponseCache
+
+INSTRUCTION = "Format math in LaTeX."
+
+
+def test_messages_stay_within_budget():
+    conversation = Conversation(INSTRUCTION, budget=200)
+    for i in range(30):
+        conversation.messages(f"Question {i} about projectile motion?")
+        conversation.add(f"Question {i} about projectile motion?", "The range is v² sin(2θ)/g. " * 3)
+    messages = conversation.messages("And with drag?")
+    assert message_tokens(messages) <= 200
+    assert messages[0] == {"role": "system", "content": INSTRUCTION}
+    assert messages[1]["content"].startswith("Earlier in this conversation:")
+    assert messages[-1] == {"role": "user", "content": "And with drag?"}
+    assert conversation.stats()["summarized_turns"] > 0
+    assert conversation.stats()["untrimmed_tokens"] > conversation.stats()["prompt_tokens"]
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("F = ma") == 3
+
+
+def test_cache_context_holds_instruction_and_previous_turn_only():
+    a, b = Conversation(INSTRUCTION), Conversation(INSTRUCTION)
+    for conversation in (a, b):
+        conversation.messages("What is force?")
+    assert a.cache_context() == b.cache_context()
+    a.add("What is inertia?", "Resistance to changes in motion.")
+    for conversation in (a, b):
+        conversation.add("What is force?", "F = ma.")
+        conversation.messages("Give an example.")
+    # Different earlier history, same previous turn
+    assert a.cache_context() == b.cache_context()
+    assert "inertia" not in a.cache_context()
+    assert "F = ma." in a.cache_context()
+
+
+def test_follow_up_questions_hit_the_cache():
+    cache = ResponseCache(path=None)
+    first, second = Conversation(INSTRUCTION), Conversation(INSTRUCTION)
+    first.add("Unrelated warm-up?", "Sure.")
+    for question, answer in (("What is force?", "F = ma."), ("Give an example.", "Pushing a cart.")):
+        first.messages(question)
+        cache.put(question, "m", {}, answer, first.cache_context())
+        first.add(question, answer)
+
+    # Asked with no earlier turn, the first question is not the one cached after the warm-up
+    second.messages("What is force?")
+    assert cache.get("What is force?", "m", {}, second.cache_context()) is None
+    second.add("What is force?", "F = ma.")
+    # The follow-up only depends on the exchange just before it
+    second.messages("Give an example.")
+    assert cache.get("Give an example.", "m", {}, second.cache_context()) == "Pushing a cart."
+
+    other = Conversation(INSTRUCTION)
+    other.add("What is momentum?", "p = mv.")
+    other.messages("Give an example.")
+    assert cache.get("Give an example.", "m", {}, other.cache_context()) is None
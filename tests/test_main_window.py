@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["DOTMINI_CHAT_CACHE"] = ""
+
+from PyQt6.QtWidgets import QApplication, QMessageBox  # noqa: E402
+
+import main  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def dialogs(monkeypatch):
+    shown = []
+    for kind in ("information", "warning", "critical"):
+        monkeypatch.setattr(QMessageBox, kind, staticmethod(lambda *args, kind=kind: shown.append((kind, args[1:]))))
+    return shown
+
+
+@pytest.fixture
+def window(app, dialogs):
+    window = main.DotminiENGLab()
+    window.live_check.setChecked(False)
+    yield window
+    window.close()
+
+
+def fill(window, topic, values):
+    window.physics_topic.setCurrentText(topic)
+    for field in window.input_fields:
+        field.setText(values.get(field.objectName(), ""))
+
+
+def test_calculate_formula(window, dialogs):
+    fill(window, "Dynamics", {"mass": "2", "acceleration": "3"})
+    window.calculate_result()
+    assert window.result_label.text() == "Calculated Force: 6.00 N"
+    assert dialogs == []
+
+
+def test_no_finite_result_goes_in_the_label(window, dialogs):
+    fill(window, "Newton's Laws", {"mass": "0", "force": "3"})
+    window.calculate_result()
+    assert "no finite solution" in window.result_label.text()
+    assert dialogs == []
+
+
+def test_invalid_number_warns(window, dialogs):
+    fill(window, "Dynamics", {"mass": "two", "acceleration": "3"})
+    window.calculate_result()
+    assert [kind for kind, _ in dialogs] == ["warning"]
+
+
+def test_calculus_operation_is_a_drop_down(window):
+    from PyQt6.QtWidgets import QComboBox
+
+    import calculus
+
+    window.physics_topic.setCurrentText("Calculus")
+    [operation] = [field for field in window.input_fields if field.objectName() == "operation"]
+    assert isinstance(operation, QComboBox)
+    assert [operation.itemText(i) for i in range(operation.count())] == list(calculus.OPERATIONS)
+    operation.setCurrentText("integral")
+    assert window.field_values()["operation"] == "integral"
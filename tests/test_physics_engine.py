@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+import physics_engine
+
+
+def test_calculate_solves_for_blank_input():
+    result = physics_engine.calculate("force", mass="2", acceleration="", force="10")
+    assert (result.name, result.value, result.unit) == ("acceleration", 5.0, "m/s²")
+    assert physics_engine.calculate("force", mass="500 g", acceleration=4).value == pytest.approx(2.0)
+
+
+def test_calculate_reports_no_finite_solution():
+    with pytest.raises(FloatingPointError, match="no finite solution"):
+        physics_engine.calculate("acceleration", mass=0, force=3)
+
+
+def test_evaluate_keeps_going_past_division_by_zero():
+    result = physics_engine.evaluate("acceleration", mass=np.array([0.0, 2.0]), force=3.0)
+    assert np.isinf(result.value[0]) and result.value[1] == 1.5
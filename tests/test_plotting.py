@@ -0,0 +1,68 @@
+import numpy as np
+
+import plotting
+
+
+def test_minmax_decimate_uses_equal_width_columns():
+    # Dense samples near 0 and sparse ones elsewhere, as adaptive sampling produces
+    x = np.concatenate([np.linspace(-1e-3, 1e-3, 10_000), np.linspace(0.01, 10, 100)])
+    x.sort()
+    y = np.sin(50 * x)
+    xs, ys = plotting.minmax_decimate(x, y, 10, 0.0 - 1e-3, 10.0)
+    # At most a min and a max per column plus the end points
+    assert len(xs) <= 2 * 10 + 2
+    # The dense stretch lies in one column, so it contributes at most two points
+    assert np.count_nonzero(np.abs(xs) <= 1e-3) <= 3
+    assert xs[0] == x[0] and xs[-1] == x[-1]
+
+
+def test_minmax_decimate_keeps_column_extremes():
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0, 1, 50_000))
+    y = rng.normal(size=x.size)
+    y[1234] = 100.0
+    y[40_000] = -100.0
+    xs, ys = plotting.minmax_decimate(x, y, 200)
+    assert 100.0 in ys and -100.0 in ys
+    columns = np.minimum((x * 200).astype(int), 199)
+    for column in (0, 57, 199):
+        inside = columns == column
+        kept = np.isin(xs, x[inside])
+        assert ys[kept].max() == y[inside].max()
+        assert ys[kept].min() == y[inside].min()
+
+
+def test_minmax_decimate_small_input_untouched():
+    x = np.linspace(0, 1, 10)
+    xs, ys = plotting.minmax_decimate(x, x ** 2, 5)
+    assert xs is x
+
+
+def test_minmax_decimate_ignores_nan():
+    x = np.linspace(0, 1, 1000)
+    y = np.where(x < 0.5, np.nan, x)
+    xs, ys = plotting.minmax_decimate(x, y, 10)
+    assert np.nanmax(ys) == 1.0 and np.nanmin(ys) == y[x >= 0.5][0]
+
+
+def test_adaptive_sample_refines_where_curved():
+    x, y = plotting.adaptive_sample(lambda t: np.abs(t - 0.3), 0.0, 1.0, initial=17)
+    np.testing.assert_allclose(y, np.abs(x - 0.3))
+    assert np.all(np.diff(x) > 0)
+    near = np.count_nonzero(np.abs(x - 0.3) < 0.05)
+    far = np.count_nonzero(np.abs(x - 0.8) < 0.05)
+    assert near > far
+
+
+def test_curve_sampler_reuses_cache():
+    sampler = plotting.CurveSampler(np.sin)
+    x, y = sampler.view(0, 10, pixels=100)
+    np.testing.assert_allclose(y, np.sin(x))
+    evaluations = sampler.evaluations
+    # Zooming in on cached samples that still fill the view evaluates nothing
+    sampler.view(2, 8, pixels=20)
+    assert sampler.evaluations == evaluations
+    # Panning outside the cache samples the new range
+    x, y = sampler.view(10, 20, pixels=100)
+    assert sampler.evaluations > evaluations
+    np.testing.assert_allclose(y, np.sin(x))
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import problems
+
+
+def test_plan_names_outputs_after_solved_quantity():
+    outputs, skipped = problems.plan(["force", "kinetic_energy"], ["mass", "acceleration", "velocity"])
+    assert outputs == {"force": "force", "kinetic_energy": "kinetic_energy"}
+    assert skipped == {}
+    # With the force known, "force" solves for the acceleration instead
+    outputs, _ = problems.plan(["force"], ["mass", "force"])
+    assert outputs == {"force": "acceleration"}
+
+
+def test_plan_skips_duplicate_output_columns():
+    outputs, skipped = problems.plan(["acceleration", "force"], ["mass", "force"])
+    assert outputs == {"acceleration": "acceleration"}
+    assert skipped == {"force": "acceleration is computed by acceleration"}
+    outputs, skipped = problems.plan(["force"], ["mass", "acceleration", "force"])
+    assert outputs == {}
+    assert skipped == {"force": "force is an input column"}
+
+
+def test_plan_needs_all_but_one_quantity():
+    with pytest.raises(ValueError):
+        problems.plan(["kinetic_energy"], ["mass"])
+
+
+def test_applicable_prefers_direct_formulas():
+    names = problems.applicable(["mass", "force"])
+    assert names.index("acceleration") < names.index("force")
+
+
+@pytest.mark.parametrize("output", ["out.csv", "out.npy"])
+def test_run_writes_results(tmp_path, output):
+    source_path = tmp_path / "in.csv"
+    mass, acceleration = np.arange(1, 8, dtype=float), np.linspace(0, 3, 7)
+    source_path.write_text("mass, acceleration\n" + "".join(f"{m},{a}\n" for m, a in zip(mass, acceleration)))
+    source = problems.Source(str(source_path))
+    outputs, _ = problems.plan(["force"], source.columns)
+    names = ["mass", "acceleration", "force"]
+    writer = problems.Writer(str(tmp_path / output), names, rows=source.count_rows())
+    try:
+        assert problems.run(source, outputs, writer, chunk_rows=3, workers=0) == 7
+    finally:
+        writer.close()
+    if output.endswith(".npy"):
+        result = np.load(tmp_path / output)
+        force = result["force"]
+    else:
+        result = np.loadtxt(tmp_path / output, delimiter=",", skiprows=1)
+        force = result[:, 2]
+    np.testing.assert_allclose(force, mass * acceleration)
@@ -0,0 +1,163 @@
+import threading
+
+import pytest
+
+import providers
+from chat_client import CancelToken, ChatCancelled, ChatError
+from providers import FakeProvider, Router
+
+MESSAGES = [{"role": "user", "content": "What is F = ma?"}]
+
+
+class Down(FakeProvider):
+    """Fails every request, like an unreachable server."""
+
+    def __init__(self, status=503):
+        super().__init__({"model": "down"})
+        self.status = status
+
+    def _start(self, messages):
+        self.requests += 1
+        raise ChatError(f"Error {self.status}: unreachable", self.status)
+
+
+class Breaks(FakeProvider):
+    """Streams one word and then fails."""
+
+    def stream(self, messages, deadline=None, cancel=None, **params):
+        self.requests += 1
+        yield "Partial "
+        raise ChatError("Error: connection reset", None)
+
+
+def test_router_validates_arguments():
+    with pytest.raises(ValueError):
+        Router({})
+    with pytest.raises(ValueError):
+        Router({"a": FakeProvider()}, routing="random")
+
+
+def test_complete_fails_over_to_backup():
+    primary, backup = Down(), FakeProvider({"model": "backup"})
+    router = Router({"primary": primary, "backup": backup}, routing="failover")
+    reply = router.complete(MESSAGES)
+    assert reply == backup.reply_for(MESSAGES)
+    assert router.last_provider == "backup"
+    assert router.last_config["model"] == "backup"
+    assert (primary.requests, backup.requests, router.failovers) == (1, 1, 1)
+    stats = router.stats()["providers"]
+    assert stats["primary"]["errors"] == 1 and stats["primary"]["cooling_down_s"] > 0
+    assert stats["backup"]["successes"] == 1
+
+
+def test_failed_provider_cools_down_then_is_retried(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(providers.time, "monotonic", lambda: now[0])
+    primary, backup = Down(), FakeProvider()
+    router = Router({"primary": primary, "backup": backup}, routing="failover")
+    router.complete(MESSAGES)
+    assert router.order() == ["backup", "primary"]
+    router.complete(MESSAGES)
+    assert primary.requests == 1  # skipped while cooling down
+    now[0] += providers.COOLDOWN + 0.1
+    assert router.order() == ["primary", "backup"]
+    router.complete(MESSAGES)
+    assert primary.requests == 2
+    # A second consecutive failure doubles the cooldown
+    assert router.health["primary"].cooldown_until == pytest.approx(now[0] + 2 * providers.COOLDOWN)
+
+
+def test_latency_routing_prefers_faster_provider():
+    slow, fast = FakeProvider(latency=0.03), FakeProvider()
+    router = Router({"slow": slow, "fast": fast})
+    for _ in range(5):
+        router.complete(MESSAGES)
+    assert router.last_provider == "fast"
+    # Each provider is measured once, after which the faster one takes the traffic
+    assert slow.requests == 1 and fast.requests == 4
+
+
+def test_latency_routing_probes_stalest_provider():
+    slow, fast = FakeProvider(latency=0.01), FakeProvider()
+    router = Router({"slow": slow, "fast": fast})
+    for _ in range(providers.PROBE_EVERY):
+        router.complete(MESSAGES)
+    assert slow.requests == 2
+
+
+def test_all_providers_fail():
+    router = Router({"a": Down(503), "b": Down(429)}, routing="failover")
+    with pytest.raises(ChatError) as raised:
+        router.complete(MESSAGES)
+    assert str(raised.value) == "a: Error 503: unreachable; b: Error 429: unreachable"
+    assert raised.value.status == 429
+    assert router.last_provider is None
+
+
+def test_stream_fails_over_before_first_token():
+    backup = FakeProvider({"model": "backup"})
+    router = Router({"primary": Down(), "backup": backup}, routing="failover")
+    assert "".join(router.stream(MESSAGES)).strip() == backup.reply_for(MESSAGES)
+    assert router.last_provider == "backup"
+
+
+def test_stream_does_not_fail_over_after_first_token():
+    backup = FakeProvider()
+    router = Router({"primary": Breaks(), "backup": backup}, routing="failover")
+    fragments = []
+    with pytest.raises(ChatError):
+        for fragment in router.stream(MESSAGES):
+            fragments.append(fragment)
+    assert fragments == ["Partial "]
+    assert backup.requests == 0
+    assert router.stats()["providers"]["primary"]["errors"] == 1
+
+
+def test_stream_cancel():
+    router = Router({"fake": FakeProvider()})
+    cancel = CancelToken()
+    fragments = router.stream(MESSAGES, cancel=cancel)
+    next(fragments)
+    cancel.cancel()
+    with pytest.raises(ChatCancelled):
+        list(fragments)
+
+
+def test_last_provider_is_per_thread():
+    router = Router({"primary": Down(), "backup": FakeProvider()}, routing="failover")
+    router.complete(MESSAGES)
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(router.last_provider))
+    thread.start()
+    thread.join()
+    assert router.last_provider == "backup" and seen == [None]
+
+
+def test_fake_provider_fail_every():
+    fake = FakeProvider(fail_every=2)
+    fake.complete(MESSAGES)
+    with pytest.raises(ChatError) as raised:
+        fake.complete(MESSAGES)
+    assert raised.value.status == 503
+
+
+def test_load_router_from_config(monkeypatch):
+    monkeypatch.delenv("DOTMINI_CHAT_PROVIDERS", raising=False)
+    monkeypatch.delenv("DOTMINI_CHAT_ROUTING", raising=False)
+    config = {"model": "base", "params": {}, "timeout": 30.0, "routing": "failover", "providers": [
+        {"kind": "fake", "name": "first", "model": "one", "fail_every": 1},
+        {"kind": "fake", "name": "second", "model": "two"},
+    ]}
+    router = providers.load_router(config)
+    assert router.routing == "failover"
+    assert [c["model"] for c in router.configs] == ["one", "two"]
+    router.complete(MESSAGES)
+    assert router.last_provider == "second"
+
+    monkeypatch.setenv("DOTMINI_CHAT_PROVIDERS", "second")
+    assert list(providers.load_router(config).providers) == ["second"]
+
+
+def test_make_provider_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        providers.make_provider("carrier-pigeon", base={"params": {}})
@@ -0,0 +1,102 @@
+import sqlite3
+
+import pytest
+
+import response_cache
+from response_cache import ResponseCache
+
+MODEL, PARAMS = "typhoon", {"temperature": 0.2}
+
+
+@pytest.fixture
+def memory_cache():
+    return ResponseCache(path=None)
+
+
+def test_trivial_variants_share_a_key(memory_cache):
+    memory_cache.put("What is Newton's second law?", MODEL, PARAMS, "F = ma")
+    assert memory_cache.get("  what is newton’s   SECOND law ", MODEL, PARAMS) == "F = ma"
+
+
+def test_model_params_and_context_separate_answers(memory_cache):
+    memory_cache.put("Define work.", MODEL, PARAMS, "W = Fd", context="Answer briefly.")
+    assert memory_cache.get("Define work.", "other", PARAMS, context="Answer briefly.") is None
+    assert memory_cache.get("Define work.", MODEL, {"temperature": 0.9}, context="Answer briefly.") is None
+    assert memory_cache.get("Define work.", MODEL, PARAMS) is None
+    assert memory_cache.get("Define work.", MODEL, PARAMS, context="Answer briefly.") == "W = Fd"
+
+
+def test_memory_lru_eviction():
+    cache = ResponseCache(path=None, max_memory=2)
+    cache.put("a", MODEL, PARAMS, "1")
+    cache.put("b", MODEL, PARAMS, "2")
+    assert cache.get("a", MODEL, PARAMS) == "1"  # "b" is now least recently used
+    cache.put("c", MODEL, PARAMS, "3")
+    assert cache.get("b", MODEL, PARAMS) is None
+    assert cache.get("a", MODEL, PARAMS) == "1"
+    assert cache.get("c", MODEL, PARAMS) == "3"
+    assert cache.stats()["memory_entries"] == 2
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+    cache = ResponseCache(path=None, ttl=60)
+    cache.put("q", MODEL, PARAMS, "answer")
+    now[0] += 59
+    assert cache.get("q", MODEL, PARAMS) == "answer"
+    now[0] += 2
+    assert cache.get("q", MODEL, PARAMS) is None
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "nested" / "cache.sqlite3")
+    cache = ResponseCache(path=path)
+    cache.put("What is g?", MODEL, PARAMS, "9.81 m/s²")
+    cache.close()
+
+    reopened = ResponseCache(path=path)
+    assert reopened.get("what is g", MODEL, PARAMS) == "9.81 m/s²"
+    stats = reopened.stats()
+    assert stats["disk_hits"] == 1 and stats["memory_entries"] == 1
+    reopened.clear()
+    assert reopened.get("What is g?", MODEL, PARAMS) is None
+    reopened.close()
+
+
+def test_disk_size_cap(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(path=path, max_memory=1, max_disk=3)
+    # The cap is enforced every 64 writes; the 65th triggers it
+    for i in range(65):
+        cache.put(f"question {i}", MODEL, PARAMS, str(i))
+    cache.close()
+    with sqlite3.connect(path) as db:
+        prompts = {row[0] for row in db.execute("SELECT prompt FROM responses")}
+    assert prompts == {"question 62", "question 63", "question 64"}
+
+
+@pytest.mark.parametrize("cached, asked", [
+    ("What is conserved in elastic collisions?", "What is conserved in inelastic collisions?"),
+    ("What's the force on a 2 kg mass accelerating at 3 m/s²?",
+     "What's the force on a 5 kg mass accelerating at 3 m/s²?"),
+    ("What's the force on a 2 kg mass accelerating at 3 m/s²?",
+     "What's the force on a 2 g mass accelerating at 3 m/s²?"),
+    ("Is the speed 2.5 m/s?", "Is the speed 25 m/s?"),
+])
+def test_different_questions_never_share_an_answer(memory_cache, cached, asked):
+    memory_cache.put(cached, MODEL, PARAMS, "cached answer")
+    assert memory_cache.get(asked, MODEL, PARAMS) is None
+
+
+def test_normalize_prompt():
+    assert response_cache.normalize_prompt("  What’s  the range , roughly?? ") == "what's the range, roughly"
+    assert response_cache.normalize_prompt("v = 2.5 m/s.") == "v = 2.5 m/s"
+
+
+def test_hit_rate(memory_cache):
+    memory_cache.put("q", MODEL, PARAMS, "a")
+    memory_cache.get("q", MODEL, PARAMS)
+    memory_cache.get("unrelated question", MODEL, PARAMS)
+    stats = memory_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
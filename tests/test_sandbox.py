@@ -0,0 +1,53 @@
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from sandbox import SandboxMemoryError, SandboxTimeout, SymbolicPool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = SymbolicPool(1, memory_limit=256 * 2 ** 20)
+    yield pool
+    pool.close()
+
+
+def test_jobs_run_in_worker(pool):
+    assert pool.submit("derivative", "x**2 * sin(x)", "x").result() == "x**2*cos(x) + 2*x*sin(x)"
+    np.testing.assert_allclose(pool.submit("evaluate", "x**2", "x", np.arange(3.0)).result(), [0, 1, 4])
+
+
+def test_errors_cross_the_process_boundary(pool):
+    with pytest.raises(ValueError):
+        pool.submit("derivative", "x +* 2", "x").result()
+    with pytest.raises(KeyError):
+        pool.submit("exec", "x")
+
+
+def test_timeout_replaces_worker(pool):
+    with pytest.raises((SandboxTimeout, SandboxMemoryError)):
+        pool.submit("derivative", "9**9**9**9", "x", timeout=1.0).result()
+    assert pool.submit("derivative", "x**3", "x").result() == "3*x**2"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="RLIMIT_AS is only applied on Linux")
+def test_address_space_cap_stops_large_allocations(pool):
+    # Broadcasting two 20000-element columns would allocate 3.2 GB
+    x, y = np.zeros((20000, 1)), np.zeros((1, 20000))
+    started = time.monotonic()
+    with pytest.raises(SandboxMemoryError) as raised:
+        pool.submit("evaluate", "x + y", "x y", x, y).result()
+    # Raised by the failed allocation in the worker, not by the RSS poll killing it
+    assert str(raised.value) == "Expression needs too much memory"
+    assert time.monotonic() - started < 5
+    assert pool.stats()["memory_kills"] >= 1
+    assert pool.submit("derivative", "x**3", "x").result() == "3*x**2"
+
+
+def test_closed_pool_rejects_jobs():
+    pool = SymbolicPool(1)
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.submit("derivative", "x", "x")
@@ -0,0 +1,197 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+import providers
+from providers import FakeProvider, Router
+from server import MAX_TRAJECTORIES, ComputeService, HTTPError, to_json
+
+
+@pytest.fixture(scope="module")
+def service():
+    service = ComputeService(workers=1)
+    yield service
+    service.close()
+
+
+def call(service, method, path, body=None):
+    raw = json.dumps(body).encode("utf-8") if body is not None else b""
+    return asyncio.run(service.dispatch(method, path, raw))
+
+
+def error(service, method, path, body=None):
+    with pytest.raises(HTTPError) as raised:
+        call(service, method, path, body)
+    return raised.value.status, str(raised.value)
+
+
+def exchange(service, request):
+    """Send raw bytes to `handle_connection` over a real socket; return (status, headers, JSON body)."""
+    async def run():
+        server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+
+    head, _, body = asyncio.run(run()).partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:])
+    return int(lines[0].split()[1]), headers, json.loads(body)
+
+
+def test_health_and_formulas(service):
+    assert call(service, "GET", "/health") == {"status": "ok"}
+    formulas = call(service, "GET", "/formulas")
+    assert formulas["force"]["inputs"] == {"mass": "kg", "acceleration": "m/s²"}
+
+
+def test_calculate_is_vectorized(service):
+    result = call(service, "POST", "/calculate", {"formula": "force", "inputs": {"mass": [1, 2], "acceleration": 9.81}})
+    assert list(result["value"]) == pytest.approx([9.81, 19.62])
+    assert result["unit"] == "N"
+
+
+def test_calculate_errors(service):
+    assert error(service, "POST", "/calculate", {"formula": "warp", "inputs": {}})[0] == 400
+    assert error(service, "POST", "/calculate", {"inputs": {}})[0] == 400
+
+
+def test_routing_errors(service):
+    assert error(service, "GET", "/nowhere")[0] == 404
+    assert error(service, "GET", "/calculate")[0] == 405
+    assert error(service, "POST", "/calculate")[0] == 400
+    with pytest.raises(HTTPError) as raised:
+        asyncio.run(service.dispatch("POST", "/calculate", b"{not json"))
+    assert raised.value.status == 400
+
+
+def test_projectile(service):
+    result = call(service, "POST", "/projectile", {"speed": [10, 20], "angle": 45, "method": "rk4"})
+    assert result["range"] == pytest.approx([100 / 9.81, 400 / 9.81], rel=1e-9)
+    assert "x" not in result
+    assert not result["truncated"].any()
+    path = call(service, "POST", "/projectile", {"speed": 10, "angle": 45, "path": True})
+    assert path["x"].shape[0] == 1
+    assert path["truncated"] == False  # noqa: E712
+
+
+def test_projectile_flags_truncated_launches(service):
+    # Fired down faster than terminal velocity, drag makes the fall far slower than the
+    # drag-free estimate, and recording 2000 paths leaves each only 500 steps
+    result = call(service, "POST", "/projectile", {"speed": 200, "angle": -90, "height": [100] * 2000,
+                                                   "drag": 0.1, "path": True})
+    assert result["truncated"].all()
+    assert np.isnan(result["range"]).all()
+
+
+@pytest.mark.parametrize("body", [
+    {"speed": 10, "angle": 45, "dt": 0},
+    {"speed": 10, "angle": 45, "dt": -0.1},
+    {"speed": [10] * (MAX_TRAJECTORIES + 1), "angle": 45},
+    {"speed": 10, "angle": 45, "method": "euler"},
+    {"angle": 45},
+    {"speed": [], "angle": 45},
+    {"speed": [], "angle": []},
+    {"speed": 20, "angle": 45, "dt": 1e-6},
+    {"speed": 20, "angle": 45, "path": True, "height": [0] * 5000},
+])
+def test_projectile_rejects_bad_requests(service, body):
+    status, message = error(service, "POST", "/projectile", body)
+    assert status == 400
+    assert "division" not in message
+
+
+def test_derivative(service):
+    assert call(service, "POST", "/derivative", {"expression": "x**3"}) == {"derivative": "3*x**2"}
+    assert call(service, "POST", "/derivative", {"expression": "sin(t)", "variable": "t", "order": 2}) == {
+        "derivative": "-sin(t)"}
+    assert error(service, "POST", "/derivative", {})[0] == 400
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/derivative", {"expression": "__import__('os').system('touch {marker}')"}),
+    ("/derivative", {"expression": """sin("_" "_import_" "_('os')" "." "system('touch {marker}')")"""}),
+    ("/calculus", {"operation": "integral", "expression": """exp("_" "_import_" "_('os')" "." "system('touch {marker}')")"""}),
+    ("/derivative", {"expression": "x", "variable": "__class__"}),
+])
+def test_symbolic_routes_reject_code(service, tmp_path, path, body):
+    marker = tmp_path / "owned"
+    body = {key: value.format(marker=marker) for key, value in body.items()}
+    status, message = error(service, "POST", path, body)
+    assert status == 400
+    assert "Unsupported syntax" in message or "not a valid variable name" in message
+    assert not marker.exists()
+
+
+def test_calculus(service):
+    result = call(service, "POST", "/calculus", {"operation": "integral", "expression": "x**2",
+                                                 "lower": 0, "upper": 3})
+    assert float(result["value"]) == pytest.approx(9.0)
+    batch = call(service, "POST", "/calculus", {"operation": "integral", "expression": "exp(-x**2)*cos(x)",
+                                                "method": "numeric", "lower": 0, "upper": [1, 2]})
+    assert len(batch["value"]) == 2
+    assert error(service, "POST", "/calculus", {"expression": "x"})[0] == 400
+
+
+def test_chat(service, monkeypatch):
+    fake = FakeProvider()
+    monkeypatch.setattr(providers, "_router", Router({"fake": fake}))
+    message = [{"role": "user", "content": "hi"}]
+    assert call(service, "POST", "/chat", {"message": "hi"}) == {"response": fake.reply_for(message)}
+    assert call(service, "GET", "/chat/providers")["providers"]["fake"]["successes"] == 1
+    assert error(service, "POST", "/chat", {})[0] == 400
+
+
+class Down(FakeProvider):
+    def _start(self, messages):
+        raise providers.ChatError("Error 503: down", 503)
+
+
+def test_chat_upstream_failure(service, monkeypatch):
+    monkeypatch.setattr(providers, "_router", Router({"down": Down()}))
+    status, message = error(service, "POST", "/chat", {"message": "hi"})
+    assert status == 502 and "down" in message
+
+
+def test_keep_alive_over_socket(service):
+    body = b'{"formula": "force", "inputs": {"mass": 2, "acceleration": 3}}'
+    request = (b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+               b"POST /calculate?x=1 HTTP/1.1\r\nContent-Length: %d\r\nConnection: close\r\n\r\n%s"
+               % (len(body), body))
+
+    async def run():
+        server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(request)
+            data = await reader.read()
+            writer.close()
+            return data
+
+    data = asyncio.run(run())
+    assert data.count(b"HTTP/1.1 200 OK") == 2
+    assert data.endswith(b'"unit": "N"}')
+
+
+@pytest.mark.parametrize("length", [b"-1", b"abc", b"1e3", "²".encode("utf-8"), "١٢".encode("utf-8")])
+def test_invalid_content_length(service, length):
+    status, headers, body = exchange(service, b"POST /calculate HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n{}")
+    assert status == 400 and body == {"error": "Invalid Content-Length"}
+    assert headers["Connection"] == "close"
+
+
+def test_body_too_large(service):
+    status, _, _ = exchange(service, b"POST /calculate HTTP/1.1\r\nContent-Length: 999999999\r\n\r\n")
+    assert status == 413
+
+
+def test_to_json():
+    values = {"a": np.array([1.0, np.inf, np.nan]), "b": np.float64(2.5), "c": np.int64(3), "d": (np.array(4.0),)}
+    assert to_json(values) == {"a": [1.0, None, None], "b": 2.5, "c": 3, "d": [4.0]}
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import symbolic
+
+# Adjacent string literals once slipped past a regex check, and sin() then
+# sympified (evaluated) the joined string
+STRING_PAYLOAD = """sin("_" "_import_" "_('os')" "." "system('touch {path}')")"""
+
+
+@pytest.mark.parametrize("text", [
+    "__import__('os').system('echo owned')",
+    STRING_PAYLOAD.format(path="/dev/null"),
+    "Max('x')",
+    "x.__class__",
+    "(1).real",
+    "lambda: 1",
+    "x if 1 else 2",
+    "x[0]",
+    "x +* 2",
+])
+def test_parse_rejects_code_and_bad_syntax(text):
+    with pytest.raises(ValueError):
+        symbolic.parse(text)
+
+
+def test_string_payload_does_not_run(tmp_path):
+    marker = tmp_path / "owned"
+    with pytest.raises(ValueError):
+        symbolic.derivative(STRING_PAYLOAD.format(path=marker), "x")
+    assert not marker.exists()
+
+
+def test_unknown_names_stay_symbolic():
+    # Builtins are not reachable; a called name becomes an undefined function
+    expression = symbolic.parse("open(x) + eval(y)")
+    assert {str(f.func) for f in expression.atoms(symbolic.sp.Function)} == {"open", "eval"}
+
+
+def test_variable_names_must_be_identifiers():
+    with pytest.raises(ValueError):
+        symbolic.canonical_variables("__class__")
+    with pytest.raises(ValueError):
+        symbolic.canonical_variables("x.real")
+
+
+def test_parse_accepts_math():
+    assert symbolic.parse("x! + Piecewise((x, x < 0), (1, True))") == (
+        symbolic.sp.factorial(symbolic.sp.Symbol("x"))
+        + symbolic.sp.Piecewise((symbolic.sp.Symbol("x"), symbolic.sp.Symbol("x") < 0), (1, True)))
+
+    assert str(symbolic.parse("x^2 + 1.5*sin(x)")) == "x**2 + 1.5*sin(x)"
+    assert str(symbolic.derivative("x**2 * sin(x)", "x")) == "x**2*cos(x) + 2*x*sin(x)"
+    assert str(symbolic.derivative("x*y**2", "x, y")) == "2*y"
+
+
+def test_evaluate_is_vectorized():
+    x = np.linspace(0, 1, 5)
+    np.testing.assert_allclose(symbolic.evaluate("exp(x) * cos(y)", "x y", x, 0.0), np.exp(x))
+    np.testing.assert_allclose(symbolic.evaluate("x**3", "x", x, order=1), 3 * x ** 2)
+
+
+def test_closed_forms():
+    assert symbolic.integral("x**2", "x", "0", "3") == 9
+    assert symbolic.limit("sin(x)/x", "x", "0") == 1
+    assert str(symbolic.series("exp(x)", "x", "0", 3)) == "x**2/2 + x + 1"
+    roots = symbolic.roots("x**2 - 2", "x", "-10", "10")
+    np.testing.assert_allclose([float(root) for root in roots], [-2 ** 0.5, 2 ** 0.5])
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+import trajectory
+
+ANGLES = [15.0, 30.0, 45.0, 60.0, 80.0]
+SPEEDS = [5.0, 20.0, 50.0]
+
+
+@pytest.mark.parametrize("method, options, rtol", [
+    ("rk4", {"dt": 0.01}, 1e-9),
+    ("verlet", {"dt": 0.01}, 1e-9),
+    ("adaptive", {"rtol": 1e-9, "atol": 1e-12}, 1e-7),
+])
+@pytest.mark.parametrize("height", [0.0, 12.5])
+def test_drag_free_matches_analytic(method, options, rtol, height):
+    angles, speeds = np.meshgrid(ANGLES, SPEEDS, indexing="ij")
+    result = trajectory.simulate(speeds, angles, height=height, method=method, **options)
+    expected = trajectory.analytic(speeds, angles, height=height)
+    assert result.range.shape == angles.shape
+    np.testing.assert_allclose(result.range, expected.range, rtol=rtol)
+    np.testing.assert_allclose(result.apex, expected.apex, rtol=rtol)
+    np.testing.assert_allclose(result.flight_time, expected.flight_time, rtol=rtol)
+
+
+def test_scalar_inputs_give_scalar_summary():
+    result = trajectory.simulate(speed=20.0, angle=45.0)
+    assert np.ndim(result.range) == 0
+    assert float(result.range) == pytest.approx(20.0 ** 2 / trajectory.GRAVITY, rel=1e-9)
+
+
+def test_recorded_paths_start_at_launch_and_end_on_ground():
+    result = trajectory.simulate([10.0, 30.0], 60.0, height=2.0, dt=0.05)
+    assert result.t.shape == result.x.shape == result.y.shape
+    assert result.t.shape[1] == 2
+    np.testing.assert_array_equal(result.y[0], [2.0, 2.0])
+    for column in range(2):
+        y = result.y[:, column][~np.isnan(result.y[:, column])]
+        x = result.x[:, column][~np.isnan(result.x[:, column])]
+        assert y[-1] == 0.0
+        assert x[-1] == pytest.approx(result.range[column])
+        assert np.all(y >= 0)
+
+
+def test_drag_shortens_range_and_integrators_agree():
+    free = trajectory.analytic(40.0, 45.0)
+    rk4 = trajectory.simulate(40.0, 45.0, drag=0.01, method="rk4", dt=0.001)
+    adaptive = trajectory.simulate(40.0, 45.0, drag=0.01, method="adaptive", rtol=1e-10, atol=1e-12)
+    assert rk4.range < free.range
+    assert rk4.apex < free.apex
+    assert adaptive.range == pytest.approx(rk4.range, rel=1e-8)
+    assert adaptive.flight_time == pytest.approx(rk4.flight_time, rel=1e-8)
+
+
+def test_launch_on_ground_pointing_down_lands_immediately():
+    result = trajectory.simulate(10.0, -30.0, record=False)
+    assert result.range == 0.0
+    assert result.flight_time == 0.0
+
+
+def test_sweep_shape():
+    result = trajectory.sweep(ANGLES, SPEEDS)
+    assert result.range.shape == (len(ANGLES), len(SPEEDS))
+    assert result.t is None
+    expected = trajectory.analytic(np.array(SPEEDS)[None, :], np.array(ANGLES)[:, None])
+    np.testing.assert_allclose(result.range, expected.range, rtol=1e-5)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        trajectory.simulate(10.0, 45.0, method="euler")
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import units
+from units import Quantity, UnitError
+
+
+def test_conversions():
+    np.testing.assert_allclose(Quantity([36, 72], "km/h").to("m/s"), [10.0, 20.0])
+    assert Quantity(1, "mi").to("km") == pytest.approx(1.609344)
+    assert Quantity(1, "kWh").to("J") == pytest.approx(3.6e6)
+    assert Quantity(1, "lbf").to("N") == pytest.approx(4.4482216152605)
+    assert Quantity(180, "deg").to("rad") == pytest.approx(np.pi)
+
+
+def test_unit_syntax():
+    assert units.parse_unit("kg*m/s^2") == units.parse_unit("N")
+    assert units.parse_unit("m/s²").dimension == units.parse_unit("m/s/s").dimension
+    assert units.parse_unit("kg·m**2/s**2").dimension == units.parse_unit("J").dimension
+    with pytest.raises(UnitError):
+        units.parse_unit("furlong")
+
+
+def test_arithmetic_tracks_dimensions():
+    force = Quantity(2, "kg") * Quantity(3, "m/s^2")
+    assert force.to("N") == pytest.approx(6.0)
+    energy = force * Quantity(50, "cm")
+    assert energy.to("J") == pytest.approx(3.0)
+    speed = Quantity(100, "m") / Quantity(10, "s")
+    assert speed.to("km/h") == pytest.approx(36.0)
+    assert (Quantity(3, "m") ** 2).to("cm^2") == pytest.approx(90000.0)
+    assert (Quantity(1, "m") + Quantity(20, "cm")).to("m") == pytest.approx(1.2)
+    assert (Quantity(1, "m") - Quantity(20, "cm")).to("mm") == pytest.approx(800.0)
+    assert (2 * Quantity(1, "s")).to("ms") == pytest.approx(2000.0)
+    assert (1 / Quantity(4, "s")).to("1/s") == pytest.approx(0.25)
+
+
+def test_dimension_mismatch():
+    with pytest.raises(UnitError):
+        Quantity(1, "m") + Quantity(1, "s")
+    with pytest.raises(UnitError):
+        Quantity(1, "kg").to("N")
+    with pytest.raises(UnitError):
+        Quantity(1, "m") - 1
+    # UnitError is a ValueError, which the engine and server already report
+    assert issubclass(UnitError, ValueError)
+
+
+def test_to_value():
+    assert units.to_value("500 g", "kg") == 0.5
+    assert units.to_value("36 km/h", "m/s") == pytest.approx(10.0)
+    assert units.to_value("7", "m") == 7.0
+    assert units.to_value(3.0, "m") == 3.0
+    assert units.to_value(Quantity(2, "min"), "s") == pytest.approx(120.0)
+    with pytest.raises(UnitError):
+        units.to_value("5 s", "m")
+    with pytest.raises(ValueError):
+        units.parse_quantity("fast")
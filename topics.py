@@ -0,0 +1,55 @@
+"""Topics offered by the GUIs and the input form each one needs.
+
+A formula topic drives one `physics_engine` formula: its form has a field
+for every quantity of the formula, inputs and output alike, and whichever
+single field is left blank is solved for.  `plot` names the quantity swept
+along the x axis of its graph.  Tool topics (projectile simulation,
+calculus) list their fields explicitly and are handled by the GUI.  A
+field with `choices` is a drop-down of those values rather than free text.
+
+Adding a formula topic is one `Topic` line here.  This module stays free
+of NumPy so building the topic menu doesn't slow startup.
+"""
+from collections import namedtuple
+
+Field = namedtuple("Field", "name label default choices", defaults=(None,))
+Topic = namedtuple("Topic", "name formula plot fields")
+
+TOPICS = {
+    topic.name: topic for topic in [
+        Topic("Dynamics", "force", "acceleration", None),
+        Topic("Newton's Laws", "acceleration", "force", None),
+        Topic("Work & Energy", "work_energy_total", "work", None),
+        Topic("Kinetic Energy", "kinetic_energy", "velocity", None),
+        Topic("Work Done", "work", "displacement", None),
+        Topic("Kinematics", "average_acceleration", "t", None),
+        Topic("Projectile Motion", None, None, [
+            Field("speed", "Launch Speed (m/s)", ""),
+            Field("angle", "Launch Angle (°)", ""),
+            Field("height", "Launch Height (m)", "0"),
+            Field("drag", "Drag Coefficient k (1/m)", "0"),
+        ]),
+        Topic("Calculus", None, None, [
+            Field("function", "Function (e.g., x^2 + 2*x + 1)", ""),
+            Field("variable", "Variable (e.g., x)", "x"),
+            # The keys of calculus.OPERATIONS, which imports NumPy
+            Field("operation", "Operation", "derivative", ("derivative", "integral", "limit", "series", "roots")),
+            Field("lower", "From / at (e.g., 0, -oo, 0+; commas for several)", ""),
+            Field("upper", "To (e.g., pi, oo; commas for several)", ""),
+            Field("order", "Order (derivative, series)", ""),
+        ]),
+    ]
+}
+
+
+def form_fields(topic):
+    """The input fields for `topic`, generated from its formula when it has one."""
+    if topic.fields is not None:
+        return topic.fields
+    import physics_engine
+
+    formula = physics_engine.get_formula(topic.formula)
+    return [
+        Field(quantity, f"{physics_engine.QUANTITIES[quantity]} ({unit})", "")
+        for quantity, unit in physics_engine.units(formula).items()
+    ]
@@ -0,0 +1,170 @@
+"""Tracing spans, latency histograms and Chrome-trace export.
+
+    with tracing.span("calculate", topic="Dynamics"):
+        ...
+
+Spans that start and end in different callbacks (a streamed chat reply)
+use `begin`/`end`.  Tracing is off unless `DOTMINI_TRACE=1` is set or
+`enable()` is called; while off, `span` returns a shared no-op context
+manager and `begin` returns None, so instrumented hot paths pay one
+global lookup.  `export` writes a file that chrome://tracing and Perfetto
+open directly, with the histograms under "otherData".
+"""
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+
+# Completed spans kept for export; the oldest are dropped first
+MAX_EVENTS = 100_000
+# Latest durations per span name used for percentiles
+RECENT = 256
+
+enabled = os.environ.get("DOTMINI_TRACE", "") not in ("", "0")
+
+_events = deque(maxlen=MAX_EVENTS)
+_histograms = {}
+_threads = {}
+_lock = threading.Lock()
+_origin = time.perf_counter_ns()
+
+
+class Histogram:
+    """Counts of durations in power-of-two microsecond buckets, plus the most recent samples."""
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent = deque(maxlen=RECENT)
+
+    def add(self, ms):
+        bucket = max(0, math.frexp(ms * 1000)[1])
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.recent.append(ms)
+
+    def percentile(self, fraction):
+        recent = sorted(self.recent)
+        if not recent:
+            return float("nan")
+        return recent[min(len(recent) - 1, int(fraction * len(recent)))]
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "last_ms": self.recent[-1] if self.recent else float("nan"),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms,
+            # Upper bound of each bucket in microseconds -> count
+            "buckets_us": {str(2 ** bucket): n for bucket, n in sorted(self.buckets.items())},
+        }
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        _record(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+
+def span(name, **args):
+    """Context manager timing the enclosed block as span `name`."""
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def begin(name, **args):
+    """Start a span that `end` will finish, possibly from another callback or thread."""
+    if not enabled:
+        return None
+    return name, time.perf_counter_ns(), args
+
+
+def end(token, **args):
+    if token is None:
+        return
+    name, start, begin_args = token
+    _record(name, start, time.perf_counter_ns(), dict(begin_args, **args))
+
+
+def _record(name, start, stop, args):
+    thread = threading.get_ident()
+    _events.append((name, start, stop - start, thread, args))
+    with _lock:
+        if thread not in _threads:
+            _threads[thread] = threading.current_thread().name
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.add((stop - start) / 1e6)
+
+
+def enable(on=True):
+    global enabled
+    enabled = on
+
+
+def stats():
+    """Histogram summary per span name."""
+    with _lock:
+        return {name: histogram.summary() for name, histogram in sorted(_histograms.items())}
+
+
+def clear():
+    with _lock:
+        _events.clear()
+        _histograms.clear()
+
+
+def chrome_trace():
+    """The recorded spans as a Chrome trace-event document."""
+    pid = os.getpid()
+    events = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread, "args": {"name": name}}
+        for thread, name in list(_threads.items())
+    ]
+    events += [
+        {"name": name, "ph": "X", "ts": (start - _origin) / 1000, "dur": duration / 1000,
+         "pid": pid, "tid": thread, "args": args}
+        for name, start, duration, thread, args in list(_events)
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"histograms": stats()}}
+
+
+def export(path):
+    """Write `chrome_trace()` to `path` as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(chrome_trace(), f, default=str)
@@ -0,0 +1,262 @@
+"""Lightweight units and dimensional analysis for the physics engine.
+
+A `Quantity` holds a value (scalar or NumPy array) in SI base units plus a
+dimension vector.  Converting a whole array is one multiplication and
+checking it is one tuple comparison, so unit-aware batch sweeps cost about
+the same as raw NumPy:
+
+    >>> speed = Quantity([36, 72], "km/h")
+    >>> speed.to("m/s")
+    array([10., 20.])
+    >>> to_value("500 g", "kg")
+    0.5
+
+Unit strings combine the names in `UNITS` with `*`, `·`, `/`, spaces and
+exponents (`^2`, `**2`, `²`), e.g. "kg*m/s^2" or "m/s²".
+"""
+import argparse
+import math
+import re
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+# Exponents of (mass, length, time, current, temperature, amount, luminosity)
+BASE = ("kg", "m", "s", "A", "K", "mol", "cd")
+DIMENSIONLESS = (0,) * len(BASE)
+
+Unit = namedtuple("Unit", "scale dimension")
+
+
+class UnitError(ValueError):
+    """Raised for unknown units and for dimension mismatches."""
+
+
+def _dimension(**exponents):
+    return tuple(exponents.get(name, 0) for name in BASE)
+
+
+_MASS = _dimension(kg=1)
+_LENGTH = _dimension(m=1)
+_TIME = _dimension(s=1)
+_SPEED = _dimension(m=1, s=-1)
+_ACCELERATION = _dimension(m=1, s=-2)
+_FORCE = _dimension(kg=1, m=1, s=-2)
+_ENERGY = _dimension(kg=1, m=2, s=-2)
+_POWER = _dimension(kg=1, m=2, s=-3)
+
+# name -> (factor to SI, dimension)
+UNITS = {
+    "": (1.0, DIMENSIONLESS),
+    "1": (1.0, DIMENSIONLESS),
+    "rad": (1.0, DIMENSIONLESS),
+    "deg": (math.pi / 180, DIMENSIONLESS),
+    "°": (math.pi / 180, DIMENSIONLESS),
+    "kg": (1.0, _MASS),
+    "g": (1e-3, _MASS),
+    "mg": (1e-6, _MASS),
+    "t": (1e3, _MASS),
+    "lb": (0.45359237, _MASS),
+    "m": (1.0, _LENGTH),
+    "km": (1e3, _LENGTH),
+    "cm": (1e-2, _LENGTH),
+    "mm": (1e-3, _LENGTH),
+    "in": (0.0254, _LENGTH),
+    "ft": (0.3048, _LENGTH),
+    "mi": (1609.344, _LENGTH),
+    "s": (1.0, _TIME),
+    "ms": (1e-3, _TIME),
+    "min": (60.0, _TIME),
+    "h": (3600.0, _TIME),
+    "kph": (1 / 3.6, _SPEED),
+    "mph": (0.44704, _SPEED),
+    "N": (1.0, _FORCE),
+    "kN": (1e3, _FORCE),
+    "dyn": (1e-5, _FORCE),
+    "lbf": (4.4482216152605, _FORCE),
+    "J": (1.0, _ENERGY),
+    "kJ": (1e3, _ENERGY),
+    "MJ": (1e6, _ENERGY),
+    "cal": (4.184, _ENERGY),
+    "kcal": (4184.0, _ENERGY),
+    "eV": (1.602176634e-19, _ENERGY),
+    "Wh": (3600.0, _ENERGY),
+    "kWh": (3.6e6, _ENERGY),
+    "W": (1.0, _POWER),
+    "kW": (1e3, _POWER),
+    "A": (1.0, _dimension(A=1)),
+    "K": (1.0, _dimension(K=1)),
+    "mol": (1.0, _dimension(mol=1)),
+    "cd": (1.0, _dimension(cd=1)),
+}
+
+_SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻", "0123456789-")
+_FACTOR = re.compile(r"([A-Za-z°]+|1)(?:\s*(?:\^|\*\*)\s*([-+]?\d+)|([⁻]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+))?")
+_NUMBER = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*$")
+
+
+@lru_cache(maxsize=256)
+def parse_unit(text):
+    """Return the `Unit` for a unit string such as "km/h", "kg*m/s^2" or "m/s²"."""
+    scale, dimension = 1.0, DIMENSIONLESS
+    rest = text.strip()
+    sign = 1
+    while rest:
+        match = _FACTOR.match(rest)
+        if match is None or match.group(1) not in UNITS:
+            raise UnitError(f"Unknown unit {text!r}")
+        exponent = int(match.group(2) or (match.group(3) or "1").translate(_SUPERSCRIPTS)) * sign
+        factor, factor_dimension = UNITS[match.group(1)]
+        scale *= factor ** exponent
+        dimension = tuple(d + exponent * f for d, f in zip(dimension, factor_dimension))
+        rest = rest[match.end():].lstrip()
+        # A "/" divides by the factor after it only, so "m/s/s" is m·s⁻²
+        sign = 1
+        if rest[:1] == "/":
+            sign = -1
+        if rest[:1] in ("/", "*", "·"):
+            rest = rest[1:].lstrip()
+    return Unit(scale, dimension)
+
+
+def format_dimension(dimension):
+    parts = [name if power == 1 else f"{name}^{power}" for name, power in zip(BASE, dimension) if power]
+    return "*".join(parts) or "dimensionless"
+
+
+def _check(expected, actual, action):
+    if expected != actual:
+        raise UnitError(f"Cannot {action} {format_dimension(actual)} and {format_dimension(expected)}")
+
+
+class Quantity:
+    """A scalar or NumPy array with a physical dimension, stored in SI base units."""
+
+    __slots__ = ("value", "dimension")
+
+    def __init__(self, value, unit=""):
+        scale, self.dimension = parse_unit(unit) if isinstance(unit, str) else unit
+        value = np.asarray(value, dtype=float)
+        self.value = value * scale if scale != 1.0 else value
+
+    @classmethod
+    def _si(cls, value, dimension):
+        quantity = cls.__new__(cls)
+        quantity.value = value
+        quantity.dimension = dimension
+        return quantity
+
+    def to(self, unit):
+        """The value expressed in `unit`; raises UnitError if the dimensions differ."""
+        scale, dimension = parse_unit(unit)
+        _check(dimension, self.dimension, "convert between")
+        return self.value / scale if scale != 1.0 else self.value
+
+    def __add__(self, other):
+        other = as_quantity(other)
+        _check(self.dimension, other.dimension, "add")
+        return Quantity._si(self.value + other.value, self.dimension)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = as_quantity(other)
+        _check(self.dimension, other.dimension, "subtract")
+        return Quantity._si(self.value - other.value, self.dimension)
+
+    def __rsub__(self, other):
+        return as_quantity(other) - self
+
+    def __mul__(self, other):
+        other = as_quantity(other)
+        dimension = tuple(a + b for a, b in zip(self.dimension, other.dimension))
+        return Quantity._si(self.value * other.value, dimension)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = as_quantity(other)
+        dimension = tuple(a - b for a, b in zip(self.dimension, other.dimension))
+        return Quantity._si(self.value / other.value, dimension)
+
+    def __rtruediv__(self, other):
+        return as_quantity(other) / self
+
+    def __pow__(self, exponent):
+        return Quantity._si(self.value ** exponent, tuple(d * exponent for d in self.dimension))
+
+    def __neg__(self):
+        return Quantity._si(-self.value, self.dimension)
+
+    def __repr__(self):
+        return f"Quantity({self.value!r}, SI {format_dimension(self.dimension)})"
+
+
+def as_quantity(value):
+    """Wrap plain numbers and arrays as dimensionless quantities."""
+    return value if isinstance(value, Quantity) else Quantity._si(np.asarray(value, dtype=float), DIMENSIONLESS)
+
+
+def parse_quantity(text, default_unit=""):
+    """Parse "500 g" or "36 km/h"; a bare number is taken to be in `default_unit`."""
+    match = _NUMBER.match(text)
+    if match is None:
+        raise ValueError(f"{text!r} is not a number")
+    return Quantity(float(match.group(1)), match.group(2) or default_unit)
+
+
+def to_value(value, unit):
+    """Convert a `Quantity`, a string like "500 g" or a plain number/array to a value in `unit`.
+
+    Plain numbers and unit-less strings are assumed to already be in `unit`.
+    """
+    if isinstance(value, Quantity):
+        return value.to(unit)
+    if isinstance(value, str):
+        return float(parse_quantity(value, unit).to(unit))
+    return value
+
+
+def benchmark(n=1_000_000, repeat=5):
+    """Time kinetic energy over `n` elements with raw NumPy and through `Quantity`.
+
+    Returns the best time of each path in seconds and their ratio.
+    """
+    rng = np.random.default_rng(0)
+    grams, kph = rng.uniform(1, 1e4, n), rng.uniform(0, 200, n)
+
+    def raw():
+        mass, speed = grams * 1e-3, kph / 3.6
+        return 0.5 * mass * speed ** 2
+
+    def unit_aware():
+        mass, speed = Quantity(grams, "g"), Quantity(kph, "km/h")
+        return (0.5 * mass * speed ** 2).to("J")
+
+    assert np.allclose(raw(), unit_aware())
+    timings = {}
+    for name, function in (("numpy", raw), ("units", unit_aware)):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - started)
+        timings[name] = best
+    timings["ratio"] = timings["units"] / timings["numpy"]
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare unit-aware and raw NumPy kinetic energy")
+    parser.add_argument("-n", type=int, default=1_000_000, help="array length")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    timings = benchmark(args.n, args.repeat)
+    print(f"numpy: {timings['numpy'] * 1000:.2f} ms, units: {timings['units'] * 1000:.2f} ms, "
+          f"ratio {timings['ratio']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()